@@ -11,6 +11,7 @@ from .candidates.routes import candidates_bp
 from .config.routes import config_bp
 from .ranking.routes import ranking_bp
 from .system.routes import system_bp
+from .enrichment.routes import enrichment_bp
 
 def create_app():
     app = Flask(__name__)
@@ -23,6 +24,7 @@ def create_app():
     app.register_blueprint(config_bp, url_prefix="/api")
     app.register_blueprint(ranking_bp, url_prefix="/api")
     app.register_blueprint(system_bp, url_prefix="/api")
+    app.register_blueprint(enrichment_bp, url_prefix="/api")
 
     @app.errorhandler(Exception)
     def handle_exception(e):
@@ -0,0 +1,121 @@
+from flask import Blueprint, jsonify, request
+from core.supabase import supabase
+from core.parsers.registry import datasource_registry
+from core.parsers.linkedin import LINKEDIN_BATCH_SIZE
+from core.service.enrichment_queue import enrichment_queue
+from core.utils.cache import get_cached_data, save_to_cache
+from ..candidates.routes import _upsert_github_profile, _upsert_linkedin_profile
+
+enrichment_bp = Blueprint("enrichment", __name__)
+
+# how each source's scan is saved: the candidate_data column and the upsert helper
+PROFILE_SAVERS = {
+    "github": ("github_profile_id", lambda data, url: _upsert_github_profile(data)),
+    "linkedin": ("linkedin_profile_id", _upsert_linkedin_profile),
+}
+
+def _save_profile(task, data):
+    source_type, url = task["source"], task["url"]
+    field, save = PROFILE_SAVERS[source_type]
+    profile_id = save(data, url)
+    if not profile_id:
+        raise ValueError(f"could not save {source_type} profile for {url}")
+    supabase.table("candidate_data").update({field: profile_id}).eq("id", task["candidate_id"]).execute()
+
+def _enrich_task(task):
+    """one (candidate, source) scan, same as /scan-datasource followed by saving the profile"""
+    source_type, url = task["source"], task["url"]
+    cache_enabled = task["options"].get("cache_data", False)
+
+    data = get_cached_data(source_type, url) if cache_enabled else None
+    if not data:
+        data = datasource_registry.get_source(source_type).process(url)
+        if cache_enabled:
+            save_to_cache(source_type, url, data)
+    _save_profile(task, data)
+
+def _enrich_linkedin_batch(tasks):
+    """linkedin tasks share actor runs, each profile is saved as soon as it comes back"""
+    errors = {}
+    waiting = {}
+    for i, task in enumerate(tasks):
+        cached = get_cached_data("linkedin", task["url"]) if task["options"].get("cache_data") else None
+        if cached:
+            try:
+                _save_profile(task, cached)
+            except Exception as e:
+                errors[i] = e
+        else:
+            waiting.setdefault(task["url"], []).append(i)
+
+    def on_result(url, result):
+        for i in waiting.get(url, []):
+            task = tasks[i]
+            if isinstance(result, Exception):
+                errors[i] = result
+                continue
+            try:
+                if task["options"].get("cache_data"):
+                    save_to_cache("linkedin", url, result)
+                _save_profile(task, result)
+            except Exception as e:
+                errors[i] = e
+
+    if waiting:
+        datasource_registry.get_source("linkedin").process_batch(list(waiting.keys()), on_result)
+    return [errors.get(i) for i in range(len(tasks))]
+
+def _start_worker():
+    enrichment_queue.start(_enrich_task, {"linkedin": (LINKEDIN_BATCH_SIZE, _enrich_linkedin_batch)})
+
+def _first_link(links, source_type):
+    value = (links or {}).get(source_type)
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+@enrichment_bp.route("/enrichment-jobs", methods=["POST"])
+def create_enrichment_job():
+    """queue GitHub/LinkedIn scans for a batch of saved candidates, returns a job id to poll"""
+    data = request.json or {}
+    candidate_ids = data.get("candidate_ids") or []
+    sources = data.get("sources") or list(PROFILE_SAVERS.keys())
+    if not candidate_ids:
+        return jsonify({"error": "Missing candidate_ids"}), 400
+    unknown = [s for s in sources if s not in PROFILE_SAVERS]
+    if unknown:
+        return jsonify({"error": f"Unsupported sources: {', '.join(unknown)}"}), 400
+
+    candidates_res = supabase.table("candidate_data").select("id, source_links").in_("id", candidate_ids).execute()
+    tasks = []
+    for c in candidates_res.data or []:
+        for source_type in sources:
+            url = _first_link(c.get("source_links"), source_type)
+            if url and datasource_registry.get_source(source_type).validate_url(url):
+                tasks.append({"candidate_id": c["id"], "source": source_type, "url": url})
+
+    job_id = enrichment_queue.create_job(tasks, {"cache_data": data.get("cache_data", False), "sources": sources})
+    _start_worker()
+    return jsonify({"job_id": job_id, "total": len(tasks)}), 202
+
+@enrichment_bp.route("/enrichment-jobs", methods=["GET"])
+def list_enrichment_jobs():
+    _start_worker()
+    return jsonify(enrichment_queue.list_jobs(request.args.get("limit", 20, type=int))), 200
+
+@enrichment_bp.route("/enrichment-jobs/<job_id>", methods=["GET"])
+def get_enrichment_job(job_id):
+    # polling also (re)starts the worker, so jobs left over from a restart carry on
+    _start_worker()
+    status = enrichment_queue.job_status(job_id)
+    if not status:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(status), 200
+
+@enrichment_bp.route("/enrichment-jobs/<job_id>/retry", methods=["POST"])
+def retry_enrichment_job(job_id):
+    if not enrichment_queue.job_status(job_id):
+        return jsonify({"error": "Job not found"}), 404
+    retried = enrichment_queue.retry_failed(job_id)
+    _start_worker()
+    return jsonify({"job_id": job_id, "retried": retried}), 200
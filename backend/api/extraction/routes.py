@@ -1,4 +1,4 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, Response
 from werkzeug.utils import secure_filename
 import os
 from core.parsers.job_description import parse_jd, parse_job
@@ -7,7 +7,11 @@ from core.parsers.registry import datasource_registry
 from core.utils.cache import get_cached_data, save_to_cache
 from core.supabase import supabase, SUPABASE_URL
 from core.scoring.dynamic_weighting import WeightingEngine
+from core.service.bulk_ingest import collect_uploads, dedupe_by_hash, parse_many
 import hashlib
+import json
+import shutil
+import tempfile
 
 extraction_bp = Blueprint("extraction", __name__)
 
@@ -408,6 +412,32 @@ def extract_cv():
     
     return jsonify({"error": "Invalid file type"}), 400
 
+def _upload_cv(filepath, filename, cache_id):
+    """puts the CV in the 'cvs' bucket and returns its public url, local url if storage isn't there"""
+    local_url = f"http://localhost:5000/uploads/{os.path.basename(filepath)}"
+    if not supabase:
+        return local_url
+    try:
+        try:
+            supabase.storage.create_bucket('cvs', options={'public': True})
+        except Exception:
+            pass 
+
+        storage_path = f"{cache_id}_{filename}"
+        with open(filepath, 'rb') as f:
+            supabase.storage.from_('cvs').upload(
+                path=storage_path,
+                file=f,
+                file_options={
+                    "content-type": "application/pdf" if filename.endswith(".pdf") else "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                    "upsert": "true" 
+                }
+            )
+        return f"{SUPABASE_URL}/storage/v1/object/public/cvs/{storage_path}"
+    except Exception as e:
+        print(f"Upload failed: {e}")
+        return local_url
+
 @extraction_bp.route("/upload-cv", methods=["POST"])
 def upload_cv_only():
     if 'file' not in request.files:
@@ -423,30 +453,7 @@ def upload_cv_only():
             file_content = f.read()
             cache_id = hashlib.md5(file_content).hexdigest()
 
-        cv_url = None
-        if supabase:
-            try:
-                try:
-                    supabase.storage.create_bucket('cvs', options={'public': True})
-                except Exception:
-                    pass 
-
-                storage_path = f"{cache_id}_{filename}"
-                with open(filepath, 'rb') as f:
-                    supabase.storage.from_('cvs').upload(
-                        path=storage_path,
-                        file=f,
-                        file_options={
-                            "content-type": "application/pdf" if filename.endswith(".pdf") else "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                            "upsert": "true" 
-                        }
-                    )
-                cv_url = f"{SUPABASE_URL}/storage/v1/object/public/cvs/{storage_path}"
-            except Exception as e:
-                print(f"Upload failed: {e}")
-                cv_url = f"http://localhost:5000/uploads/{filename}" 
-        else:
-            cv_url = f"http://localhost:5000/uploads/{filename}"
+        cv_url = _upload_cv(filepath, filename, cache_id)
 
         return jsonify({
             "cv_url": cv_url,
@@ -456,6 +463,109 @@ def upload_cv_only():
     
     return jsonify({"error": "Invalid file type"}), 400
 
+@extraction_bp.route("/extract-cvs", methods=["POST"])
+def extract_cvs_bulk():
+    """
+    many CVs (or zips of them) in one request. CVs whose hash is already in
+    candidate_data are skipped, the rest are parsed across the process pool and
+    every result is streamed back as one NDJSON line as soon as it finishes.
+    """
+    files = request.files.getlist('files')
+    if not files:
+        return jsonify({"error": "No files provided"}), 400
+
+    cache_enabled = request.form.get('cache_data', 'false').lower() == 'true'
+
+    try:
+        cvs, invalid = collect_uploads(files)
+    except Exception as e:
+        return jsonify({"error": f"Could not read upload: {e}"}), 400
+    if not cvs:
+        return jsonify({"error": "No valid PDF or DOCX files", "skipped": invalid}), 400
+
+    unique, duplicates = dedupe_by_hash(cvs)
+
+    # one round trip for the whole batch instead of one lookup per CV
+    known = {}
+    if supabase:
+        try:
+            db_res = supabase.table("candidate_data").select("id, cv_hash, name, cv_url") \
+                .in_("cv_hash", list(unique)).execute()
+            known = {row["cv_hash"]: row for row in db_res.data or []}
+        except Exception as e:
+            print(f"WARNING [BulkIngest]: known hash lookup failed, parsing everything: {e}")
+
+    lines = []
+    for filename in invalid:
+        lines.append({"filename": filename, "status": "invalid"})
+    for filename, cv_hash in duplicates:
+        lines.append({"filename": filename, "cv_hash": cv_hash, "status": "duplicate"})
+
+    # own folder per request, /upload clears the shared one and these are only
+    # parsed while the client reads the stream
+    work_dir = tempfile.mkdtemp(prefix="cv-ingest-")
+    to_parse = {}
+    for cv_hash, (filename, content) in unique.items():
+        if cv_hash in known:
+            row = known[cv_hash]
+            lines.append({"filename": filename, "cv_hash": cv_hash, "status": "known",
+                          "candidate_id": row.get("id"), "name": row.get("name"), "cv_url": row.get("cv_url")})
+            continue
+        cached_res = get_cached_data("cv", cv_hash) if cache_enabled else None
+        if cached_res and cached_res.get("cv_url") and not cached_res["cv_url"].startswith("http://localhost"):
+            lines.append({**cached_res, "filename": filename, "cv_hash": cv_hash, "file_id": cv_hash,
+                          "cached": True, "status": "parsed"})
+            continue
+        # hash prefix so CVs with the same name in one batch don't overwrite each other
+        filepath = os.path.join(work_dir, f"{cv_hash}_{filename}")
+        with open(filepath, 'wb') as f:
+            f.write(content)
+        to_parse[cv_hash] = (filename, filepath)
+
+    def generate():
+        counts = {}
+
+        def emit(line):
+            counts[line["status"]] = counts.get(line["status"], 0) + 1
+            return json.dumps(line, default=str) + "\n"
+
+        parsed = None
+        try:
+            for line in lines:
+                yield emit(line)
+
+            paths = {cv_hash: filepath for cv_hash, (_, filepath) in to_parse.items()}
+            parsed = parse_many(paths)
+            for cv_hash, result in parsed:
+                filename, filepath = to_parse[cv_hash]
+                if isinstance(result, Exception):
+                    print(f"WARNING [BulkIngest]: failed to parse {filename}: {result}")
+                    yield emit({"filename": filename, "cv_hash": cv_hash, "status": "error", "error": str(result)})
+                    continue
+
+                result["cached"] = False
+                result["file_id"] = cv_hash
+                result["cv_hash"] = cv_hash
+                result["cv_url"] = _upload_cv(filepath, filename, cv_hash)
+                if result["cv_url"].startswith("http://localhost"):
+                    # no storage, keep a copy where /uploads serves the local url from
+                    shutil.copy(filepath, os.path.join(UPLOAD_FOLDER, os.path.basename(filepath)))
+                if cache_enabled:
+                    save_to_cache("cv", cv_hash, result)
+                yield emit({**result, "filename": filename, "status": "parsed"})
+
+            yield emit({"status": "summary", "total": len(cvs) + len(invalid), "counts": dict(counts)})
+        finally:
+            # on a client disconnect this runs from GeneratorExit, closing parsed cancels the queued batches
+            if parsed is not None:
+                parsed.close()
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    response = Response(generate(), mimetype="application/x-ndjson")
+    # the generator's finally never runs if the stream is closed before it starts
+    response.call_on_close(lambda: shutil.rmtree(work_dir, ignore_errors=True))
+    return response
+
 @extraction_bp.route("/scan-datasource", methods=["POST"])
 def scan_datasource():
     source_type = request.json.get('source_type')
@@ -1,5 +1,6 @@
 from flask import Blueprint, jsonify, request
 from core.supabase import supabase
+from core.scoring.market_index import market_index, index_rows
 
 job_reqs_bp = Blueprint("job_requirements", __name__)
 
@@ -57,6 +58,7 @@ def save_job_description():
         "description": description,
         "metrics": grouped_metrics
     }).execute()
+    index_rows(response.data)
 
     return jsonify({"success": True, "data": response.data}), 201
 
@@ -80,10 +82,15 @@ def update_job_description(id):
         "description": description,
         "metrics": grouped_metrics
     }).eq("id", id).execute()
+    index_rows(response.data)
 
     return jsonify({"success": True, "data": response.data}), 200
 
 @job_reqs_bp.route("/delete-job-description/<id>", methods=["DELETE"])
 def delete_job_description(id):
     response = supabase.table("job_requirements").delete().eq("id", id).execute()
+    try:
+        market_index.remove_document(id)
+    except Exception as e:
+        print(f"WARNING [MarketIndex]: could not remove job description: {e}")
     return jsonify({"success": True, "data": response.data}), 200
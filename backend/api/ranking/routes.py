@@ -1,6 +1,8 @@
 from flask import Blueprint, jsonify, request
 from core.supabase import supabase
 from core.scoring.registry import scoring_registry
+from core.scoring.batch_engine import BatchScoringEngine
+from core.scoring.parallel import clamp_workers
 import traceback
 
 ranking_bp = Blueprint("ranking", __name__)
@@ -37,7 +39,7 @@ def rank_candidates(config_id):
         if not candidates_res.data:
             return jsonify({"results": [], "message": "Candidates not found."}), 404
 
-        results = []
+        prepared = []
         for candidate in candidates_res.data:
             # shove things into the structure the scoring engine and frontend want
             gh_profile = candidate.get("github_profile")
@@ -110,75 +112,24 @@ def rank_candidates(config_id):
                 
                 candidate["full_cv_text"] = "\n".join(full_text_parts)
 
-            active_metrics = config.get("active_metrics", [])
-            
-            # first pass: just getting the raw metrics
-            raw_scored_data = scoring_registry.run_all(candidate, job_reqs, active_metrics, weights)
-            exp_metrics = raw_scored_data["metrics"].get("experience", {})
-            candidate["raw_tenure_months"] = exp_metrics.get("raw_months") or 0
-            candidate["raw_cv_tenure_months"] = exp_metrics.get("raw_cv_months") or 0
-            candidate["raw_li_tenure_months"] = exp_metrics.get("raw_li_months") or 0
-            candidate["raw_gh_complexity"] = raw_scored_data["metrics"].get("intel_github_complexity", {}).get("raw_complexity_sum") or 0
-            candidate["raw_gh_traction"] = raw_scored_data["metrics"].get("projects", {}).get("raw_traction_points") or 0
-            
-            gh_p = candidate.get("github_enriched", {}) or {}
-            li_p = candidate.get("linkedin_enriched", {}) or {}
-            repos = (gh_p.get("featured_projects") or []) or (gh_p.get("repositories") or [])
-            
-            candidate["raw_star_count"] = gh_p.get("total_stars") or sum(p.get("stars", 0) for p in repos if p)
-            candidate["raw_fork_count"] = gh_p.get("total_forks") or sum(p.get("forks", 0) for p in repos if p)
-            candidate["raw_repo_count"] = gh_p.get("repo_count") or len(repos)
-            candidate["raw_impact_points"] = ((candidate.get("raw_star_count") or 0) * 1.0) + ((candidate.get("raw_fork_count") or 0) * 2.5)
-            candidate["raw_connections"] = li_p.get("connections", 0) or li_p.get("followers", 0) or 0
-            
-            unique_skills = set([s.lower() for s in candidate.get('skills', []) if s])
-            candidate["raw_skill_count"] = len(unique_skills)
+            prepared.append(candidate)
 
-            results.append({
-                "candidate": candidate,
-                "raw_scored_data": raw_scored_data
-            })
+        active_metrics = config.get("active_metrics", [])
+
+        # single pass over the expensive metrics, then a cheap batch relative finalise.
+        # ?workers=N shards both passes across a process pool for big batches,
+        # capped at SCORING_MAX_WORKERS
+        workers = clamp_workers(request.args.get("workers", default=1, type=int))
+        # one routing table for the whole batch, key -> metric template is fixed for this JD/config
+        routing = scoring_registry.routing_table(job_reqs, active_metrics)
+        engine = BatchScoringEngine(scoring_registry)
+        scored_batch = engine.score_batch(prepared, job_reqs, active_metrics, weights, workers=workers, routing=routing)
 
-        # work out the batch stats for relative scoring
-        max_tenure = max([r["candidate"].get("raw_tenure_months") or 0 for r in results] + [60])
-        max_cv_tenure = max([r["candidate"].get("raw_cv_tenure_months") or 0 for r in results] + [60])
-        max_li_tenure = max([r["candidate"].get("raw_li_tenure_months") or 0 for r in results] + [60])
-        max_complexity = max([r["candidate"].get("raw_gh_complexity") or 0.0 for r in results] + [1.0])
-        max_traction = max([r["candidate"].get("raw_gh_traction") or 0.0 for r in results] + [0.5])
-        max_impact = max([r["candidate"].get("raw_impact_points") or 0.0 for r in results] + [1.0])
-        max_repos = max([r["candidate"].get("raw_repo_count") or 0 for r in results] + [5])
-        max_stars = max([r["candidate"].get("raw_star_count") or 0 for r in results] + [0])
-        max_forks = max([r["candidate"].get("raw_fork_count") or 0 for r in results] + [0])
-        max_connections = max([r["candidate"].get("raw_connections") or 0 for r in results] + [1])
-        max_skills = max([r["candidate"].get("raw_skill_count") or 0 for r in results] + [5])
-        
         final_results = []
-        for r in results:
-            candidate = r["candidate"]
-            # second pass: final score using the batch context we just found
-            candidate["batch_max_tenure"] = max_tenure
-            candidate["batch_max_cv_tenure"] = max_cv_tenure
-            candidate["batch_max_li_tenure"] = max_li_tenure
-            candidate["batch_max_complexity"] = max_complexity
-            candidate["batch_max_traction"] = max_traction
-            candidate["batch_max_impact"] = max_impact
-            candidate["batch_max_repos"] = max_repos
-            candidate["batch_max_stars"] = max_stars
-            candidate["batch_max_forks"] = max_forks
-            candidate["batch_max_connections"] = max_connections
-            candidate["batch_max_skill_count"] = max_skills
-            
-            # as they lack the correct batch-wide scaling. run_all will re-calculate
-            # them correctly using the batch_max context provided above.
-            candidate["skill_weights"] = weights
-            candidate["active_keys"] = [k for k, v in active_metrics.items() if v is True] if isinstance(active_metrics, dict) else active_metrics
-            
-            scored_data = scoring_registry.run_all(candidate, job_reqs, active_metrics, weights)
-            
-            # calculate explainable AI (XAI) metrics via Shapley Values
-            from core.scoring.explainability import ShapleyExplainer
-            explainer = ShapleyExplainer(scoring_registry)
-            shapley_results = explainer.calculate_contributions(candidate, job_reqs, active_metrics, weights)         
+        for entry in scored_batch:
+            candidate = entry["candidate"]
+            scored_data = entry["scored_data"]
+            shapley_results = entry["shapley"]
             sync_total_score = shapley_results["full_match_score"]
             
             # inject "per metric" Shapley values into the metrics breakdown for the UI
@@ -1,7 +1,8 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 import os
 import shutil
 from core.supabase import supabase
+from core.utils.cache import get_cache_stats, purge_cache_data, CACHE_DB_PATH, GENERATION_FILE
 
 system_bp = Blueprint("system", __name__)
 
@@ -31,6 +32,20 @@ def purge_database():
             except Exception as table_err:
                 print(f"Warning: Could not purge table {table}: {table_err}")
             
+        # the local market index mirrors job_requirements, so it goes too
+        try:
+            from core.scoring.market_index import market_index
+            market_index.clear()
+        except Exception as e:
+            print(f"Error clearing market index: {e}")
+
+        # queued enrichment jobs point at candidates that no longer exist
+        try:
+            from core.service.enrichment_queue import enrichment_queue
+            enrichment_queue.clear()
+        except Exception as e:
+            print(f"Error clearing enrichment jobs: {e}")
+
         # then clear supabase storage cvs bucket
         try:
             # list files in batches to avoid large payload errors
@@ -52,11 +67,21 @@ def purge_database():
 @system_bp.route("/purge-cache", methods=["POST"])
 def purge_cache():
     try:
+        # a single category (e.g. "github") can be dropped on its own
+        category = (request.get_json(silent=True) or {}).get("category")
+        purge_cache_data(category)
+        if category:
+            return jsonify({"success": True, "message": f"Cache category '{category}' purged successfully."}), 200
+
         cache_dir = os.path.join(os.getcwd(), "cached")
         if os.path.exists(cache_dir):
             for root, dirs, files in os.walk(cache_dir):
                 for file in files:
                     file_path = os.path.join(root, file)
+                    # the cache database was emptied above, other workers still have it open
+                    # (and the file store's purge stamp tells them to drop their memory tier)
+                    if file_path.startswith(CACHE_DB_PATH) or file == GENERATION_FILE:
+                        continue
                     try:
                         os.remove(file_path)
                     except Exception as e:
@@ -66,3 +91,7 @@ def purge_cache():
             return jsonify({"error": "Cache directory not found"}), 404
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+@system_bp.route("/cache-stats", methods=["GET"])
+def cache_stats():
+    return jsonify(get_cache_stats()), 200
@@ -1,14 +1,18 @@
 import os
 import re
 import json
-import pdfplumber
 import phonenumbers
-import spacy
+import threading
 from collections import defaultdict
+from typing import List, Optional
 
 from docx import Document
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 
+from core.parsers.skill_matcher import SkillMatcher
+from core.parsers.universities import get_university_matcher
+from core.parsers.pdf_extract import extract_text_and_links_from_pdf
+
 def load_skills_from_json():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     skills_path = os.path.join(current_dir, "skills_data.json")
@@ -23,7 +27,53 @@ def load_skills_from_json():
         
         return combined_skills
 
-SKILLS = load_skills_from_json()
+# pipeline components extract_name never needs
+NER_EXCLUDE = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter", "morphologizer"]
+# how much of the CV the model looks at, the name is always near the top
+NAME_WINDOW = 500
+# try the header line / email heuristic before running the model at all
+NAME_HEURISTIC = os.getenv("CV_NAME_HEURISTIC", "true").lower() == "true"
+NAME_BATCH_SIZE = 16
+
+_models_lock = threading.Lock()
+_skill_matcher = None
+_nlp = None
+
+
+def get_skill_matcher() -> SkillMatcher:
+    """built on first use, finds every skill in a single pass over the CV"""
+    global _skill_matcher
+    if _skill_matcher is None:
+        with _models_lock:
+            if _skill_matcher is None:
+                _skill_matcher = SkillMatcher(load_skills_from_json(), boundary="word")
+    return _skill_matcher
+
+
+def get_nlp():
+    """
+    spaCy pipeline, loaded on first use so importing the parser stays cheap.
+    only NER is ever used (PERSON for the name) so everything else is left out.
+    """
+    global _nlp
+    if _nlp is None:
+        with _models_lock:
+            if _nlp is None:
+                import spacy
+                nlp = spacy.load("en_core_web_sm", exclude=NER_EXCLUDE)
+                # in the small model ner has its own embedding layer, the shared
+                # tok2vec only feeds the tagger/parser
+                if "tok2vec" in nlp.pipe_names and "ner" not in nlp.get_pipe("tok2vec").listening_components:
+                    nlp.remove_pipe("tok2vec")
+                _nlp = nlp
+    return _nlp
+
+
+def warm_up():
+    """loads the spaCy model and skill matcher up front, e.g. in pool workers"""
+    get_skill_matcher()
+    get_nlp()
+
 
 LINK_PATTERNS = {
     "linkedin": re.compile(r"linkedin\.com", re.IGNORECASE),
@@ -31,29 +81,6 @@ LINK_PATTERNS = {
     "gitlab": re.compile(r"gitlab\.com", re.IGNORECASE)
 }
 
-nlp = spacy.load("en_core_web_sm")
-
-
-
-def extract_text_and_links_from_pdf(path: str):
-    text = []
-    links = []
-
-    with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            
-            if page_text:
-                text.append(page_text)
-
-            # embedded hyperlinks
-            if page.annots:
-                for annot in page.annots:
-                    uri = annot.get("uri")
-                    if uri:
-                        links.append(uri)
-
-    return "\n".join(text), links
 
 
 def extract_text_and_links_from_docx(path: str):
@@ -148,37 +175,70 @@ def extract_links(text: str, embedded_links=None):
 
     return dict(links_by_source)
 
-def extract_name(text: str):
-    doc = nlp(text[:500])  
+def _person(doc):
     for ent in doc.ents:
         if ent.label_ == "PERSON":
             return ent.text
     return None
 
 
+HEADER_LINES = 5
+NAME_LINE = re.compile(r"^[A-Za-z][A-Za-z'\-\.]*(?: [A-Za-z][A-Za-z'\-\.]*){1,3}$")
+
+
+def name_from_header(raw_text: str, email: Optional[str]) -> Optional[str]:
+    """
+    cheap guess at the name, one of the first few lines if it looks like a name
+    and at least one of its words shows up in the email's local part
+    (jane.doe@, jdoe@, doe.j@). None when nothing is confident enough.
+    """
+    if not email:
+        return None
+    local = re.sub(r"[^a-z]", "", email.split("@")[0].lower())
+    if not local:
+        return None
+
+    lines = [l.strip() for l in raw_text.splitlines() if l.strip()][:HEADER_LINES]
+    for line in lines:
+        line = re.sub(r"\s+", " ", line)
+        if not NAME_LINE.match(line):
+            continue
+        words = [re.sub(r"[^a-z]", "", w.lower()) for w in line.split(" ")]
+        if any(len(w) > 2 and w in local for w in words):
+            return line.title() if line.isupper() else line
+    return None
+
+
+def extract_name(text: str, raw_text: Optional[str] = None, email: Optional[str] = None):
+    if NAME_HEURISTIC and raw_text:
+        name = name_from_header(raw_text, email)
+        if name:
+            return name
+    return _person(get_nlp()(text[:NAME_WINDOW]))
+
+
+def extract_names(texts: List[str], raw_texts: Optional[List[str]] = None,
+                  emails: Optional[List[Optional[str]]] = None) -> List[Optional[str]]:
+    """extract_name for many CVs, whatever the heuristic can't settle goes through nlp.pipe together"""
+    names: List[Optional[str]] = [None] * len(texts)
+    todo = []
+    for i, text in enumerate(texts):
+        if NAME_HEURISTIC and raw_texts:
+            names[i] = name_from_header(raw_texts[i], emails[i] if emails else None)
+        if names[i] is None:
+            todo.append(i)
+
+    if todo:
+        docs = get_nlp().pipe((texts[i][:NAME_WINDOW] for i in todo), batch_size=NAME_BATCH_SIZE)
+        for i, doc in zip(todo, docs):
+            names[i] = _person(doc)
+    return names
+
+
 def extract_skills(text: str):
-    lower = text.lower()
-    found_skills = set()
-    
-    for skill in SKILLS:
-        skill_clean = skill.lower()
-        # using word boundaries \b for alphanumeric starts/ends 
-        # to prevent substring collisions
-        pattern = ""
-        
-        # if the skill starts with a word character
-        if skill_clean[0].isalnum():
-            pattern += r"\b"
-        pattern += re.escape(skill_clean)
-
-        # if the skill ends with a word character
-        if skill_clean[-1].isalnum():
-            pattern += r"\b"
-            
-        # if the pattern is found in the text, add the skill to the set
-        if re.search(pattern, lower):
-            found_skills.add(skill)
-            
+    # word boundaries \b for alphanumeric starts/ends to prevent substring
+    # collisions, see SkillMatcher's "word" mode
+    found_skills = get_skill_matcher().find(text.lower())
     return sorted(list(found_skills))
 
 
@@ -186,19 +246,42 @@ def extract_skills(text: str):
 # Section Parsing
 # ------------------------------------------------------------------------------------
 
+# common headers and their variations (a very crude implementation)
+# but for this project, should be fine
+HEADERS_MAP = {
+    "experience": ["experience", "work history", "employment", "professional experience"],
+    "education": ["education", "academic", "qualifications", "background"],
+    "projects": ["projects", "personal projects", "technical projects", "academic projects"],
+    "extracurricular": ["extracurricular", "volunteer", "activities", "leadership", "community"],
+    "skills": ["skills", "technical skills", "expertise", "competencies"]
+}
+
+DEGREE_KEYWORDS = ["beng", "meng", "bsc", "msc", "msci", "phd", "ba", "ma", "bachelor", "master", "doctor", "postgraduate", "undergraduate"]
+# Junk keywords that signify NOT a header
+JUNK_HEADERS = ["module", "key module", "achieved", "ranked", "award", "scholarship", "project", "skill", "subject", "expected", "grade", "results"]
+SCHOOL_LEVEL_KEYWORDS = ["a-level", "gcse", "a level", "sixth form", "junior", "secondary", "grammar", "high school", "highschool", "boys", "girls"]
+
+# date / grade patterns, compiled once rather than per header line
+_MONTHS = r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)'
+_YEAR = r'[12][0-9]{3}'
+_DATE_PART = rf'(?:(?:{_MONTHS}\s+)?{_YEAR})'
+_DASH = r'[\-\u2013\u2014\.\/]'
+DATE_RANGE_RE = re.compile(rf'(?:Expected\s+)?({_DATE_PART})\s*{_DASH}+\s*({_DATE_PART}|Present|Current|Ongoing|Now)', re.IGNORECASE)
+DATE_SINGLE_RE = re.compile(rf'(?:Expected\s+)?({_DATE_PART})', re.IGNORECASE)
+
+GRADE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in [
+    r'(?:On\s+track\s+for\s+)?(?:First|Second|Third|1st|2nd|3rd)\s+Class(?:\s+Honours)?',
+    r'(?:Expected\s+)?(?:First|Second|Third|1st|2nd|3rd)\s+Class(?:\s+Honours)?',
+    r'[12]:[12](?:\s+Honours)?', r'GPA\s*[\d\.]+(?:/\d\.\d)?',
+    r'Distinction|Merit|Pass', r'\d{2}%\s+Average',
+    r'A\*s?\s+in\s+All\s+Subjects', r'A\*A\*A\*A\*?'
+]]
+BULLET_GRADE_RE = re.compile(r'(grade|gpa|classification|result|grade achieved):\s*([\w\+\.\s/]+)', re.IGNORECASE)
+
+
 def split_sections(text: str):
     sections = {"other": []}
     current = "other"
-    
-    # common headers and their variations (a very crude implementation)
-    # but for this project, should be fine
-    HEADERS_MAP = {
-        "experience": ["experience", "work history", "employment", "professional experience"],
-        "education": ["education", "academic", "qualifications", "background"],
-        "projects": ["projects", "personal projects", "technical projects", "academic projects"],
-        "extracurricular": ["extracurricular", "volunteer", "activities", "leadership", "community"],
-        "skills": ["skills", "technical skills", "expertise", "competencies"]
-    }
 
     for line in text.split("\n"):
         line_strip = line.strip()
@@ -227,32 +310,20 @@ def split_sections(text: str):
     return {k: "\n".join(v).strip() for k, v in sections.items()}
 
 
-def extract_structured_section(text: str, section_key: str):
-    sections = split_sections(text)
+def extract_structured_section(text: str, section_key: str, sections: Optional[dict] = None):
+    """items of one section, pass in split_sections(text) when extracting several from the same CV"""
+    if sections is None:
+        sections = split_sections(text)
     section_text = sections.get(section_key, "")
     if not section_text:
         return []
 
-    # Load High-Confidence Universities
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    uni_path = os.path.join(current_dir, "universities_data.json")
-    try:
-        with open(uni_path, "r") as f:
-            UNI_DATA = json.load(f).get("uk_universities", [])
-    except:
-        UNI_DATA = []
+    universities = get_university_matcher()
 
     items = []
     lines = section_text.split("\n")
     current_item = None
 
-    # High-Confidence Universities in the UK (mostly London ones for testing)
-    INST_KEYWORDS = ["university", "college", "imperial", "institute", "polytechnic", "london academy", "ucl", "lse", "kcl"]
-    DEGREE_KEYWORDS = ["beng", "meng", "bsc", "msc", "msci", "phd", "ba", "ma", "bachelor", "master", "doctor", "postgraduate", "undergraduate"]
-    
-    # Junk keywords that signify NOT a header
-    JUNK_HEADERS = ["module", "key module", "achieved", "ranked", "award", "scholarship", "project", "skill", "subject", "expected", "grade", "results"]
-
     for line in lines:
         line = line.strip()
         if not line: continue
@@ -273,7 +344,7 @@ def extract_structured_section(text: str, section_key: str):
             is_bullet = line.startswith(("•", "-", "*", "•"))
             starts_with_junk = any(line_lower.startswith(jk) for jk in JUNK_HEADERS)
             has_degree = any(dk in line_lower for dk in DEGREE_KEYWORDS)
-            has_known_uni = any(uk.lower() in line_lower for uk in UNI_DATA) or any(ik in line_lower for ik in INST_KEYWORDS)
+            has_known_uni = universities.is_institution(line_lower)
             
             # Heuristic: If it has a degree keyword, it's almost certainly a header, even if it has junk
             if (not is_bullet) and (has_degree or (not starts_with_junk and has_known_uni)) and len(line.split()) < 25:
@@ -298,7 +369,7 @@ def extract_structured_section(text: str, section_key: str):
                 p1, p2 = parts[0].strip(), parts[1].strip()
                 
                 if section_key == "education":
-                    p1_is_inst = any(k in p1.lower() for k in INST_KEYWORDS + UNI_DATA)
+                    p1_is_inst = universities.is_institution(p1)
                     p2_is_deg = any(k in p2.lower() for k in DEGREE_KEYWORDS)
                     if p1_is_inst: name, subtitle = p1, p2
                     elif p2_is_deg: name, subtitle = p1, p2
@@ -316,19 +387,12 @@ def extract_structured_section(text: str, section_key: str):
                             break
 
             # Extraction for date/grade (Common to all sections)
-            months_pattern = r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)'
-            year_pattern = r'[12][0-9]{3}'
-            date_part = rf'(?:(?:{months_pattern}\s+)?{year_pattern})'
-            dash_pattern = r'[\-\u2013\u2014\.\/]'
-            range_regex = rf'(?:Expected\s+)?({date_part})\s*{dash_pattern}+\s*({date_part}|Present|Current|Ongoing|Now)'
-            single_regex = rf'(?:Expected\s+)?({date_part})'
-            
-            date_match = re.search(range_regex, line, re.IGNORECASE)
+            date_match = DATE_RANGE_RE.search(line)
             start_date, end_date, full_date_match = None, None, ""
             if date_match:
                 start_date, end_date, full_date_match = date_match.group(1).strip(), date_match.group(2).strip(), date_match.group(0)
             else:
-                single_match = re.search(single_regex, line, re.IGNORECASE)
+                single_match = DATE_SINGLE_RE.search(line)
                 if single_match:
                     start_date, full_date_match = single_match.group(1).strip(), single_match.group(0)
 
@@ -337,15 +401,8 @@ def extract_structured_section(text: str, section_key: str):
                 subtitle = subtitle.replace(full_date_match, "").strip().rstrip(",- ").strip()
 
             grade = None
-            grade_patterns = [
-                r'(?:On\s+track\s+for\s+)?(?:First|Second|Third|1st|2nd|3rd)\s+Class(?:\s+Honours)?',
-                r'(?:Expected\s+)?(?:First|Second|Third|1st|2nd|3rd)\s+Class(?:\s+Honours)?',
-                r'[12]:[12](?:\s+Honours)?', r'GPA\s*[\d\.]+(?:/\d\.\d)?',
-                r'Distinction|Merit|Pass', r'\d{2}%\s+Average',
-                r'A\*s?\s+in\s+All\s+Subjects', r'A\*A\*A\*A\*?'
-            ]
-            for pattern in grade_patterns:
-                g_match = re.search(pattern, line, re.IGNORECASE)
+            for pattern in GRADE_PATTERNS:
+                g_match = pattern.search(line)
                 if g_match:
                     grade = g_match.group(0).strip()
                     subtitle = subtitle.replace(grade, "").strip().rstrip(",- ").strip()
@@ -357,7 +414,7 @@ def extract_structured_section(text: str, section_key: str):
         elif (line.startswith("•") or line.startswith("-") or line.startswith("*")) and current_item:
             bullet_text = line.lstrip("•-* ").strip()
             if not current_item["grade"]:
-                grade_match = re.search(r'(grade|gpa|classification|result|grade achieved):\s*([\w\+\.\s/]+)', bullet_text, re.IGNORECASE)
+                grade_match = BULLET_GRADE_RE.search(bullet_text)
                 if grade_match: current_item["grade"] = grade_match.group(2).strip()
                 elif "first class" in bullet_text.lower() or "distinction" in bullet_text.lower():
                      current_item["grade"] = bullet_text if len(bullet_text) < 40 else bullet_text[:40]
@@ -370,7 +427,6 @@ def extract_structured_section(text: str, section_key: str):
     # must look like a uni degree
     if section_key == "education":
         filtered_items = []
-        SCHOOL_LEVEL_KEYWORDS = ["a-level", "gcse", "a level", "sixth form", "junior", "secondary", "grammar", "high school", "highschool", "boys", "girls"]
 
         for item in items:
             combined = (item["name"] + " " + item["subtitle"]).lower()
@@ -384,33 +440,66 @@ def extract_structured_section(text: str, section_key: str):
         
         return filtered_items
 
-        return filtered_items
-
     return items
 
 
-def parse_cv(path: str):
+def _read_cv(path: str):
     raw_text, embedded_links = extract_text_and_links(path)
     # sanitize raw text to prevent database crashes (null bytes)
     raw_text = raw_text.replace("\u0000", "")
-    
-    cleaned_text = clean_text(raw_text)
+    return raw_text, clean_text(raw_text), embedded_links
+
+
+def _build_cv(raw_text: str, cleaned_text: str, embedded_links, name: Optional[str]):
     sections = split_sections(raw_text)
 
     return {
         "raw_cv_text": raw_text,
-        "name": extract_name(cleaned_text),
+        "name": name,
         "email": extract_email(cleaned_text),
         "phone": extract_phone(cleaned_text),
         "links": extract_links(cleaned_text, embedded_links),
         "skills": extract_skills(cleaned_text),
-        "projects": extract_structured_section(raw_text, "projects"),
-        "extracurricular": extract_structured_section(raw_text, "extracurricular"),
-        "cv_experience": extract_structured_section(raw_text, "experience"),
+        "projects": extract_structured_section(raw_text, "projects", sections),
+        "extracurricular": extract_structured_section(raw_text, "extracurricular", sections),
+        "cv_experience": extract_structured_section(raw_text, "experience", sections),
         "experience": sections.get("experience"), # Keep raw text for density/text analysis
-        "education": extract_structured_section(raw_text, "education"),
+        "education": extract_structured_section(raw_text, "education", sections),
     }
 
+
+def parse_cv(path: str):
+    raw_text, cleaned_text, embedded_links = _read_cv(path)
+    name = extract_name(cleaned_text, raw_text, extract_email(cleaned_text))
+    return _build_cv(raw_text, cleaned_text, embedded_links, name)
+
+
+def parse_cvs(paths: List[str]) -> list:
+    """
+    parse_cv for several files, the names come from one nlp.pipe call.
+    one result per path, the exception in place of a CV that couldn't be read.
+    """
+    read = []
+    for path in paths:
+        try:
+            read.append(_read_cv(path))
+        except Exception as e:
+            read.append(e)
+
+    ok = [r for r in read if not isinstance(r, Exception)]
+    names = iter(extract_names([r[1] for r in ok], [r[0] for r in ok], [extract_email(r[1]) for r in ok]))
+
+    results = []
+    for r in read:
+        if isinstance(r, Exception):
+            results.append(r)
+            continue
+        try:
+            results.append(_build_cv(r[0], r[1], r[2], next(names)))
+        except Exception as e:
+            results.append(e)
+    return results
+
 def get_available_links(path: str):
     raw_text, embedded_links = extract_text_and_links(path)
     cleaned_text = clean_text(raw_text)
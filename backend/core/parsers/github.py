@@ -1,12 +1,13 @@
 import os
 import re
-import requests
+import math
 import datetime
 from collections import Counter
 from collections import defaultdict
 from core.parsers.base import BaseDataSource
+from core.parsers.github_client import GitHubClient, GitHubScan, GITHUB_API_BASE
+from core.parsers.github_cache import GitHubHTTPCache
 
-GITHUB_API_BASE = "https://api.github.com"
 GITHUB_HEADERS = {
     "Accept": "application/vnd.github+json"
 }
@@ -16,6 +17,17 @@ GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 if GITHUB_TOKEN:
     GITHUB_HEADERS["Authorization"] = f"token {GITHUB_TOKEN}"
 
+# "rest" (default) or "graphql", see github_graphql.py. graphql needs the token
+GITHUB_BACKEND = os.getenv("GITHUB_BACKEND", "rest").lower()
+
+# avoid excessive scanning, or rate limit, by only checking 50 repos per user
+REPO_LIMIT = 50
+
+# one pooled client for the whole process. responses are cached on disk and
+# revalidated with ETags, set GITHUB_HTTP_CACHE=0 to always hit the API
+_http_cache = GitHubHTTPCache() if os.getenv("GITHUB_HTTP_CACHE", "1") != "0" else None
+github_client = GitHubClient(GITHUB_API_BASE, GITHUB_HEADERS, cache=_http_cache)
+
 # utilities
 
 def extract_github_username(url: str) -> str | None:
@@ -23,39 +35,42 @@ def extract_github_username(url: str) -> str | None:
     return match.group(2) if match else None
 
 
-def github_get(endpoint: str, params=None, headers=None):
-    request_headers = GITHUB_HEADERS.copy()
-    if headers:
-        request_headers.update(headers)
-        
-    response = requests.get(
-        f"{GITHUB_API_BASE}{endpoint}",
-        headers=request_headers,
-        params=params
-    )
-        
-    response.raise_for_status()
-    return response.json()
+def github_get(endpoint: str, params=None, headers=None, scan: GitHubScan | None = None):
+    # inside a scan identical requests are only sent once
+    if scan is not None:
+        return scan.get(endpoint, params=params, headers=headers)
+    return github_client.get(endpoint, params=params, headers=headers)
 
 
 # core parsing logic
 
-def fetch_user_profile(username: str) -> dict:
-    return github_get(f"/users/{username}")
+def fetch_user_profile(username: str, scan: GitHubScan | None = None) -> dict:
+    return github_get(f"/users/{username}", scan=scan)
+
+
+def _repos_page_params(page: int) -> dict:
+    return {
+        "per_page": 100,
+        "page": page,
+        "sort": "updated"
+    }
 
 
-def fetch_user_repos(username: str) -> list[dict]:
+def fetch_user_repos(username: str, scan: GitHubScan | None = None, expected_count: int | None = None) -> list[dict]:
     repos = []
     page = 1
 
+    # if we know roughly how many repos there are, request those pages (and the
+    # empty one after them) together instead of one after another
+    if scan is not None and expected_count:
+        for p in range(1, math.ceil(expected_count / 100) + 2):
+            scan.submit(f"/users/{username}/repos", params=_repos_page_params(p))
+
     while True:
         batch = github_get(
             f"/users/{username}/repos",
-            params={
-                "per_page": 100,
-                "page": page,
-                "sort": "updated"
-            }
+            params=_repos_page_params(page),
+            scan=scan
         )
 
         if not batch:
@@ -67,12 +82,16 @@ def fetch_user_repos(username: str) -> list[dict]:
     return repos
 
 
-def fetch_repo_languages(repo_full_name: str) -> dict:
-    return github_get(f"/repos/{repo_full_name}/languages")
+def fetch_repo_languages(repo_full_name: str, scan: GitHubScan | None = None) -> dict:
+    return github_get(f"/repos/{repo_full_name}/languages", scan=scan)
+
+
+def fetch_contributor_stats(repo_full_name: str, scan: GitHubScan | None = None):
+    return github_get(f"/repos/{repo_full_name}/stats/contributors", scan=scan)
 
 
-def fetch_user_contribution_ratio(repo_full_name: str, username: str) -> float:
-    stats = github_get(f"/repos/{repo_full_name}/stats/contributors")
+def fetch_user_contribution_ratio(repo_full_name: str, username: str, scan: GitHubScan | None = None) -> float:
+    stats = fetch_contributor_stats(repo_full_name, scan)
     
     # assuming that the repo is theirs if there are issues
     if not stats or not isinstance(stats, list):
@@ -91,24 +110,25 @@ def fetch_user_contribution_ratio(repo_full_name: str, username: str) -> float:
     return min(user_additions / total_additions, 1.0)
 
 
-def fetch_user_activity(username: str) -> dict:
-    # pull requests that were authorised by the user
-    pr_search = github_get("/search/issues", params={"q": f"author:{username} type:pr"})
+def fetch_user_activity(username: str, scan: GitHubScan | None = None) -> dict:
+    searches = [
+        # pull requests that were authorised by the user
+        ("/search/issues", {"q": f"author:{username} type:pr"}, None),
+        # commits authorised by the user
+        ("/search/commits", {"q": f"author:{username}"}, {"Accept": "application/vnd.github.cloak-preview+json"}),
+        # open source contributions, PRs to repos not owned by the user
+        ("/search/issues", {"q": f"is:pr author:{username} -user:{username}", "per_page": 100}, None)
+    ]
+    # the three searches are independent, so send them together
+    if scan is not None:
+        for endpoint, params, headers in searches:
+            scan.submit(endpoint, params=params, headers=headers)
+    pr_search, commit_search, oss_search = [
+        github_get(endpoint, params=params, headers=headers, scan=scan) for endpoint, params, headers in searches
+    ]
+
     total_prs = pr_search.get("total_count", 0)
-    
-    # commits authorised by the user
-    commit_search = github_get(
-        "/search/commits", 
-        params={"q": f"author:{username}"}, 
-        headers={"Accept": "application/vnd.github.cloak-preview+json"}
-    )
     total_commits = commit_search.get("total_count", 0)
-    
-    # open source contributions, PRs to repos not owned by the user
-    oss_search = github_get("/search/issues", params={
-        "q": f"is:pr author:{username} -user:{username}",
-        "per_page": 100
-    })
     oss_prs = oss_search.get("total_count", 0)
     oss_repos = {item.get("repository_url") for item in oss_search.get("items", []) if item.get("repository_url")}
     external_repos_count = len(oss_repos)
@@ -121,10 +141,11 @@ def fetch_user_activity(username: str) -> dict:
     }
 
 
-def summarise_repositories(repos: list[dict], username: str) -> dict:
+def summarise_repositories(repos: list[dict], username: str, scan: GitHubScan | None = None) -> dict:
     # Assume 80 chars per line (PEP 8 standard) to guess LOC from bytes
     # ref: https://peps.python.org/pep-0008/#maximum-line-length
     CHARS_PER_LINE = 80
+    scan = scan or github_client.scan()
 
     total_languages = Counter()
     total_stars = 0
@@ -133,6 +154,22 @@ def summarise_repositories(repos: list[dict], username: str) -> dict:
     
     language_history = defaultdict(lambda: Counter())
 
+    # top 3 repos to show on the frontend as a highlight
+    most_starred = sorted(
+        [r for r in repos if not r.get("fork")],
+        key=lambda r: r.get("stargazers_count", 0),
+        reverse=True
+    )[:3]
+
+    # queue up every request the summary needs so the pool can work through them
+    # while we go, each endpoint is only fetched once per scan
+    for i, repo in enumerate(repos):
+        if i < REPO_LIMIT:
+            scan.submit(f"/repos/{repo['full_name']}/languages")
+        scan.submit(f"/repos/{repo['full_name']}/stats/contributors")
+    for r in most_starred:
+        scan.submit(f"/repos/{r['full_name']}/languages")
+
     # fetch language bytes for each repo for deep analysis
     for i, repo in enumerate(repos):
         repo_langs = {}
@@ -140,14 +177,12 @@ def summarise_repositories(repos: list[dict], username: str) -> dict:
         # print(f"DEBUG: {repo['full_name']}")
         ratio = 1.0
         
-        # avoid excessive scanning, or rate limit, by only checking 50 repos per user
-        REPO_LIMIT = 50
         if i < REPO_LIMIT:
             try:
-                repo_langs = fetch_repo_languages(repo["full_name"])
+                repo_langs = fetch_repo_languages(repo["full_name"], scan)
                 # only perform ratio check if we have languages and it might be a team project
                 if repo_langs and repo.get("stargazers_count", 0) > 0:
-                    ratio = fetch_user_contribution_ratio(repo["full_name"], username)
+                    ratio = fetch_user_contribution_ratio(repo["full_name"], username, scan)
             except:
                 pass
             
@@ -179,7 +214,7 @@ def summarise_repositories(repos: list[dict], username: str) -> dict:
         # Extract commits from contributor stats if available
         repo["user_commits"] = 0
         try:
-            stats = github_get(f"/repos/{repo['full_name']}/stats/contributors")
+            stats = fetch_contributor_stats(repo["full_name"], scan)
             user_stats = next((s for s in stats if s.get("author", {}).get("login") == username), None)
             if user_stats:
                 repo["user_commits"] = user_stats.get("total", 0)
@@ -189,17 +224,11 @@ def summarise_repositories(repos: list[dict], username: str) -> dict:
         total_stars += repo.get("stargazers_count", 0)
         total_forks += repo.get("forks_count", 0)
 
-    # top 3 repos to show on the frontend as a highlight
-    most_starred = sorted(
-        [r for r in repos if not r.get("fork")],
-        key=lambda r: r.get("stargazers_count", 0),
-        reverse=True
-    )[:3]
     # print(f"DEBUG; found {len(most_starred)} featured repos")
 
     featured_repos = []
     for r in most_starred:
-        r_langs = fetch_repo_languages(r["full_name"])
+        r_langs = fetch_repo_languages(r["full_name"], scan)
         top_5_langs = sorted(r_langs.items(), key=lambda x: x[1], reverse=True)[:5]
         
         # 'type' based on topics
@@ -269,15 +298,18 @@ class GitHubDataSource(BaseDataSource):
         if not username:
             raise ValueError(f"Invalid GitHub URL: {url}")
             
-        profile = fetch_user_profile(username)
-        repos = fetch_user_repos(username)
-        activity = fetch_user_activity(profile.get("login", username))
+        # one scan per candidate so nothing gets fetched twice
+        scan = github_client.scan()
+        profile = fetch_user_profile(username, scan)
+        repos = fetch_user_repos(username, scan, expected_count=profile.get("public_repos"))
+        activity = fetch_user_activity(profile.get("login", username), scan)
         
         return {
             "profile": profile,
             "repos": repos,
             "activity": activity,
-            "url": url
+            "url": url,
+            "_scan": scan
         }
 
     def parse(self, raw_data: dict) -> dict:
@@ -286,7 +318,7 @@ class GitHubDataSource(BaseDataSource):
         activity = raw_data["activity"]
         username = profile.get("login", "")
         
-        repo_summary = summarise_repositories(repos, username)
+        repo_summary = summarise_repositories(repos, username, raw_data.get("_scan"))
         
         return {
             "source": self.name,
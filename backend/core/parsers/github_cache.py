@@ -0,0 +1,103 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.utils.cache import CACHE_DIR
+
+GITHUB_CACHE_DIR = os.path.join(CACHE_DIR, "github_http")
+
+# how long a stored response is trusted without asking GitHub at all (seconds).
+# after that it is revalidated with If-None-Match / If-Modified-Since, and a 304
+# doesn't count against the primary rate limit. first matching pattern wins.
+ENDPOINT_TTLS: List[Tuple[str, int]] = [
+    (r"^/users/[^/]+$", 6 * 3600),              # profile
+    (r"^/users/[^/]+/repos$", 3600),            # repo listing pages
+    (r"^/repos/.+/languages$", 24 * 3600),      # language bytes barely move
+    (r"^/repos/.+/stats/contributors$", 6 * 3600),
+    (r"^/search/", 3600),                       # search counts
+]
+DEFAULT_TTL = 3600
+
+
+class GitHubHTTPCache:
+    """
+    On-disk store for GitHub API responses, one json file per request
+    (url + params + headers) holding the body and its ETag / Last-Modified.
+    only 200s are stored, so 202 'stats are being computed' replies never stick.
+    """
+
+    def __init__(self, directory: str = GITHUB_CACHE_DIR, ttls: Optional[List[Tuple[str, int]]] = None,
+                 default_ttl: int = DEFAULT_TTL):
+        self.directory = directory
+        self.ttls = [(re.compile(p), ttl) for p, ttl in (ENDPOINT_TTLS if ttls is None else ttls)]
+        self.default_ttl = default_ttl
+
+    def ttl_for(self, endpoint: str) -> int:
+        for pattern, ttl in self.ttls:
+            if pattern.search(endpoint):
+                return ttl
+        return self.default_ttl
+
+    def key(self, url: str, params: Optional[dict], headers: Optional[dict]) -> str:
+        # headers are part of the key: the token decides what's visible, Accept what's returned
+        raw = json.dumps([url, sorted((params or {}).items()), sorted((headers or {}).items())], default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # half written or corrupt entry, treat as a miss
+            return None
+
+    def store(self, key: str, entry: Dict[str, Any]):
+        """atomic write, a failed write only costs a future cache miss"""
+        path = self._path(key)
+        # per thread temp file, pool threads can be fetching the same url
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"WARNING [GitHubCache]: could not store {key}: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def is_fresh(self, entry: Dict[str, Any], endpoint: str) -> bool:
+        return time.time() - entry.get("stored_at", 0) < self.ttl_for(endpoint)
+
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def refresh(self, key: str, entry: Dict[str, Any]):
+        """304: the stored body is still current, restart its TTL"""
+        self.store(key, {**entry, "stored_at": time.time()})
+
+    def save_response(self, key: str, response, body: Any):
+        self.store(key, {
+            "url": response.url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "stored_at": time.time(),
+            "body": body
+        })
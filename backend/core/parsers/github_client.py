@@ -0,0 +1,143 @@
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.parsers.github_cache import GitHubHTTPCache
+from core.parsers.github_scheduler import GitHubScheduler
+
+GITHUB_API_BASE = "https://api.github.com"
+# how many GitHub requests can be in flight at once (shared by every scan)
+GITHUB_CONCURRENCY = int(os.getenv("GITHUB_CONCURRENCY", "8"))
+
+
+def _request_key(endpoint: str, params: Optional[dict], headers: Optional[dict]) -> tuple:
+    return (
+        endpoint,
+        tuple(sorted((params or {}).items())),
+        tuple(sorted((headers or {}).items()))
+    )
+
+
+class GitHubClient:
+    """
+    Pooled GitHub REST client. one keep-alive session plus a scheduler with a few
+    worker threads, so a scan can have several requests in flight without opening
+    a new connection (and TLS handshake) for each one, while staying inside the
+    rate limit.
+    """
+
+    def __init__(self, base_url: str = GITHUB_API_BASE, headers: Optional[Dict[str, str]] = None,
+                 max_workers: int = GITHUB_CONCURRENCY, cache: Optional[GitHubHTTPCache] = None,
+                 scheduler: Optional[GitHubScheduler] = None):
+        self.base_url = base_url
+        self.headers = dict(headers or {})
+        self.max_workers = max(1, max_workers)
+        self.cache = cache
+        self.scheduler = scheduler or GitHubScheduler(max_workers=self.max_workers)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, endpoint: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> Any:
+        """single GET, returns the decoded json and raises for HTTP errors"""
+        return self.submit(endpoint, params, headers).result()
+
+    def submit(self, endpoint: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> Future:
+        """
+        queues a GET on the scheduler. with a cache, fresh entries are served from
+        disk straight away and stale ones are revalidated with a conditional request.
+        """
+        request_headers = self.headers.copy()
+        if headers:
+            request_headers.update(headers)
+        url = f"{self.base_url}{endpoint}"
+
+        key, entry = None, None
+        if self.cache is not None:
+            key = self.cache.key(url, params, request_headers)
+            entry = self.cache.load(key)
+            if entry is not None:
+                if self.cache.is_fresh(entry, endpoint):
+                    future = Future()
+                    future.set_result(entry["body"])
+                    return future
+                request_headers.update(self.cache.conditional_headers(entry))
+
+        def send():
+            return self.session.get(url, headers=request_headers, params=params)
+
+        def finish(response):
+            if response.status_code == 304 and entry is not None:
+                self.cache.refresh(key, entry)
+                return entry["body"]
+
+            response.raise_for_status()
+            body = response.json()
+            if self.cache is not None and response.status_code == 200:
+                self.cache.save_response(key, response, body)
+            return body
+
+        return self.scheduler.submit(endpoint, send, finish)
+
+    def graphql(self, query: str, variables: Optional[dict] = None) -> dict:
+        """one GraphQL query (needs a token), returns the 'data' part"""
+        def send():
+            return self.session.post(f"{self.base_url}/graphql", headers=self.headers,
+                                     json={"query": query, "variables": variables or {}})
+
+        def finish(response):
+            response.raise_for_status()
+            body = response.json()
+            if body.get("errors") and not body.get("data"):
+                raise ValueError(f"GitHub GraphQL error: {body['errors'][0].get('message')}")
+            return body.get("data") or {}
+
+        return self.scheduler.submit("/graphql", send, finish).result()
+
+    def scan(self) -> "GitHubScan":
+        return GitHubScan(self)
+
+
+class GitHubScan:
+    """
+    One candidate scan. requests go through the client's scheduler and are
+    de-duplicated, so each endpoint (with the same params) is only fetched once
+    however many parts of the summary need it. errors are shared the same way.
+    """
+
+    def __init__(self, client: GitHubClient):
+        self.client = client
+        self._futures: Dict[tuple, Future] = {}
+        self._seeded = set()
+        self._lock = threading.Lock()
+
+    def submit(self, endpoint: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> Future:
+        key = _request_key(endpoint, params, headers)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self.client.submit(endpoint, params, headers)
+                self._futures[key] = future
+        return future
+
+    def get(self, endpoint: str, params: Optional[dict] = None, headers: Optional[dict] = None) -> Any:
+        return self.submit(endpoint, params, headers).result()
+
+    def seed(self, endpoint: str, body: Any, params: Optional[dict] = None, headers: Optional[dict] = None):
+        """records a response we already have (e.g. from GraphQL) so it isn't fetched"""
+        future = Future()
+        future.set_result(body)
+        key = _request_key(endpoint, params, headers)
+        with self._lock:
+            self._futures[key] = future
+            self._seeded.add(key)
+
+    @property
+    def request_count(self) -> int:
+        return len(self._futures) - len(self._seeded)
@@ -0,0 +1,160 @@
+from core.parsers import github
+from core.parsers.github import GitHubDataSource, extract_github_username, fetch_user_activity
+from core.parsers.github_client import GitHubScan
+
+# the graphql backend gets the profile, every repo, its language bytes and commit
+# counts in a few paginated queries instead of 2 REST calls per repo. the answers
+# are turned back into the REST shapes and seeded into the scan, so
+# summarise_repositories (and the metrics) work on exactly the same structures.
+
+REPOS_PER_PAGE = 50
+
+PROFILE_QUERY = """
+query($login: String!) {
+  user(login: $login) {
+    id login name bio company location email avatarUrl url createdAt
+    followers { totalCount }
+    following { totalCount }
+    repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+  }
+}
+"""
+
+REPOS_QUERY = """
+query($login: String!, $userId: ID!, $cursor: String, $perPage: Int!) {
+  user(login: $login) {
+    repositories(first: $perPage, after: $cursor, privacy: PUBLIC, ownerAffiliations: OWNER,
+                 orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name nameWithOwner description url isFork stargazerCount forkCount createdAt updatedAt
+        primaryLanguage { name }
+        licenseInfo { name }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        languages(first: 100, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history { totalCount }
+              mine: history(author: {id: $userId}) { totalCount }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def _profile_from_node(user: dict) -> dict:
+    # same keys as GET /users/{username}
+    return {
+        "login": user.get("login"),
+        "name": user.get("name"),
+        "bio": user.get("bio"),
+        "company": user.get("company"),
+        "location": user.get("location"),
+        # graphql gives "" for a hidden email, REST gives null
+        "email": user.get("email") or None,
+        "avatar_url": user.get("avatarUrl"),
+        "html_url": user.get("url"),
+        "created_at": user.get("createdAt"),
+        "followers": (user.get("followers") or {}).get("totalCount"),
+        "following": (user.get("following") or {}).get("totalCount"),
+        "public_repos": (user.get("repositories") or {}).get("totalCount"),
+    }
+
+
+def _repo_from_node(node: dict) -> dict:
+    # the fields of GET /users/{username}/repos the summary and parse() use
+    return {
+        "name": node["name"],
+        "full_name": node["nameWithOwner"],
+        "description": node.get("description"),
+        "html_url": node.get("url"),
+        "fork": node.get("isFork", False),
+        "stargazers_count": node.get("stargazerCount", 0),
+        "forks_count": node.get("forkCount", 0),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "language": (node.get("primaryLanguage") or {}).get("name"),
+        "license": {"name": node["licenseInfo"]["name"]} if node.get("licenseInfo") else None,
+        "topics": [t["topic"]["name"] for t in (node.get("repositoryTopics") or {}).get("nodes", [])],
+    }
+
+
+def _contributor_stats(username: str, node: dict) -> list:
+    """
+    stand-in for /stats/contributors. graphql has no per-author additions, so the
+    user's share of the default branch commits is used as their share of the code
+    """
+    target = (node.get("defaultBranchRef") or {}).get("target") or {}
+    total = (target.get("history") or {}).get("totalCount", 0)
+    mine = (target.get("mine") or {}).get("totalCount", 0)
+    stats = []
+    if mine:
+        stats.append({"author": {"login": username}, "total": mine, "weeks": [{"a": mine}]})
+    if total - mine > 0:
+        stats.append({"author": {"login": None}, "total": total - mine, "weeks": [{"a": total - mine}]})
+    return stats
+
+
+def fetch_user_graphql(username: str, scan: GitHubScan) -> tuple:
+    """profile and repos (REST shaped), with languages and contributor stats seeded into the scan"""
+    data = github.github_client.graphql(PROFILE_QUERY, {"login": username})
+    user = data.get("user")
+    if not user:
+        raise ValueError(f"GitHub user not found: {username}")
+    profile = _profile_from_node(user)
+
+    repos = []
+    cursor = None
+    while True:
+        data = github.github_client.graphql(REPOS_QUERY, {
+            "login": username, "userId": user["id"], "cursor": cursor, "perPage": REPOS_PER_PAGE
+        })
+        page = data["user"]["repositories"]
+        for node in page["nodes"]:
+            repo = _repo_from_node(node)
+            scan.seed(f"/repos/{repo['full_name']}/languages",
+                      {e["node"]["name"]: e["size"] for e in (node.get("languages") or {}).get("edges", [])})
+            scan.seed(f"/repos/{repo['full_name']}/stats/contributors", _contributor_stats(profile["login"], node))
+            repos.append(repo)
+
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        cursor = page["pageInfo"]["endCursor"]
+
+    return profile, repos
+
+
+class GitHubGraphQLDataSource(GitHubDataSource):
+    """GitHubDataSource that fetches through the GraphQL API (needs GITHUB_TOKEN)"""
+
+    def scrape(self, url: str) -> dict:
+        username = extract_github_username(url)
+        if not username:
+            raise ValueError(f"Invalid GitHub URL: {url}")
+
+        scan = github.github_client.scan()
+        profile, repos = fetch_user_graphql(username, scan)
+        # commit search isn't available in graphql, the activity counts stay on REST search
+        activity = fetch_user_activity(profile.get("login", username), scan)
+
+        return {
+            "profile": profile,
+            "repos": repos,
+            "activity": activity,
+            "url": url,
+            "_scan": scan
+        }
+
+
+def github_data_source() -> GitHubDataSource:
+    """the GitHub backend picked by GITHUB_BACKEND"""
+    if github.GITHUB_BACKEND == "graphql":
+        if github.GITHUB_TOKEN:
+            return GitHubGraphQLDataSource()
+        print("WARNING [GitHub]: GITHUB_BACKEND=graphql needs GITHUB_TOKEN, using the REST backend")
+    return GitHubDataSource()
@@ -0,0 +1,228 @@
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+# cheap once-per-candidate calls (profile, repo listing, searches) go first,
+# the per-repo languages / contributor stats calls are the expensive bulk
+PRIORITY_HIGH = 0
+PRIORITY_LOW = 1
+
+# once the remaining budget drops to this, per-repo calls wait for the reset
+# and only high priority calls are sent. never more than a tenth of the window's
+# limit, unauthenticated clients only get 60 an hour
+LOW_BUDGET_RESERVE = int(os.getenv("GITHUB_LOW_BUDGET", "100"))
+LOW_BUDGET_FRACTION = 10
+# how long a per-repo call is held back for budget before it is given up on
+# (the scan carries on without that repo's languages / stats, like an unresolved 202)
+LOW_PRIORITY_MAX_WAIT = float(os.getenv("GITHUB_LOW_MAX_WAIT", "30"))
+MAX_RETRIES = int(os.getenv("GITHUB_MAX_RETRIES", "5"))
+# first delay for backoff on 403/429 and for re-asking 202 stats, doubles per attempt
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+
+def priority_for(endpoint: str) -> int:
+    return PRIORITY_LOW if endpoint.startswith("/repos/") else PRIORITY_HIGH
+
+
+def resource_for(endpoint: str) -> str:
+    # search and graphql have their own budgets on GitHub
+    if endpoint.startswith("/search/"):
+        return "search"
+    if endpoint == "/graphql":
+        return "graphql"
+    return "core"
+
+
+class RateLimitBudget:
+    """what's left of one rate limit window, from the X-RateLimit-* headers"""
+
+    def __init__(self):
+        self.remaining: Optional[int] = None
+        self.limit: Optional[int] = None
+        self.reset_at: float = 0.0
+
+    def update(self, headers):
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        if headers.get("X-RateLimit-Limit"):
+            self.limit = int(headers["X-RateLimit-Limit"])
+        reset_at = float(headers.get("X-RateLimit-Reset") or 0)
+        remaining = int(remaining)
+        # responses can come back out of order, only a newer window may raise the count
+        if reset_at > self.reset_at or self.remaining is None:
+            self.remaining, self.reset_at = remaining, reset_at
+        else:
+            self.remaining = min(self.remaining, remaining)
+
+    def allows(self, needed: int, now: float) -> bool:
+        if self.remaining is not None and self.reset_at and now >= self.reset_at:
+            # window is over, the next response will tell us the new budget
+            self.remaining = None
+        return self.remaining is None or self.remaining >= needed
+
+    def spend(self):
+        if self.remaining is not None:
+            self.remaining -= 1
+
+
+class _Task:
+    def __init__(self, seq: int, endpoint: str, send: Callable, finish: Callable):
+        self.seq = seq
+        self.endpoint = endpoint
+        self.send = send
+        self.finish = finish
+        self.priority = priority_for(endpoint)
+        self.resource = resource_for(endpoint)
+        self.not_before = 0.0
+        self.queued_at = time.time()
+        self.attempt = 0
+        self.future = Future()
+
+
+class GitHubScheduler:
+    """
+    Runs GitHub requests on a few worker threads, in priority order, within the
+    rate limit budget. keeps track of X-RateLimit-Remaining per resource, holds
+    per-repo calls back when the budget is low, backs off on 403/429 and re-asks
+    contributor stats while GitHub is still computing them (202).
+    """
+
+    def __init__(self, max_workers: int = 8, low_budget: int = LOW_BUDGET_RESERVE, max_retries: int = MAX_RETRIES,
+                 backoff_base: float = BACKOFF_BASE, backoff_max: float = BACKOFF_MAX,
+                 low_max_wait: float = LOW_PRIORITY_MAX_WAIT):
+        self.max_workers = max(1, max_workers)
+        self.low_budget = low_budget
+        self.low_max_wait = low_max_wait
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.budgets: Dict[str, RateLimitBudget] = {name: RateLimitBudget() for name in ("core", "search", "graphql")}
+        self._pending: List[_Task] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+
+    def submit(self, endpoint: str, send: Callable[[], Any], finish: Callable[[Any], Any]) -> Future:
+        """
+        send() performs one attempt and returns the response, finish(response)
+        turns the final response into the future's result (or raises)
+        """
+        task = _Task(next(self._seq), endpoint, send, finish)
+        with self._cond:
+            self._start_workers()
+            self._pending.append(task)
+            self._cond.notify()
+        return task.future
+
+    def _start_workers(self):
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(target=self._work, name=f"github-{len(self._workers)}", daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    # --- picking the next request ---
+
+    def _reserve(self, budget: RateLimitBudget) -> int:
+        if budget.limit:
+            return min(self.low_budget, budget.limit // LOW_BUDGET_FRACTION)
+        return self.low_budget
+
+    def _needed(self, task: _Task) -> int:
+        return 1 if task.priority == PRIORITY_HIGH else self._reserve(self.budgets[task.resource]) + 1
+
+    def _expire_held(self, now: float):
+        """fails low priority tasks that have been waiting on the budget for too long"""
+        for t in list(self._pending):
+            waiting = now - max(t.queued_at, t.not_before)
+            if (t.priority == PRIORITY_LOW and t.not_before <= now and waiting > self.low_max_wait
+                    and not self.budgets[t.resource].allows(self._needed(t), now)):
+                self._pending.remove(t)
+                print(f"WARNING [GitHubScheduler]: rate limit budget too low, skipping {t.endpoint}")
+                t.future.set_exception(TimeoutError(f"held back by the rate limit for {waiting:.0f}s: {t.endpoint}"))
+
+    def _next_task(self) -> _Task:
+        with self._cond:
+            while True:
+                now = time.time()
+                self._expire_held(now)
+                ready = [t for t in self._pending
+                         if t.not_before <= now and self.budgets[t.resource].allows(self._needed(t), now)]
+                if ready:
+                    task = min(ready, key=lambda t: (t.priority, t.seq))
+                    self._pending.remove(task)
+                    self.budgets[task.resource].spend()
+                    return task
+                self._cond.wait(self._wait_time(now))
+
+    def _wait_time(self, now: float) -> Optional[float]:
+        if not self._pending:
+            return None
+        wake = [t.not_before for t in self._pending if t.not_before > now]
+        # held back per-repo calls are given up on once they've waited too long
+        wake += [d for d in (max(t.queued_at, t.not_before) + self.low_max_wait
+                             for t in self._pending if t.priority == PRIORITY_LOW) if d > now]
+        wake += [b.reset_at for b in self.budgets.values() if b.remaining is not None and b.reset_at > now]
+        # re-check at least every few seconds in case nothing tells us otherwise
+        return min([w - now for w in wake] + [5.0])
+
+    # --- running it ---
+
+    def _work(self):
+        while True:
+            task = self._next_task()
+            try:
+                response = task.send()
+            except BaseException as e:
+                task.future.set_exception(e)
+                continue
+
+            with self._cond:
+                self.budgets[task.resource].update(response.headers)
+                self._cond.notify_all()
+
+            delay = self._retry_delay(task, response)
+            if delay is not None and task.attempt < self.max_retries:
+                task.attempt += 1
+                task.not_before = time.time() + delay
+                with self._cond:
+                    self._pending.append(task)
+                    self._cond.notify()
+                continue
+
+            if response.status_code == 202:
+                print(f"WARNING [GitHubScheduler]: stats still not ready after {task.attempt} retries: {task.endpoint}")
+            try:
+                task.future.set_result(task.finish(response))
+            except BaseException as e:
+                task.future.set_exception(e)
+
+    def _backoff(self, attempt: int) -> float:
+        return min(self.backoff_base * (2 ** attempt), self.backoff_max)
+
+    def _retry_delay(self, task: _Task, response) -> Optional[float]:
+        """seconds to wait before asking again, or None if the response is final"""
+        status = response.status_code
+        if status == 202:
+            # GitHub is computing the stats in the background, ask again shortly
+            return self._backoff(task.attempt)
+
+        if status not in (403, 429):
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            return float(retry_after)
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            # primary limit, nothing to do until the window resets
+            reset_at = float(response.headers.get("X-RateLimit-Reset") or 0)
+            return max(reset_at - time.time(), 0.0) + self._backoff(0)
+        if status == 429 or "rate limit" in (response.text or "").lower():
+            # secondary rate limit, back off exponentially
+            return self._backoff(task.attempt)
+        # a plain 403 (no access) is final
+        return None
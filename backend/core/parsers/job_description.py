@@ -6,6 +6,8 @@ from typing import List, Dict, Optional, Union
 from docx import Document
 from pdfminer.high_level import extract_text
 
+from core.parsers.skill_matcher import SkillMatcher
+
 # help find sections in the text
 
 
@@ -92,48 +94,54 @@ def get_section(text, keywords):
     return found
 
 
-def find_skills(text, reqs, tech, resps=None):
-    # figure out what tech they want based on our data file
+_skill_matchers = {"mtime": None, "matchers": None}
+
+def _load_skill_matchers():
+    """
+    SkillMatchers for the languages and frameworks in skills_data.json, built once
+    and rebuilt only if update_skills() rewrites the file. None if there is no file.
+    """
     data_path = os.path.join(os.path.dirname(__file__), "skills_data.json")
-    
     if not os.path.exists(data_path):
-        return {"languages": [], "technology": [], "experience": [], "education": []}
+        return None
+
+    mtime = os.path.getmtime(data_path)
+    if _skill_matchers["mtime"] != mtime:
+        with open(data_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        matchers = {}
+        for category in ["languages", "frameworks"]:
+            # first spelling wins when the same skill is listed twice
+            originals = {}
+            for item in data.get(category, []):
+                originals.setdefault(item.lower(), item)
+            matchers[category] = (SkillMatcher(originals.keys(), boundary="token"), originals)
+
+        _skill_matchers["matchers"] = matchers
+        _skill_matchers["mtime"] = mtime
+    return _skill_matchers["matchers"]
 
-    with open(data_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
 
-    langs = set()
-    tools = set()
+def find_skills(text, reqs, tech, resps=None):
+    # figure out what tech they want based on our data file
+    matchers = _load_skill_matchers()
+    if matchers is None:
+        return {"languages": [], "technology": [], "experience": [], "education": []}
+
     # exp = []
     edu = []
 
     
     low_text = text.lower()
-    
-    def match_item(key, source):
-        # find the item but watch out for word boundaries
-        if any(c in key for c in ["+", "#", "."]):
-            return key in source
-        return re.search(r'(?<![\w-])' + re.escape(key) + r'(?![\w-])', source)
-
-    # check languages
-    seen_langs = set()
-    for l in data.get("languages", []):
-        low_l = l.lower()
-        if low_l not in seen_langs:
-            if match_item(low_l, low_text):
-                langs.add(l)
-                seen_langs.add(low_l)
-            
-    # check tools/frameworks
-    seen_tools = set()
-    for t in data.get("frameworks", []):
-        low_t = t.lower()
-        if low_t not in seen_tools:
-            if match_item(low_t, low_text):
-                tools.add(t)
-                seen_tools.add(low_t)
-    
+
+    # one pass per category, word boundaries are handled by the matcher
+    # (substring match for anything with +, # or . in it)
+    lang_matcher, lang_names = matchers["languages"]
+    tool_matcher, tool_names = matchers["frameworks"]
+    langs = {lang_names[k] for k in lang_matcher.find(low_text)}
+    tools = {tool_names[k] for k in tool_matcher.find(low_text)}
+
     # pull out years of experience
     # yrs = re.findall(r'(\d+(?:\s?-\s?\d+)?[\+]?\s?year[s]?(?:\s?of\s?experience)?)', text, re.IGNORECASE)
     # for y in yrs:
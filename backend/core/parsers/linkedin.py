@@ -1,23 +1,47 @@
 import os
+import json
+import time
 import requests
-from typing import Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Any, Callable, List
 from core.parsers.base import BaseDataSource
 
 APIFY_API_TOKEN = os.getenv("APIFY_API_TOKEN")
+APIFY_API_BASE = os.getenv("APIFY_API_BASE", "https://api.apify.com/v2")
+APIFY_ACTOR = "harvestapi~linkedin-profile-scraper"
+
+# actor start-up dominates a run, so batches share one run. batch runs are
+# started async and polled, run-sync gives up with a 408 after ~300s while the
+# run carries on (and bills), so a retry would pay for the same profiles twice
+LINKEDIN_BATCH_SIZE = int(os.getenv("LINKEDIN_BATCH_SIZE", "25"))
+LINKEDIN_BATCH_TIMEOUT = 600
+# seconds each status poll waits on the run (apify's waitForFinish, max 60)
+LINKEDIN_POLL_WAIT = 30
+APIFY_FINISHED = {"SUCCEEDED", "FAILED", "TIMED-OUT", "ABORTED"}
+# per-url runs for profiles a batch run didn't return
+LINKEDIN_FALLBACK_CONCURRENCY = 2
 
 def extract_linkedin_id(profile_url: str) -> str:
     return profile_url.rstrip("/").split("/")[-1]
 
 
-def linkedin_person_scrape(linkedin_url: str) -> Optional[Dict]:
-    apify_endpoint = f"https://api.apify.com/v2/acts/harvestapi~linkedin-profile-scraper/run-sync-get-dataset-items?token={APIFY_API_TOKEN}"
-    
-    payload = {
-        "urls": [linkedin_url],
+def _actor_payload(urls: List[str]) -> dict:
+    return {
+        "urls": urls,
         "profileScraperMode": "Profile details no email ($4 per 1k)",
         "proxy": { "useApifyProxy": True }
     }
 
+
+def _actor_endpoint() -> str:
+    return f"{APIFY_API_BASE}/acts/{APIFY_ACTOR}/run-sync-get-dataset-items?token={APIFY_API_TOKEN}"
+
+
+def linkedin_person_scrape(linkedin_url: str) -> Optional[Dict]:
+    apify_endpoint = _actor_endpoint()
+    
+    payload = _actor_payload([linkedin_url])
+
     response = requests.post(apify_endpoint, json=payload, timeout=120)
     response.raise_for_status()
     
@@ -31,6 +55,79 @@ def linkedin_person_scrape(linkedin_url: str) -> Optional[Dict]:
     return None
 
 
+def _profile_keys(item: dict) -> List[str]:
+    """ids a returned dataset item can be matched back to its input url by"""
+    keys = []
+    for field in ("publicIdentifier", "linkedinUrl", "url", "profileUrl", "originalQuery"):
+        val = item.get(field)
+        if isinstance(val, dict):
+            val = val.get("url") or val.get("query")
+        if val:
+            keys.append(extract_linkedin_id(str(val).split("?")[0]).lower())
+    return keys
+
+
+def _apify(method: str, path: str, **kwargs) -> requests.Response:
+    params = {"token": APIFY_API_TOKEN, **kwargs.pop("params", {})}
+    response = requests.request(method, f"{APIFY_API_BASE}{path}", params=params,
+                                timeout=LINKEDIN_POLL_WAIT + 30, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+def linkedin_batch_scrape(linkedin_urls: List[str], on_result: Optional[Callable[[str, Dict], None]] = None) -> Dict[str, Dict]:
+    """
+    one actor run for a list of profile urls. the run is started async and polled,
+    every poll reads the dataset items written since the last one, matches them back
+    to their url and hands them to on_result. returns url -> raw item for every url
+    the run returned. a run that doesn't succeed raises after its items are handed on,
+    one we stop waiting for is aborted so it stops billing.
+    """
+    by_id = {extract_linkedin_id(u).lower(): u for u in linkedin_urls}
+    found = {}
+
+    run = _apify("post", f"/acts/{APIFY_ACTOR}/runs", json=_actor_payload(linkedin_urls),
+                 params={"timeout": LINKEDIN_BATCH_TIMEOUT}).json()["data"]
+    status, offset = run["status"], 0
+    deadline = time.monotonic() + LINKEDIN_BATCH_TIMEOUT
+    try:
+        while True:
+            # status is read before the items, so once it's finished this read has all of them
+            finished = status in APIFY_FINISHED
+            items = _apify("get", f"/datasets/{run['defaultDatasetId']}/items",
+                           params={"format": "jsonl", "clean": "true", "offset": offset})
+            for line in items.iter_lines():
+                if not line:
+                    continue
+                offset += 1
+                item = json.loads(line)
+                url = next((by_id[k] for k in _profile_keys(item) if k in by_id), None)
+                if not url or url in found:
+                    continue
+                item["provider"] = "apify"
+                found[url] = item
+                if on_result:
+                    on_result(url, item)
+
+            if finished:
+                break
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"actor run {run['id']} still {status} after {LINKEDIN_BATCH_TIMEOUT}s")
+            status = _apify("get", f"/actor-runs/{run['id']}",
+                            params={"waitForFinish": LINKEDIN_POLL_WAIT}).json()["data"]["status"]
+    except BaseException:
+        try:
+            _apify("post", f"/actor-runs/{run['id']}/abort")
+        except Exception as e:
+            print(f"WARNING [LinkedIn]: could not abort actor run {run['id']}: {e}")
+        raise
+
+    print(f"[LinkedIn] Apify batch returned {len(found)}/{len(linkedin_urls)} profiles")
+    if status != "SUCCEEDED":
+        raise RuntimeError(f"actor run {run['id']} {status}")
+    return found
+
+
 def parse_linkedin_profile(data):
     if not data:
         return {}
@@ -127,3 +224,52 @@ class LinkedInDataSource(BaseDataSource):
             "source": self.name,
             **profile
         }
+
+    def process_batch(self, urls: List[str], on_result: Optional[Callable[[str, Any], None]] = None) -> Dict[str, Any]:
+        """
+        like process() for many urls, sharing one actor run per LINKEDIN_BATCH_SIZE
+        urls. profiles a batch run didn't return (or a failed run) get a run of their
+        own. returns url -> parsed profile, or the exception if that url failed too.
+        on_result(url, profile_or_exception) is called as soon as each one is known.
+        """
+        results = {}
+
+        def done(url, result):
+            results[url] = result
+            if on_result:
+                on_result(url, result)
+
+        pending = []
+        for url in dict.fromkeys(urls):
+            if self.validate_url(url):
+                pending.append(url)
+            else:
+                done(url, ValueError(f"Invalid URL for source {self.name}: {url}"))
+
+        def streamed(url, item):
+            # a profile that doesn't parse is that url's failure, not the batch's
+            try:
+                done(url, self.parse(item))
+            except Exception as e:
+                done(url, e)
+
+        missing = []
+        for i in range(0, len(pending), LINKEDIN_BATCH_SIZE):
+            chunk = pending[i:i + LINKEDIN_BATCH_SIZE]
+            try:
+                linkedin_batch_scrape(chunk, streamed)
+            except Exception as e:
+                print(f"WARNING [LinkedIn]: batch run failed, falling back to single runs: {e}")
+            # anything streamed before a failure is already done, only the rest get a run of their own
+            missing.extend(u for u in chunk if u not in results)
+
+        def single(url):
+            try:
+                done(url, self.process(url))
+            except Exception as e:
+                done(url, e)
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=LINKEDIN_FALLBACK_CONCURRENCY) as pool:
+                list(pool.map(single, missing))
+        return results
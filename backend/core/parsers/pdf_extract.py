@@ -0,0 +1,159 @@
+import os
+import time
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import pdfplumber
+
+# "pdfplumber" (default, what the parsers were tuned on) or "pdfium", a much
+# faster text-only engine (pypdfium2). links always come from pdfplumber's annots
+PDF_ENGINE = os.getenv("CV_PDF_ENGINE", "pdfplumber").lower()
+# nothing after this many pages is read, a CV that long is almost certainly not a CV
+PDF_MAX_PAGES = int(os.getenv("CV_PDF_MAX_PAGES", "20"))
+# pages are only spread over processes for documents at least this long,
+# for the usual 1-2 page CV the process hop costs more than it saves
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("CV_PDF_PARALLEL_MIN_PAGES", "4"))
+PDF_PAGE_WORKERS = int(os.getenv("CV_PDF_PAGE_WORKERS", str(min(4, os.cpu_count() or 1))))
+# pages slower than this get a warning, so pathological PDFs show up in the logs
+PDF_SLOW_PAGE_SECONDS = 2.0
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    # own pool rather than core.scoring.parallel's, those workers load the models on start
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            _pool = ProcessPoolExecutor(max_workers=PDF_PAGE_WORKERS, mp_context=ctx)
+        return _pool
+
+
+def _shutdown_pool():
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_shutdown_pool)
+
+
+def _resolve_engine(engine: Optional[str]) -> str:
+    engine = (engine or PDF_ENGINE).lower()
+    if engine == "pdfium" and pdfium is None:
+        print("WARNING [PDF]: pypdfium2 is not installed, using pdfplumber")
+        return "pdfplumber"
+    return engine
+
+
+def count_pages(path: str) -> int:
+    if pdfium is not None:
+        doc = pdfium.PdfDocument(path)
+        try:
+            return len(doc)
+        finally:
+            doc.close()
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+
+def _extract_pages(path: str, page_numbers: List[int], engine: str) -> List[Dict[str, Any]]:
+    """text and links for some pages of one PDF, runs in the caller or a pool worker"""
+    results = []
+    doc = pdfium.PdfDocument(path) if engine == "pdfium" else None
+    try:
+        with pdfplumber.open(path) as pdf:
+            for i in page_numbers:
+                start = time.perf_counter()
+                page = pdf.pages[i]
+                if doc is not None:
+                    text_page = doc[i].get_textpage()
+                    # pdfium uses \r\n line endings
+                    page_text = text_page.get_text_range().replace("\r\n", "\n").replace("\r", "\n")
+                    text_page.close()
+                else:
+                    page_text = page.extract_text()
+
+                # embedded hyperlinks
+                links = []
+                if page.annots:
+                    for annot in page.annots:
+                        uri = annot.get("uri")
+                        if uri:
+                            links.append(uri)
+
+                results.append({
+                    "page": i,
+                    "text": page_text,
+                    "links": links,
+                    "seconds": round(time.perf_counter() - start, 4)
+                })
+    finally:
+        if doc is not None:
+            doc.close()
+    return results
+
+
+def _split_pages(n_pages: int, parts: int) -> List[List[int]]:
+    # contiguous runs, so each worker walks its part of the document in order
+    size, extra = divmod(n_pages, parts)
+    chunks, start = [], 0
+    for i in range(parts):
+        end = start + size + (1 if i < extra else 0)
+        if end > start:
+            chunks.append(list(range(start, end)))
+        start = end
+    return chunks
+
+
+def extract_pdf(path: str, engine: Optional[str] = None, max_pages: Optional[int] = None,
+                workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    text, links and per-page timings for a PDF. long documents have their pages
+    split over a process pool, anything past max_pages is skipped.
+    """
+    engine = _resolve_engine(engine)
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+    workers = PDF_PAGE_WORKERS if workers is None else workers
+
+    start = time.perf_counter()
+    total_pages = count_pages(path)
+    n_pages = min(total_pages, max_pages) if max_pages else total_pages
+
+    if workers > 1 and n_pages >= PDF_PARALLEL_MIN_PAGES:
+        pool = _get_pool()
+        futures = [pool.submit(_extract_pages, path, chunk, engine) for chunk in _split_pages(n_pages, workers)]
+        pages = [p for f in futures for p in f.result()]
+    else:
+        pages = _extract_pages(path, list(range(n_pages)), engine)
+
+    for p in pages:
+        if p["seconds"] > PDF_SLOW_PAGE_SECONDS:
+            print(f"WARNING [PDF]: page {p['page'] + 1} of {os.path.basename(path)} took {p['seconds']:.1f}s")
+    if n_pages < total_pages:
+        print(f"WARNING [PDF]: {os.path.basename(path)} has {total_pages} pages, only the first {n_pages} were read")
+
+    return {
+        "text": "\n".join(p["text"] for p in pages if p["text"]),
+        "links": [link for p in pages for link in p["links"]],
+        "engine": engine,
+        "total_pages": total_pages,
+        "truncated": n_pages < total_pages,
+        "seconds": round(time.perf_counter() - start, 4),
+        "page_timings": [{"page": p["page"] + 1, "seconds": p["seconds"], "chars": len(p["text"] or "")} for p in pages]
+    }
+
+
+def extract_text_and_links_from_pdf(path: str) -> Tuple[str, List[str]]:
+    result = extract_pdf(path)
+    return result["text"], result["links"]
@@ -1,6 +1,6 @@
 from typing import Dict, Type
 from core.parsers.base import BaseDataSource
-from core.parsers.github import GitHubDataSource
+from core.parsers.github_graphql import github_data_source
 from core.parsers.linkedin import LinkedInDataSource
 
 # registry for data sources
@@ -13,7 +13,7 @@ class DataSourceRegistry:
         self._register_defaults()
 
     def _register_defaults(self):
-        self.register(GitHubDataSource())
+        self.register(github_data_source())
         self.register(LinkedInDataSource())
 
     def register(self, source: BaseDataSource):
@@ -0,0 +1,100 @@
+from collections import deque
+from typing import Dict, Iterable, List, Set
+
+
+def _is_word(ch: str) -> bool:
+    # same definition of a word character as re's \w
+    return ch.isalnum() or ch == "_"
+
+
+def _is_token(ch: str) -> bool:
+    # \w plus hyphens, so "front-end" doesn't count as "end"
+    return ch == "-" or _is_word(ch)
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of lowercase skill strings.
+    finds every skill in one pass over the text instead of one regex per skill.
+
+    boundary modes mirror the regexes the parsers used to build per skill:
+      "word"  - \\b on whichever end of the skill is alphanumeric (cv parser)
+      "token" - (?<![\\w-]) / (?![\\w-]) on both ends, plain substring
+                match for skills containing + # or . (job description parser)
+      "none"  - plain substring match, same as `term in text` (university names)
+    """
+
+    def __init__(self, terms: Iterable[str], boundary: str = "word"):
+        if boundary not in ("word", "token", "none"):
+            raise ValueError(f"unknown boundary mode: {boundary}")
+        self.boundary = boundary
+        self.terms = sorted({t for t in terms if t})
+
+        # per term: (check start, check end, is-blocking-char function)
+        self._rules = {}
+        for term in self.terms:
+            if boundary == "none":
+                self._rules[term] = (False, False, _is_word)
+            elif boundary == "word":
+                self._rules[term] = (term[0].isalnum(), term[-1].isalnum(), _is_word)
+            elif any(c in term for c in ["+", "#", "."]):
+                self._rules[term] = (False, False, _is_token)
+            else:
+                self._rules[term] = (True, True, _is_token)
+
+        self._build()
+
+    def _build(self):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[str]] = [[]]
+        for term in self.terms:
+            state = 0
+            for ch in term:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(term)
+
+        # breadth first so a state's fail link is always resolved before its children
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0) if goto[f].get(ch) != nxt else 0
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def _allowed(self, text: str, term: str, start: int, end: int) -> bool:
+        check_start, check_end, blocks = self._rules[term]
+        if check_start and start > 0 and blocks(text[start - 1]):
+            return False
+        if check_end and end < len(text) and blocks(text[end]):
+            return False
+        return True
+
+    def find(self, text: str) -> Set[str]:
+        """every term occurring in (already lowercased) text with valid boundaries"""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                for term in out[state]:
+                    if term not in found and self._allowed(text, term, i + 1 - len(term), i + 1):
+                        found.add(term)
+        return found
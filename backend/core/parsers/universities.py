@@ -0,0 +1,69 @@
+import os
+import json
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from core.parsers.skill_matcher import SkillMatcher
+
+UNIVERSITIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "universities_data.json")
+
+# generic words that mark a line as naming an institution even if it isn't in the json
+INSTITUTION_KEYWORDS = ["university", "college", "imperial", "institute", "polytechnic", "london academy", "ucl", "lse", "kcl"]
+
+
+class UniversityMatcher:
+    """
+    universities_data.json compiled once into a single automaton over the
+    lowercased names (known universities + every tier), so finding which ones a
+    line mentions and what tier a school is in is one pass over the text.
+    substring semantics, same as the `name.lower() in text` checks it replaces.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.universities: List[str] = [u.lower() for u in data.get("uk_universities", [])]
+        self.tiers: Dict[str, List[str]] = {t: [s.lower() for s in schools]
+                                            for t, schools in (data.get("tiers") or {}).items()}
+
+        # name -> rank of the first tier it is listed in, tiers keep json order
+        self._tier_rank: Dict[str, int] = {}
+        for rank, schools in enumerate(self.tiers.values()):
+            for s in schools:
+                self._tier_rank.setdefault(s, rank)
+        self._tier_names = list(self.tiers)
+
+        self._known = set(self.universities)
+        self._keywords = set(INSTITUTION_KEYWORDS)
+        self._matcher = SkillMatcher(self._known | set(self._tier_rank) | self._keywords, boundary="none")
+
+    def find(self, text: str) -> Set[str]:
+        """every known name or tier school mentioned in text (lowercased)"""
+        return {t for t in self._matcher.find(text.lower()) if t in self._known or t in self._tier_rank}
+
+    def is_institution(self, text: str) -> bool:
+        """text mentions a known university or a generic institution keyword"""
+        return any(t in self._known or t in self._keywords for t in self._matcher.find(text.lower()))
+
+    def tier_for(self, school: str) -> Optional[str]:
+        """best (first listed) tier with a school named in `school`, None if none are"""
+        ranks = [self._tier_rank[t] for t in self._matcher.find(school.lower()) if t in self._tier_rank]
+        return self._tier_names[min(ranks)] if ranks else None
+
+
+_matcher: Optional[UniversityMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def get_university_matcher() -> UniversityMatcher:
+    """shared matcher, the json is read once per process"""
+    global _matcher
+    if _matcher is None:
+        with _matcher_lock:
+            if _matcher is None:
+                try:
+                    with open(UNIVERSITIES_PATH, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except Exception as e:
+                    print(f"WARNING [Universities]: could not load {UNIVERSITIES_PATH}: {e}")
+                    data = {}
+                _matcher = UniversityMatcher(data)
+    return _matcher
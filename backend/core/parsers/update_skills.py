@@ -12,7 +12,7 @@ OUTPUT_FILE = os.path.join(os.path.dirname(__file__), "skills_data.json")
 def update_skills():
     print(f"Fetching skills data from {DEVICON_URL}...")
     try:
-        with urllib.request.urlopen(DEVICON_URL) as response:
+        with urllib.request.urlopen(DEVICON_URL, timeout=30) as response:
             data = json.loads(response.read().decode())
     except Exception as e:
         print(f"Error fetching data: {e}")
@@ -50,10 +50,15 @@ def update_skills():
         "frameworks": sorted(list(frameworks))
     }
 
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+    # written to a temp file and swapped in, this can run in the background
+    # while the parser is reading the file
+    tmp_path = f"{OUTPUT_FILE}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(output, f, indent=2)
+    os.replace(tmp_path, OUTPUT_FILE)
 
     print(f"Successfully updated skills_data.json at {OUTPUT_FILE}")
+    print("Rebuild the skill embedding index with `python -m core.scoring.skill_index`")
 
 if __name__ == "__main__":
     update_skills()
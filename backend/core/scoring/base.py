@@ -6,6 +6,16 @@ class BaseMetric(ABC):
     """
     Base class for all metrics. Every metric needs an ID, name and a calculate method.
     """
+
+    # set on metrics that scale against batch peaks (batch_max_*) or read the
+    # ranking config injected into candidate_data (active_keys, skill_weights).
+    # the batch engine only re-runs these once the batch context is known.
+    batch_relative: bool = False
+
+    # which data sources (CV, GitHub, LinkedIn) the metric actually reads.
+    # the shapley explainer reuses a metric's result across coalitions that only
+    # differ in sources it doesn't read, so only narrow this if it's really true.
+    sources_read: tuple = ("CV", "GitHub", "LinkedIn")
     
     @property
     @abstractmethod
@@ -0,0 +1,136 @@
+from typing import Dict, Any, List, Optional
+from .registry import ScoringRegistry, scoring_registry
+from .scoring_plan import RoutingTable
+
+# batch context keys -> (raw feature they are derived from, floor value)
+# the floors stop a weak batch from inflating everyone to 1.0
+BATCH_CONTEXT_FLOORS = {
+    "batch_max_tenure": ("raw_tenure_months", 60),
+    "batch_max_cv_tenure": ("raw_cv_tenure_months", 60),
+    "batch_max_li_tenure": ("raw_li_tenure_months", 60),
+    "batch_max_complexity": ("raw_gh_complexity", 1.0),
+    "batch_max_traction": ("raw_gh_traction", 0.5),
+    "batch_max_impact": ("raw_impact_points", 1.0),
+    "batch_max_repos": ("raw_repo_count", 5),
+    "batch_max_stars": ("raw_star_count", 0),
+    "batch_max_forks": ("raw_fork_count", 0),
+    "batch_max_connections": ("raw_connections", 1),
+    "batch_max_skill_count": ("raw_skill_count", 5),
+}
+
+
+class BatchScoringEngine:
+    """
+    Scores a batch of candidates against one JD.
+
+    The expensive, candidate-local metrics (regex scans, semantic matching, fusion)
+    only run once per candidate. Once every candidate has been seen we know the batch
+    peaks, so finalising is just re-running the cheap batch relative metrics.
+    """
+
+    def __init__(self, registry: Optional[ScoringRegistry] = None, explain: bool = True):
+        self.registry = registry or scoring_registry
+        self.explain = explain
+
+    def score_raw(self, candidate: Dict[str, Any], job_requirements: Dict[str, Any],
+                  active_metrics: Any, weights: Dict[str, float], routing: Optional[RoutingTable] = None) -> Dict[str, Any]:
+        """first pass: full run_all plus the raw features needed for the batch context"""
+        raw_scored_data = self.registry.run_all(candidate, job_requirements, active_metrics, weights, routing=routing)
+        self.extract_raw_features(candidate, raw_scored_data)
+        return raw_scored_data
+
+    def extract_raw_features(self, candidate: Dict[str, Any], raw_scored_data: Dict[str, Any]):
+        metrics = raw_scored_data["metrics"]
+        exp_metrics = metrics.get("experience", {})
+        candidate["raw_tenure_months"] = exp_metrics.get("raw_months") or 0
+        candidate["raw_cv_tenure_months"] = exp_metrics.get("raw_cv_months") or 0
+        candidate["raw_li_tenure_months"] = exp_metrics.get("raw_li_months") or 0
+        candidate["raw_gh_complexity"] = metrics.get("intel_github_complexity", {}).get("raw_complexity_sum") or 0
+        candidate["raw_gh_traction"] = metrics.get("projects", {}).get("raw_traction_points") or 0
+
+        gh_p = candidate.get("github_enriched", {}) or {}
+        li_p = candidate.get("linkedin_enriched", {}) or {}
+        repos = (gh_p.get("featured_projects") or []) or (gh_p.get("repositories") or [])
+
+        candidate["raw_star_count"] = gh_p.get("total_stars") or sum(p.get("stars", 0) for p in repos if p)
+        candidate["raw_fork_count"] = gh_p.get("total_forks") or sum(p.get("forks", 0) for p in repos if p)
+        candidate["raw_repo_count"] = gh_p.get("repo_count") or len(repos)
+        candidate["raw_impact_points"] = ((candidate.get("raw_star_count") or 0) * 1.0) + ((candidate.get("raw_fork_count") or 0) * 2.5)
+        candidate["raw_connections"] = li_p.get("connections", 0) or li_p.get("followers", 0) or 0
+
+        unique_skills = set([s.lower() for s in candidate.get('skills', []) if s])
+        candidate["raw_skill_count"] = len(unique_skills)
+
+    def compute_batch_context(self, candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """work out the batch peaks for relative scoring"""
+        return {
+            ctx_key: max([c.get(raw_key) or 0 for c in candidates] + [floor])
+            for ctx_key, (raw_key, floor) in BATCH_CONTEXT_FLOORS.items()
+        }
+
+    def finalise(self, candidate: Dict[str, Any], job_requirements: Dict[str, Any], active_metrics: Any,
+                 weights: Dict[str, float], raw_scored_data: Dict[str, Any], batch_context: Dict[str, Any],
+                 routing: Optional[RoutingTable] = None) -> Dict[str, Any]:
+        """second pass: apply the batch context and re-score only what depends on it"""
+        candidate.update(batch_context)
+        candidate["skill_weights"] = weights
+        candidate["active_keys"] = [k for k, v in active_metrics.items() if v is True] if isinstance(active_metrics, dict) else active_metrics
+
+        scored_data = self.registry.rescore(candidate, job_requirements, active_metrics, weights, raw_scored_data, routing=routing)
+
+        shapley_results = None
+        if self.explain:
+            from .explainability import ShapleyExplainer
+            explainer = ShapleyExplainer(self.registry)
+            shapley_results = explainer.calculate_contributions(candidate, job_requirements, active_metrics, weights, routing=routing)
+
+        return {"candidate": candidate, "scored_data": scored_data, "shapley": shapley_results}
+
+    def score_batch(self, candidates: List[Dict[str, Any]], job_requirements: Dict[str, Any],
+                    active_metrics: Any, weights: Dict[str, float], workers: int = 1,
+                    routing: Optional[RoutingTable] = None) -> List[Dict[str, Any]]:
+        """
+        Scores every candidate in the batch. Returns one entry per candidate (same order)
+        with the candidate, its scored_data and the shapley results (None if explain is off).
+        with workers > 1 both passes are sharded across a process pool. the workers use
+        the global scoring_registry, so this only applies to the default registry.
+        routing is an optional RoutingTable the caller is holding for this JD/config.
+        """
+        if workers > 1 and len(candidates) > 1 and self.registry is scoring_registry:
+            # workers compile their own routing table from the (cached) JD plan
+            return self._score_batch_parallel(candidates, job_requirements, active_metrics, weights, workers)
+
+        routing = self.registry.routing_table(job_requirements, active_metrics, routing)
+        raw_results = [self.score_raw(c, job_requirements, active_metrics, weights, routing) for c in candidates]
+        batch_context = self.compute_batch_context(candidates)
+        return [
+            self.finalise(c, job_requirements, active_metrics, weights, raw, batch_context, routing)
+            for c, raw in zip(candidates, raw_results)
+        ]
+
+    def _score_batch_parallel(self, candidates: List[Dict[str, Any]], job_requirements: Dict[str, Any],
+                              active_metrics: Any, weights: Dict[str, float], workers: int) -> List[Dict[str, Any]]:
+        from .parallel import chunk, parallel_map
+
+        # raw pass in the workers, candidates come back with their raw features attached
+        raw_pairs = parallel_map(_score_raw_chunk, chunk(candidates, workers), workers,
+                                 job_requirements, active_metrics, weights)
+        batch_context = self.compute_batch_context([c for c, _ in raw_pairs])
+
+        return parallel_map(_finalise_chunk, chunk(raw_pairs, workers), workers,
+                            job_requirements, active_metrics, weights, batch_context, self.explain)
+
+
+# process pool tasks (module level so they can be pickled)
+
+def _score_raw_chunk(candidates, job_requirements, active_metrics, weights):
+    engine = BatchScoringEngine(scoring_registry)
+    return [(c, engine.score_raw(c, job_requirements, active_metrics, weights)) for c in candidates]
+
+
+def _finalise_chunk(raw_pairs, job_requirements, active_metrics, weights, batch_context, explain):
+    engine = BatchScoringEngine(scoring_registry, explain=explain)
+    return [
+        engine.finalise(c, job_requirements, active_metrics, weights, raw, batch_context)
+        for c, raw in raw_pairs
+    ]
@@ -1,7 +1,7 @@
 import math
 import re
-from typing import List, Dict, Any
-from core.supabase import supabase
+from typing import List, Dict, Any, Optional
+from .market_index import MarketIndex, market_index
 
 # Backend significance band for suggested_weight (not the recruiter Likert).
 # Higher = more significant on this JD relative to other listed skills.
@@ -22,16 +22,13 @@ class WeightingEngine:
     Likert 1--5. The JD review UI inverts that band when showing priorities.
     """
     
-    def __init__(self):
-        self.corpus = []
+    def __init__(self, index: Optional[MarketIndex] = None):
+        self.index = index or market_index
         self._sync_corpus()
 
     def _sync_corpus(self):
-        """Pulls previous job descriptions from Supabase to use as a comparison baseline."""
-        # TODO: maybe use a search index later
-        response = supabase.table("job_requirements").select("description").execute()
-        if response.data:
-            self.corpus = [d["description"] for d in response.data if d.get("description")]
+        """Makes sure the local market index reflects the job descriptions in Supabase."""
+        self.index.ensure_synced()
 
     def _clean_and_tokenise(self, text: str) -> List[str]:
         if not text:
@@ -54,15 +51,17 @@ class WeightingEngine:
         if total_words == 0:
             return {s: {"weight": SIGNIFICANCE_MID, "reasoning": "Baseline (Empty JD)."} for s in skills}
 
-        num_docs = len(self.corpus) + 1 # + 1s are because current job
+        num_docs = self.index.corpus_size() + 1 # + 1s are because current job
+        jd_lower = jd_text.lower()
+
+        # market document frequencies are lookups in the local index
+        market_df = self.index.document_frequencies(skills)
         doc_frequencies = {s: 0 for s in skills}
         
         for s in skills:
             s_lower = s.lower()
-            for desc in self.corpus:
-                if s_lower in desc.lower():
-                    doc_frequencies[s] += 1
-            if s_lower in jd_text.lower():
+            doc_frequencies[s] = market_df[s_lower]
+            if s_lower in jd_lower:
                 doc_frequencies[s] += 1
 
         results = {}
@@ -70,7 +69,7 @@ class WeightingEngine:
             s_lower = s.lower()
             
             # job intensity (how many times JD mentions the skill)
-            mentions = jd_text.lower().count(s_lower)
+            mentions = jd_lower.count(s_lower)
             intensity = mentions / total_words
             
             # market scarcity (stored jobs in supabase)
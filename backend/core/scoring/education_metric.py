@@ -1,8 +1,11 @@
 from typing import Dict, Any, List, Optional
 from .base import BaseMetric
 from .constants import SCORING_CONSTANTS
+from core.parsers.universities import get_university_matcher
 
 class EducationMetric(BaseMetric):
+    sources_read = ("CV", "LinkedIn")
+
     @property
     def id(self) -> str:
         return "education"
@@ -59,22 +62,14 @@ class EducationMetric(BaseMetric):
 
 
         # university prestige and grades logic
-        import json, os
         cfg = SCORING_CONSTANTS["EDUCATION"]
         prestige_bonus = 0.0
         prestige_note = "Standard Institution"
         
-        try:
-            with open(os.path.join(os.path.dirname(__file__), "..", "parsers", "universities_data.json"), "r") as f:
-                uni_data = json.load(f)
-                tiers = uni_data.get("tiers", {})
-                for tier, schools in tiers.items():
-                    if any(s.lower() in best_school.lower() for s in schools):
-                        if tier == "tier_1": prestige_bonus, prestige_note = cfg["PRESTIGE_BONUS"]["TIER_1"], "Tier 1 (Global Elite)"
-                        elif tier == "tier_2": prestige_bonus, prestige_note = cfg["PRESTIGE_BONUS"]["TIER_2"], "Tier 2 (High Prestige)"
-                        elif tier == "tier_3": prestige_bonus, prestige_note = cfg["PRESTIGE_BONUS"]["TIER_3"], "Tier 3 (Russell Group)"
-                        break
-        except: pass
+        tier = get_university_matcher().tier_for(str(best_school))
+        if tier == "tier_1": prestige_bonus, prestige_note = cfg["PRESTIGE_BONUS"]["TIER_1"], "Tier 1 (Global Elite)"
+        elif tier == "tier_2": prestige_bonus, prestige_note = cfg["PRESTIGE_BONUS"]["TIER_2"], "Tier 2 (High Prestige)"
+        elif tier == "tier_3": prestige_bonus, prestige_note = cfg["PRESTIGE_BONUS"]["TIER_3"], "Tier 3 (Russell Group)"
 
         grade_cfg = cfg["GRADE_MULTIPLIER"]
         grade_multiplier = 0.0
@@ -1,6 +1,6 @@
-import copy
 from typing import Dict, Any, List, Optional
 import math
+from .scoring_plan import RoutingTable
 
 class ShapleyExplainer:
     """
@@ -17,13 +17,15 @@ class ShapleyExplainer:
         Returns a copy of candidate_data with only the active sources' data remaining.
         Ensures that even enriched/cached metadata is wiped if the source is inactive.
         """
-        masked = copy.deepcopy(candidate_data)
+        # shallow copy is enough: wiped keys get fresh containers and metrics
+        # never mutate the nested candidate data they read
+        masked = dict(candidate_data)
         
         # mapping of sources to their data keys and enriched metadata prefixes
         source_mapping = {
             "CV": {
                 "keys": ["name", "skills", "cv_experience", "experience", "projects_history", "projects", "extracurricular", 
-                         "experience_summary", "raw_cv_text", "full_cv_text", "cv_education"],
+                         "experience_summary", "raw_cv_text", "full_cv_text", "cv_education", "cv_text_index"],
                 "prefixes": ["raw_cv_"]
             },
             "GitHub": {
@@ -74,11 +76,68 @@ class ShapleyExplainer:
                             
         return masked
 
+    def _coalition_values_exact(self, candidate_data: Dict[str, Any], job_requirements: Dict[str, Any],
+                                active_metrics: Dict[str, bool], weights: Dict[str, float], coalition: List[str],
+                                routing: Optional[RoutingTable] = None) -> Dict[str, Any]:
+        """v(S) by re-running the whole pipeline on the masked candidate"""
+        masked_data = self._mask_candidate_data(candidate_data, coalition)
+        res = self.registry.run_all(masked_data, job_requirements, active_metrics, weights, routing=routing)
+        return {
+            "overall": res["overall_score"],
+            "metrics": {m_key: m_val.get("score", 0.0) for m_key, m_val in res["metrics"].items()}
+        }
+
+    def _coalition_values_incremental(self, candidate_data: Dict[str, Any], job_requirements: Dict[str, Any],
+                                      active_metrics: Dict[str, bool], weights: Dict[str, float], coalition: List[str],
+                                      metric_cache: Dict[tuple, Dict[str, Any]], audit_cache: Dict[bool, Dict[str, Any]],
+                                      routing: Optional[RoutingTable] = None) -> Dict[str, Any]:
+        """
+        v(S) assembled metric by metric. a metric only sees the sources it reads, so its
+        result for S is shared with every coalition that has the same overlap with those
+        sources (e.g. a GitHub-only metric is evaluated twice, not seven times).
+        mirrors run_all's ordering so metrics that read peer results still see the same state.
+        """
+        masked_data = self._mask_candidate_data(candidate_data, coalition)
+        masked_data["skill_metrics"] = {}
+        masked_data["skill_scores"] = {}
+        
+        results = {}
+        total_weight = 0.0
+        routing = self.registry.routing_table(job_requirements, active_metrics, routing)
+        plan = routing.plan
+        for key, metric, active_items in routing.routes:
+            cache_key = (key, tuple(s for s in self.sources if s in coalition and s in metric.sources_read))
+            merged_res = metric_cache.get(cache_key)
+            if merged_res is None:
+                # the metric level stuffing audit only depends on the CV text
+                has_cv = "CV" in coalition
+                if has_cv not in audit_cache:
+                    audit_cache[has_cv] = self.registry.metric_stuffing_audit(masked_data, job_requirements, plan)
+                merged_res = self.registry.score_metric(key, metric, masked_data, job_requirements, weights, audit_cache[has_cv], active_items)
+                metric_cache[cache_key] = merged_res
+            
+            results[key] = merged_res
+            total_weight += merged_res["weight"]
+            masked_data["skill_metrics"][key] = merged_res
+            masked_data["skill_scores"][key] = merged_res["score"]
+
+        identity_penalty = self.registry.identity_audit(masked_data)["penalty"]
+        combined = self.registry.combine_scores(results, total_weight, identity_penalty)
+        return {
+            "overall": combined["overall_score"],
+            "metrics": {m_key: m_val.get("score", 0.0) for m_key, m_val in results.items()}
+        }
+
     def calculate_contributions(self, candidate_data: Dict[str, Any], job_requirements: Dict[str, Any], 
-                               active_metrics: Dict[str, bool], weights: Dict[str, float]) -> Dict[str, Any]:
+                               active_metrics: Dict[str, bool], weights: Dict[str, float],
+                               mode: str = "incremental", routing: Optional[RoutingTable] = None) -> Dict[str, Any]:
         """
         Calculates Shapley values for each source.
+        mode="incremental" reuses per-metric results across coalitions, mode="exact"
+        re-runs the full pipeline for every coalition. both give identical values.
+        routing is an optional RoutingTable for this JD/config, shared by every coalition.
         """
+        routing = self.registry.routing_table(job_requirements, active_metrics, routing)
         candidate_name = candidate_data.get("name", "Unknown")
         # define all 2^3 = 8 permutations (coalitions of sources)
         coalitions = [
@@ -95,10 +154,11 @@ class ShapleyExplainer:
         # calculate v(S) for each coalition
         v_overall = {}
         v_metrics = {} # { metric_key: { subset_key: score } }
+        metric_cache = {}
+        audit_cache = {}
         
         for coalition in coalitions:
             subset_key = tuple(sorted(coalition))
-            masked_data = self._mask_candidate_data(candidate_data, coalition)
             
             if not coalition:
                 # mathematically force empty coalition to 0.0
@@ -109,13 +169,17 @@ class ShapleyExplainer:
                         v_metrics[m_key] = {}
                     v_metrics[m_key][subset_key] = 0.0
             else:
-                res = self.registry.run_all(masked_data, job_requirements, active_metrics, weights)
-                score = res["overall_score"]
+                if mode == "exact":
+                    values = self._coalition_values_exact(candidate_data, job_requirements, active_metrics, weights, coalition, routing)
+                else:
+                    values = self._coalition_values_incremental(candidate_data, job_requirements, active_metrics, weights,
+                                                                coalition, metric_cache, audit_cache, routing)
+                score = values["overall"]
                 
-                for m_key, m_val in res["metrics"].items():
+                for m_key, m_score in values["metrics"].items():
                     if m_key not in v_metrics:
                         v_metrics[m_key] = {}
-                    v_metrics[m_key][subset_key] = m_val.get("score", 0.0)
+                    v_metrics[m_key][subset_key] = m_score
 
             v_overall[subset_key] = score
 
@@ -6,6 +6,9 @@ from .constants import SCORING_CONSTANTS
 from core.fusion.bayesian import BayesianEvidenceFusion, Evidence
 
 class ExperienceMetric(BaseMetric):
+    batch_relative = True
+    sources_read = ("CV", "LinkedIn")
+
     def _fuse_evidence(self, evidence: List[Evidence]) -> Dict[str, Any]:
         fusion = BayesianEvidenceFusion(
             prior_alpha=SCORING_CONSTANTS["FUSION"]["PRIORS"]["ALPHA"],
@@ -204,6 +207,9 @@ class ExperienceMetric(BaseMetric):
         }
 
 class ProjectsMetric(BaseMetric):
+    batch_relative = True
+    sources_read = ("CV", "GitHub")
+
     @property
     def id(self) -> str:
         return "projects"
@@ -339,6 +345,9 @@ class ProjectsMetric(BaseMetric):
         }
 
 class TechSkillsMetric(BaseMetric):
+    batch_relative = True
+    sources_read = ("CV",)
+
     @property
     def id(self) -> str:
         return "techSkills"
@@ -432,6 +441,9 @@ class TechSkillsMetric(BaseMetric):
         }
 
 class GithubComplexityMetric(BaseMetric):
+    batch_relative = True
+    sources_read = ("GitHub",)
+
     @property
     def id(self) -> str:
         return "intel_github_complexity"
@@ -527,6 +539,8 @@ class GithubComplexityMetric(BaseMetric):
 
 
 class GithubAlignmentMetric(BaseMetric):
+    batch_relative = True
+
     @property
     def id(self) -> str:
         return "intel_github_alignment"
@@ -761,6 +775,9 @@ class GithubAlignmentMetric(BaseMetric):
         }
 
 class GithubImpactMetric(BaseMetric):
+    batch_relative = True
+    sources_read = ("GitHub",)
+
     @property
     def id(self) -> str:
         return "intel_github_impact"
@@ -826,6 +843,8 @@ class GithubImpactMetric(BaseMetric):
         }
 
 class LinkedinExtracurricularMetric(BaseMetric):
+    sources_read = ("CV", "LinkedIn")
+
     @property
     def id(self) -> str:
         return "intel_linkedin_extracurricular"
@@ -866,6 +885,9 @@ class LinkedinExtracurricularMetric(BaseMetric):
         }
 
 class LinkedinNetworkMetric(BaseMetric):
+    batch_relative = True
+    sources_read = ("LinkedIn",)
+
     @property
     def id(self) -> str:
         return "intel_linkedin_network"
@@ -1,6 +1,6 @@
-import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .constants import SCORING_CONSTANTS
+from .text_index import CVTextIndex
 
 class KeywordStuffingDetector:
     """
@@ -15,26 +15,25 @@ class KeywordStuffingDetector:
             "MAX_TOTAL_PENALTY": 0.3
         })
 
-    def analyze(self, cv_text: str, target_keywords: List[str]) -> Dict[str, Any]:
+    def analyze(self, cv_text: str, target_keywords: List[str], text_index: Optional[CVTextIndex] = None) -> Dict[str, Any]:
         """
-        checks the cv text for too much repetition
+        checks the cv text for too much repetition.
+        pass the candidate's CVTextIndex to reuse its token counts.
         """
         if not cv_text or not target_keywords:
             return {"penalty": 0.0, "flagged_terms": [], "is_stuffed": False}
 
-        cv_text_lower = cv_text.lower()
+        if text_index is None or text_index.text != cv_text:
+            text_index = CVTextIndex(cv_text)
         # clean the text to work out the density
-        words = re.findall(r'\w+', cv_text_lower)
-        total_word_count = len(words)
+        total_word_count = text_index.word_count
         
         flagged_terms = []
         total_penalty = 0.0
 
         for keyword in target_keywords:
-            keyword_lower = keyword.lower()
             # only match whole words so we don't mix up 'Java' and 'JavaScript'
-            pattern = rf'\b{re.escape(keyword_lower)}\b'
-            occurrences = len(re.findall(pattern, cv_text_lower))
+            occurrences = text_index.count(keyword)
             
             if occurrences <= 0:
                 continue
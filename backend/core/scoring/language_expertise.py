@@ -1,6 +1,7 @@
 import math
 from typing import Dict, Any, List, Optional
 from .base import BaseMetric
+from .text_index import CVTextIndex, get_cv_text_index
 from .constants import SCORING_CONSTANTS
 from .semantic_utils import semantic_matcher
 from core.fusion.bayesian import Evidence
@@ -77,14 +78,10 @@ class LanguageExpertiseMetric(BaseMetric):
         
         return max(0.2, decay_mult), f"Legacy Skill ({int(years_since)}+ years since last activity)"
 
-    def _count_mentions(self, lang: str, cv_text: str) -> int:
-        if not cv_text: return 0
-        import re
-        lang_lower = lang.lower()
-
-        # count occurrences with word boundaries to avoid substrings
-        pattern = rf"\b{re.escape(lang_lower)}\b"
-        return len(re.findall(pattern, cv_text.lower()))
+    def _count_mentions(self, lang: str, text_index: CVTextIndex) -> int:
+        # whole word occurrences, looked up in the shared CV text index
+        if not text_index.lower: return 0
+        return text_index.count(lang)
         
     def calculate(self, candidate_data: Dict[str, Any], job_requirements: Dict[str, Any], active_items: Optional[List[str]] = None, **kwargs) -> Dict[str, Any]:
         import datetime
@@ -193,8 +190,8 @@ class LanguageExpertiseMetric(BaseMetric):
             gh_score = min(1.0, (gh_pct / cfg["GH_VERIFICATION_THRESHOLD"]) * gh_decay)
             
             # cv signal (how many times they mention it)
-            cv_text = candidate_data.get("raw_cv_text") or candidate_data.get("full_cv_text") or ""
-            mentions = self._count_mentions(lang_val, cv_text)
+            cv_index = get_cv_text_index(candidate_data)
+            mentions = self._count_mentions(lang_val, cv_index)
 
             
             cv_score = 0.0
@@ -205,7 +202,7 @@ class LanguageExpertiseMetric(BaseMetric):
                 best_semantic = semantic_matcher.find_best_match(lang_val, list(set(cv_skills)), threshold=0.50)
 
                 if best_semantic["match"]:
-                    semantic_mentions = self._count_mentions(best_semantic["match"], cv_text)
+                    semantic_mentions = self._count_mentions(best_semantic["match"], cv_index)
                     cv_score = min(0.60, semantic_mentions * 0.15)
                     mentions = semantic_mentions # store for explanation block
             
@@ -0,0 +1,156 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.utils.cache import CACHE_DIR
+
+INDEX_PATH = os.getenv("MARKET_INDEX_PATH", os.path.join(CACHE_DIR, "market_index.sqlite3"))
+
+
+class MarketIndex:
+    """
+    Local document frequency index over the stored job descriptions (the 'market'
+    baseline for WeightingEngine). Keeps every description lowercased plus a
+    skill -> df table, so IDF lookups don't need the whole corpus.
+
+    df keeps the original substring semantics (skill in description.lower()). a skill
+    seen for the first time is counted once against the stored documents, after that
+    it is kept up to date as JDs are saved, edited and deleted.
+    """
+
+    def __init__(self, path: str = INDEX_PATH):
+        self.path = path
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def _connect(self):
+        """short lived connection, committed (or rolled back) and closed on exit"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            conn.execute("CREATE TABLE IF NOT EXISTS documents (id TEXT PRIMARY KEY, body TEXT NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS skill_df (skill TEXT PRIMARY KEY, df INTEGER NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # --- sync with supabase ---
+
+    def _remote_rows(self) -> List[Dict[str, Any]]:
+        from core.supabase import supabase
+        response = supabase.table("job_requirements").select("id, description").execute()
+        return response.data or []
+
+    def _remote_count(self) -> Optional[int]:
+        from core.supabase import supabase
+        response = supabase.table("job_requirements").select("id", count="exact").limit(1).execute()
+        return response.count
+
+    def ensure_synced(self):
+        """
+        builds the index from Supabase the first time, and again if the row count has
+        drifted (e.g. JDs written by something other than this backend).
+        falls back to whatever is stored locally if Supabase can't be reached.
+        """
+        with self._lock:
+            local = self.document_count()
+            synced = self._get_meta("synced") == "1"
+            try:
+                if synced and self._remote_count() == local:
+                    return
+                self.rebuild({r["id"]: r.get("description") for r in self._remote_rows()})
+            except Exception as e:
+                print(f"WARNING [MarketIndex]: could not sync with Supabase, using local index: {e}")
+
+    def rebuild(self, documents: Dict[Any, Optional[str]]):
+        """replaces the whole corpus, the df table is rebuilt lazily"""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM documents")
+            conn.execute("DELETE FROM skill_df")
+            conn.executemany("INSERT INTO documents (id, body) VALUES (?, ?)",
+                             [(str(doc_id), (desc or "").lower()) for doc_id, desc in documents.items()])
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('synced', '1')")
+
+    def clear(self):
+        self.rebuild({})
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    # --- incremental updates ---
+
+    def _shift_df(self, conn: sqlite3.Connection, body: str, delta: int):
+        # every indexed skill contained in this document moves by delta
+        if not body:
+            return
+        skills = [s for (s,) in conn.execute("SELECT skill FROM skill_df")]
+        hits = [(delta, s) for s in skills if s in body]
+        conn.executemany("UPDATE skill_df SET df = df + ? WHERE skill = ?", hits)
+
+    def add_document(self, doc_id: Any, description: Optional[str]):
+        """called when a JD is saved (or edited, it replaces the previous text)"""
+        body = (description or "").lower()
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT body FROM documents WHERE id = ?", (str(doc_id),)).fetchone()
+            if row:
+                self._shift_df(conn, row[0], -1)
+            conn.execute("INSERT OR REPLACE INTO documents (id, body) VALUES (?, ?)", (str(doc_id), body))
+            self._shift_df(conn, body, 1)
+
+    def update_document(self, doc_id: Any, description: Optional[str]):
+        self.add_document(doc_id, description)
+
+    def remove_document(self, doc_id: Any):
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT body FROM documents WHERE id = ?", (str(doc_id),)).fetchone()
+            if row:
+                self._shift_df(conn, row[0], -1)
+                conn.execute("DELETE FROM documents WHERE id = ?", (str(doc_id),))
+
+    # --- lookups ---
+
+    def document_count(self) -> int:
+        """every stored row, including ones without a description"""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def corpus_size(self) -> int:
+        """documents that actually have a description"""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM documents WHERE body != ''").fetchone()[0]
+
+    def document_frequencies(self, skills: Iterable[str]) -> Dict[str, int]:
+        """df per lowercased skill, counting any skill not indexed yet on the way"""
+        wanted = list(dict.fromkeys(s.lower() for s in skills))
+        with self._lock, self._connect() as conn:
+            found = {}
+            for skill in wanted:
+                row = conn.execute("SELECT df FROM skill_df WHERE skill = ?", (skill,)).fetchone()
+                if row is None:
+                    df = conn.execute("SELECT COUNT(*) FROM documents WHERE body != '' AND instr(body, ?) > 0",
+                                      (skill,)).fetchone()[0]
+                    conn.execute("INSERT INTO skill_df (skill, df) VALUES (?, ?)", (skill, df))
+                    found[skill] = df
+                else:
+                    found[skill] = row[0]
+        return found
+
+
+# shared instance used by WeightingEngine and the JD routes
+market_index = MarketIndex()
+
+
+def index_rows(rows: Optional[List[Dict[str, Any]]]):
+    """keeps the shared index in step with job_requirements rows the JD routes just saved"""
+    try:
+        for row in rows or []:
+            if row.get("id") is not None:
+                market_index.add_document(row["id"], row.get("description"))
+    except Exception as e:
+        print(f"WARNING [MarketIndex]: could not index job description: {e}")
@@ -0,0 +1,82 @@
+import os
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional
+
+# upper bound on ?workers=N, every worker holds its own copy of the models
+SCORING_MAX_WORKERS = int(os.getenv("SCORING_MAX_WORKERS", str(os.cpu_count() or 1)))
+
+# one pool, kept alive between requests so the models only get loaded once per
+# worker process rather than once per batch. grown when a bigger batch asks for more
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def _init_worker():
+    # load everything the metrics need (incl. the SentenceTransformer behind
+    # semantic_matcher) once per worker, the models are lazy otherwise
+    from core.scoring.registry import scoring_registry  # noqa: F401
+    from core.scoring.semantic_utils import semantic_matcher
+    semantic_matcher.warm_up()
+
+
+def clamp_workers(workers: Optional[int]) -> int:
+    """requested worker count limited to 1..SCORING_MAX_WORKERS"""
+    return max(1, min(workers or 1, SCORING_MAX_WORKERS))
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Returns the shared process pool, with at least `workers` workers (clamped).
+    uses spawn rather than fork, forking a process that already has torch
+    (and flask's threads) loaded is asking for deadlocks.
+    """
+    global _pool, _pool_workers
+    workers = clamp_workers(workers)
+    with _pool_lock:
+        if _pool is None or workers > _pool_workers:
+            if _pool is not None:
+                # anything already submitted to the old pool still runs to completion
+                _pool.shutdown(wait=False)
+            ctx = multiprocessing.get_context("spawn")
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker)
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pools():
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool, _pool_workers = None, 0
+
+
+atexit.register(shutdown_pools)
+
+
+def chunk(items: List[Any], workers: int, per_worker: int = 4) -> List[List[Any]]:
+    """splits items into ordered chunks, a few per worker so slow CVs even out"""
+    if not items:
+        return []
+    n_chunks = max(1, min(len(items), workers * per_worker))
+    size, extra = divmod(len(items), n_chunks)
+    chunks, start = [], 0
+    for i in range(n_chunks):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def parallel_map(fn, chunks: List[List[Any]], workers: int, *args) -> List[Any]:
+    """runs fn(chunk, *args) for every chunk on the pool and flattens the results in order"""
+    pool = get_pool(workers)
+    futures = [pool.submit(fn, c, *args) for c in chunks]
+    results = []
+    for f in futures:
+        results.extend(f.result())
+    return results
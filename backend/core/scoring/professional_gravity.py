@@ -3,6 +3,8 @@ from .base import BaseMetric
 from .constants import SCORING_CONSTANTS
 
 class ProfessionalGravityMetric(BaseMetric):
+    sources_read = ("CV", "LinkedIn")
+
     @property
     def id(self) -> str:
         return "professional_gravity"
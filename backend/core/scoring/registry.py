@@ -1,5 +1,7 @@
 from typing import Dict, Any, List, Optional
 import re
+import threading
+from collections import OrderedDict
 from .base import BaseMetric
 from .language_expertise import LanguageExpertiseMetric
 from .technology_stack import TechnologyStackMetric
@@ -12,10 +14,17 @@ from .intelligence_metrics import (
     LinkedinExtracurricularMetric, LinkedinNetworkMetric
 )
 from .keyword_stuffing import KeywordStuffingDetector
+from .text_index import get_cv_text_index
+from .scoring_plan import ScoringPlan, RoutingTable, jd_fingerprint
 
 class ScoringRegistry:
+    # compiled JD plans kept around, one per distinct JD
+    PLAN_CACHE_SIZE = 32
+
     def __init__(self):
         self.metric_templates: Dict[str, BaseMetric] = {}
+        self._plans: "OrderedDict[str, ScoringPlan]" = OrderedDict()
+        self._plans_lock = threading.Lock()
         # Register core templates
         self.register(LanguageExpertiseMetric())
         self.register(TechnologyStackMetric())
@@ -38,67 +47,159 @@ class ScoringRegistry:
 
     def register(self, metric: BaseMetric):
         self.metric_templates[metric.id] = metric
+        # routing may change, recompile plans on next use
+        with self._plans_lock:
+            self._plans.clear()
+
+    def plan_for(self, job_requirements: Dict[str, Any]) -> ScoringPlan:
+        """
+        The compiled ScoringPlan for a JD, cached by its content hash so every
+        candidate in a batch (and every Shapley coalition) shares the JD work.
+        """
+        fingerprint = jd_fingerprint(job_requirements)
+        with self._plans_lock:
+            plan = self._plans.get(fingerprint)
+            if plan is not None:
+                self._plans.move_to_end(fingerprint)
+                return plan
+
+        plan = ScoringPlan(self.metric_templates, job_requirements, fingerprint)
+        with self._plans_lock:
+            self._plans[fingerprint] = plan
+            while len(self._plans) > self.PLAN_CACHE_SIZE:
+                self._plans.popitem(last=False)
+        return plan
 
     def _get_metric_for_key(self, key: str, job_requirements: Dict[str, Any]) -> Optional[BaseMetric]:
         """
         Determines which metric template should handle a specific config key.
         """
-        # check for a direct match first
-        if key in self.metric_templates:
-            return self.metric_templates[key]
-        
-        # requirement keys (e.g. 'req_python', 'req_AWS')
-        if key.startswith("req_"):
-            # Try to find which category this requirement belongs to in the JD
-            clean_name = key.replace("req_", "").replace("_", " ").lower()
-            jd_metrics = job_requirements.get("metrics", {})
-            
-            # TODO: at some point, get rid of experience, responsibilities and requirements since they are unused
-            # Helper to extract names from potentially complex JD value lists
-            def extract_names(items):
-                names = []
-                for item in items:
-                    if isinstance(item, dict):
-
-                        val = item.get("value") or item.get("name") or ""
-                        names.append(str(val).lower())
-                    else:
-                        names.append(str(item).lower())
-                return names
-
-            langs = extract_names(jd_metrics.get("Languages", {}).get("value", []))
-            if clean_name in langs:
-                return self.metric_templates.get("languages")
-            
-            techs = extract_names(jd_metrics.get("Technologies", {}).get("value", []))
-            if any(clean_name in t or t in clean_name for t in techs):
-                return self.metric_templates.get("technologies")
-            
-            # soft = extract_names(jd_metrics.get("Soft Skills", {}).get("value", []))
-            # if any(clean_name in s or s in clean_name for s in soft):
-            #     return self.metric_templates.get("soft_skills")
+        return self.plan_for(job_requirements).metric_for_key(key)
 
-                
-            # Default to tech stack if unknown requirement
-            return self.metric_templates.get("technologies")
-
-        return None
+    def routing_table(self, job_requirements: Dict[str, Any], active_metrics: Any,
+                      table: Optional[RoutingTable] = None) -> RoutingTable:
+        """
+        RoutingTable for this JD and config. hand back a table you are holding and it
+        is reused as long as neither the JD content nor the active keys have changed.
+        """
+        plan = self.plan_for(job_requirements)
+        keys_to_run = self.resolve_keys(active_metrics)
+        if table is not None and table.matches(plan, keys_to_run):
+            return table
+        return plan.routing_table(keys_to_run)
 
     def run_all(self, candidate_data: Dict[str, Any], job_requirements: Dict[str, Any], 
-                active_metrics: Optional[Dict[str, bool]] = None, weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+                active_metrics: Optional[Dict[str, bool]] = None, weights: Optional[Dict[str, float]] = None,
+                routing: Optional[RoutingTable] = None) -> Dict[str, Any]:
         """
         Runs all active metrics and maps them to the provided weights.
         """
+        return self._score(candidate_data, job_requirements, active_metrics, weights, routing=routing)
+
+    def rescore(self, candidate_data: Dict[str, Any], job_requirements: Dict[str, Any],
+                active_metrics: Optional[Dict[str, bool]], weights: Optional[Dict[str, float]],
+                previous: Dict[str, Any], routing: Optional[RoutingTable] = None) -> Dict[str, Any]:
+        """
+        Same as run_all, but only re-runs the batch relative metrics. everything else
+        is carried over from a previous run_all result for the same candidate and JD.
+        """
+        return self._score(candidate_data, job_requirements, active_metrics, weights,
+                           reuse=previous.get("metrics") or {}, routing=routing)
+
+    def resolve_keys(self, active_metrics: Any) -> List[str]:
+        """config keys that should actually be scored, in config order"""
+        # Handle active_metrics as a dict (as provided in user example)
+        if isinstance(active_metrics, dict):
+            return [k for k, v in active_metrics.items() if v is True]
+        # Fallback for list-based active_metrics
+        return active_metrics if active_metrics else list(self.metric_templates.keys())
+
+    def metric_stuffing_audit(self, candidate_data: Dict[str, Any], job_requirements: Dict[str, Any],
+                              plan: Optional[ScoringPlan] = None) -> Dict[str, Any]:
+        """stuffing audit handed to the individual metrics (JD languages/technologies only)"""
+        target_keywords = (plan or self.plan_for(job_requirements)).metric_keywords
+        cv_index = get_cv_text_index(candidate_data)
+        return self.stuffing_detector.analyze(cv_index.text, target_keywords, cv_index)
+
+    def score_metric(self, key: str, metric: BaseMetric, candidate_data: Dict[str, Any], job_requirements: Dict[str, Any],
+                     weights: Optional[Dict[str, float]], stuffing_audit: Dict[str, Any],
+                     active_items: Optional[List[str]] = None) -> Dict[str, Any]:
+        """runs a single metric and merges in the weight, capped score and display fields"""
+        from .constants import SCORING_CONSTANTS
+        integrity_cfg = SCORING_CONSTANTS.get("INTEGRITY", {"SQUATTER_PENALTY": 0.2, "SCORE_CAP": 1.0})
+
+        if active_items is None and key.startswith("req_"):
+            clean_name = key.replace("req_", "").replace("_", " ")
+            active_items = [clean_name]
+
+        raw_weight = weights.get(key, 0.0) if (weights and weights.get(key) is not None) else 0.0
+        res = metric.calculate(candidate_data, job_requirements, active_items=active_items, stuffing_audit=stuffing_audit) or {}
+
+        # CRITICAL FIX: Cap individual metric scores at 1.0 to prevent total > 100%
+        metric_score = min(integrity_cfg.get("SCORE_CAP", 1.0), float(res.get("score") or 0.0))
+
+        merged_res = {**res}
+        merged_res.update({
+            "name": active_items[0] if (active_items and len(active_items) > 0) else (metric.name if metric else "Unknown Metric"),
+            "weight": raw_weight,
+            "score": metric_score,
+            "formula": res.get("calculation_formula", "Simple Weighted Average"),
+            "technical_formula": res.get("technical_formula", ""),
+            "glossary": res.get("glossary", []),
+            "breakdown": res.get("breakdown", []),
+            "sources_used": res.get("sources_used", []),
+            "improvements": res.get("improvements", [])
+        })
+        return merged_res
+
+    def identity_audit(self, candidate_data: Dict[str, Any]) -> Dict[str, Any]:
+        """squatter check between the CV name and the GitHub profile name"""
+        from .constants import SCORING_CONSTANTS
+        integrity_cfg = SCORING_CONSTANTS.get("INTEGRITY", {"SQUATTER_PENALTY": 0.2, "SCORE_CAP": 1.0})
+
+        import difflib
+        cv_name = str(candidate_data.get("name", "")).lower().strip()
+        gh_profile = candidate_data.get("github_enriched") or candidate_data.get("github_profile") or {}
+        gh_name = str(gh_profile.get("name", "")).lower().strip()
+        
+        identity_penalty = 0.0
+        similarity = 1.0
+        
+        # Only apply squatter penalty if we actually found a name on the profile
+        # to avoid penalising missing data as a mismatch.
+        valid_gh_name = gh_name and gh_name != "none" and len(gh_name) > 2
+        
+        if valid_gh_name and cv_name:
+            similarity = difflib.SequenceMatcher(None, cv_name, gh_name).ratio()
+            # If similarity < 70% and no substring match, apply the Veto
+            if similarity < 0.7 and cv_name not in gh_name and gh_name not in cv_name:
+                identity_penalty = integrity_cfg.get("SQUATTER_PENALTY", 0.20)
+
+        return {"penalty": identity_penalty, "similarity": similarity, "cv_name": cv_name, "gh_name": gh_name}
+
+    def combine_scores(self, results: Dict[str, Any], total_weight: float, identity_penalty: float) -> Dict[str, float]:
+        """weighted average of the metric scores with the identity veto taken off"""
+        weighted_sum = sum((m.get("score") or 0.0) * (m.get("weight") or 0.0) for m in results.values())
+        raw_average = weighted_sum / total_weight if total_weight > 0 else 0.0
+        
+        # apply global identity veto (deduct from the average)
+        final_adjusted_score = max(0.0, raw_average - identity_penalty)
+        return {
+            "weighted_sum": weighted_sum,
+            "raw_average": raw_average,
+            "final_adjusted_score": final_adjusted_score,
+            "overall_score": round(final_adjusted_score, 3)
+        }
+
+    def _score(self, candidate_data: Dict[str, Any], job_requirements: Dict[str, Any],
+               active_metrics: Optional[Dict[str, bool]] = None, weights: Optional[Dict[str, float]] = None,
+               reuse: Optional[Dict[str, Any]] = None, routing: Optional[RoutingTable] = None) -> Dict[str, Any]:
         results = {}
         total_weighted_score = 0.0
         total_weight = 0.0
 
-        # Handle active_metrics as a dict (as provided in user example)
-        if isinstance(active_metrics, dict):
-            keys_to_run = [k for k, v in active_metrics.items() if v is True]
-        else:
-            # Fallback for list-based active_metrics
-            keys_to_run = active_metrics if active_metrics else list(self.metric_templates.keys())
+        routing = self.routing_table(job_requirements, active_metrics, routing)
+        keys_to_run = routing.keys
 
         if not keys_to_run:
             return {
@@ -116,51 +217,24 @@ class ScoringRegistry:
         from .constants import SCORING_CONSTANTS
         integrity_cfg = SCORING_CONSTANTS.get("INTEGRITY", {"SQUATTER_PENALTY": 0.2, "SCORE_CAP": 1.0})
 
+        plan = routing.plan
+
         # Pre-calculate integrity audit to pass to individual metrics
-        target_keywords = []
-        jd_metrics = job_requirements.get("metrics", {})
-        for category in ["Languages", "Technologies"]:
-            vals = jd_metrics.get(category, {}).get("value", [])
-            for v in vals:
-                if isinstance(v, dict):
-                    target_keywords.append(v.get("value"))
-                else:
-                    target_keywords.append(v)
-        
-        candidate_cv = candidate_data.get("raw_cv_text") or candidate_data.get("full_cv_text") or ""
-        stuffing_audit = self.stuffing_detector.analyze(candidate_cv, target_keywords)
-
-        for key in keys_to_run:
-            metric = self._get_metric_for_key(key, job_requirements)
-            if not metric:
-                continue
-                
-            active_items = None
-            if key.startswith("req_"):
-                clean_name = key.replace("req_", "").replace("_", " ")
-                active_items = [clean_name]
-
-            res = metric.calculate(candidate_data, job_requirements, active_items=active_items, stuffing_audit=stuffing_audit) or {}
-            raw_weight = weights.get(key, 0.0) if (weights and weights.get(key) is not None) else 0.0
-            
-            # CRITICAL FIX: Cap individual metric scores at 1.0 to prevent total > 100%
-            metric_score = min(integrity_cfg.get("SCORE_CAP", 1.0), float(res.get("score") or 0.0))
-            
+        stuffing_audit = self.metric_stuffing_audit(candidate_data, job_requirements, plan)
+
+        for key, metric, active_items in routing.routes:
+
+            if reuse and key in reuse and not metric.batch_relative:
+                # carry over results that don't depend on the batch context
+                raw_weight = weights.get(key, 0.0) if (weights and weights.get(key) is not None) else 0.0
+                merged_res = {**reuse[key], "weight": raw_weight}
+            else:
+                merged_res = self.score_metric(key, metric, candidate_data, job_requirements, weights, stuffing_audit, active_items)
+            metric_score = merged_res["score"]
+            raw_weight = merged_res["weight"]
+
             total_weighted_score += metric_score * raw_weight
             total_weight += raw_weight
-            
-            merged_res = {**res}
-            merged_res.update({
-                "name": active_items[0] if (active_items and len(active_items) > 0) else (metric.name if metric else "Unknown Metric"),
-                "weight": raw_weight,
-                "score": metric_score,
-                "formula": res.get("calculation_formula", "Simple Weighted Average"),
-                "technical_formula": res.get("technical_formula", ""),
-                "glossary": res.get("glossary", []),
-                "breakdown": res.get("breakdown", []),
-                "sources_used": res.get("sources_used", []),
-                "improvements": res.get("improvements", [])
-            })
             results[key] = merged_res
             
             # Dynamically update the candidate's skill_metrics cache so that
@@ -173,43 +247,18 @@ class ScoringRegistry:
         # Recalculate baseline overall score
         overall_score = total_weighted_score / total_weight if total_weight > 0 else 0.0
 
-        # integrity audit
-        target_keywords = []
-        jd_metrics = job_requirements.get("metrics", {})
-        for category in ["Languages", "Technologies"]:
-            vals = jd_metrics.get(category, {}).get("value", [])
-            for v in vals:
-                if isinstance(v, dict):
-                    target_keywords.append(v.get("value") or v.get("name") or "")
-                else:
-                    target_keywords.append(str(v))
-
-        for key in keys_to_run:
-            if key.startswith("req_"):
-                target_keywords.append(key.replace("req_", "").replace("_", " "))
-        
-        target_keywords = list(set([k for k in target_keywords if k and str(k).strip()]))
-        cv_text = candidate_data.get("raw_cv_text") or candidate_data.get("full_cv_text") or ""
-        stuffing_audit = self.stuffing_detector.analyze(cv_text, target_keywords)
+        # integrity audit, keyword counts come from the same memoised text index
+        # as the metric level audit so nothing gets counted twice
+        target_keywords = plan.audit_keywords(keys_to_run)
+        cv_index = get_cv_text_index(candidate_data)
+        stuffing_audit = self.stuffing_detector.analyze(cv_index.text, target_keywords, cv_index)
 
         # Identity Consistency Audit
-        import difflib
-        cv_name = str(candidate_data.get("name", "")).lower().strip()
-        gh_profile = candidate_data.get("github_enriched") or candidate_data.get("github_profile") or {}
-        gh_name = str(gh_profile.get("name", "")).lower().strip()
-        
-        identity_penalty = 0.0
-        similarity = 1.0
-        
-        # Only apply squatter penalty if we actually found a name on the profile
-        # to avoid penalising missing data as a mismatch.
-        valid_gh_name = gh_name and gh_name != "none" and len(gh_name) > 2
-        
-        if valid_gh_name and cv_name:
-            similarity = difflib.SequenceMatcher(None, cv_name, gh_name).ratio()
-            # If similarity < 70% and no substring match, apply the Veto
-            if similarity < 0.7 and cv_name not in gh_name and gh_name not in cv_name:
-                identity_penalty = integrity_cfg.get("SQUATTER_PENALTY", 0.20)
+        identity = self.identity_audit(candidate_data)
+        identity_penalty = identity["penalty"]
+        similarity = identity["similarity"]
+        cv_name = identity["cv_name"]
+        gh_name = identity["gh_name"]
 
         # Flag stuffing penalties in the individual metrics for UI transparency
         # The actual score deduction is handled natively by the metric templates 
@@ -234,11 +283,9 @@ class ScoringRegistry:
                 m["integrity_audit_details"] = audit_data
 
             # Flag the parent category metric if applicable
-            jd_metrics = job_requirements.get("metrics", {})
-            for cat_id, cat_name in [("languages", "Languages"), ("technologies", "Technologies")]:
+            for cat_id, cat_vals in plan.category_values.items():
                 if cat_id in results:
-                    cat_vals = [v.get("value") if isinstance(v, dict) else v for v in jd_metrics.get(cat_name, {}).get("value", [])]
-                    if any(str(v).lower() == term_audit["term"].lower() for v in cat_vals):
+                    if term_audit["term"].lower() in cat_vals:
                         results[cat_id]["integrity_penalty_applied"] = True
                         # If multiple terms are stuffed, we show the highest penalty audit
                         if p_val > results[cat_id].get("integrity_penalty_value", 0):
@@ -246,11 +293,10 @@ class ScoringRegistry:
                             results[cat_id]["integrity_audit_details"] = audit_data
 
         # Recalculate finalized overall score after stuffing penalties
-        weighted_sum = sum((m.get("score") or 0.0) * (m.get("weight") or 0.0) for m in results.values())
-        raw_average = weighted_sum / total_weight if total_weight > 0 else 0.0
-        
-        # apply global identity veto (deduct from the average)
-        final_adjusted_score = max(0.0, raw_average - identity_penalty)
+        combined = self.combine_scores(results, total_weight, identity_penalty)
+        weighted_sum = combined["weighted_sum"]
+        raw_average = combined["raw_average"]
+        final_adjusted_score = combined["final_adjusted_score"]
 
         stuffing_notes = ""
         if identity_penalty > 0:
@@ -264,7 +310,7 @@ class ScoringRegistry:
             logic_formula = f"[{logic_formula} - {identity_penalty:.2f} Veto]"
             
         return {
-            "overall_score": round(final_adjusted_score, 3),
+            "overall_score": combined["overall_score"],
             "integrity_penalty": stuffing_audit["penalty"] + identity_penalty, 
             "calculation_summary": {
                 "formula": "SUM(PenalisedMetricScore * Weight) / SUM(Weights) - IdentityPenalty",
@@ -0,0 +1,134 @@
+import hashlib
+import json
+from typing import Dict, Any, List, Optional
+from .base import BaseMetric
+
+# the JD categories the registry routes requirements and audits keywords from
+PLAN_CATEGORIES = [("languages", "Languages"), ("technologies", "Technologies")]
+
+
+def _extract_names(items) -> List[str]:
+    # Helper to extract names from potentially complex JD value lists
+    names = []
+    for item in items:
+        if isinstance(item, dict):
+            val = item.get("value") or item.get("name") or ""
+            names.append(str(val).lower())
+        else:
+            names.append(str(item).lower())
+    return names
+
+
+def jd_fingerprint(job_requirements: Dict[str, Any]) -> str:
+    """content hash of the parts of a JD the scoring plan is compiled from"""
+    jd_metrics = job_requirements.get("metrics") or {}
+    relevant = {name: jd_metrics.get(name, {}).get("value", []) for _, name in PLAN_CATEGORIES}
+    payload = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ScoringPlan:
+    """
+    Everything the registry needs from a JD that doesn't depend on the candidate:
+    keyword lists for both stuffing audits, category values for flagging and the
+    req_* -> metric template routing. compiled once per JD and shared by the batch.
+    """
+
+    def __init__(self, metric_templates: Dict[str, BaseMetric], job_requirements: Dict[str, Any], fingerprint: str):
+        self.metric_templates = metric_templates
+        self.fingerprint = fingerprint
+        jd_metrics = job_requirements.get("metrics") or {}
+
+        # keywords for the metric level audit (JD languages/technologies only)
+        self.metric_keywords = []
+        # base keywords for the integrity audit, req_* names get added per config
+        self.jd_keywords = []
+        # lowercased category values, used to flag the parent category metric
+        self.category_values = {}
+        for cat_id, cat_name in PLAN_CATEGORIES:
+            vals = jd_metrics.get(cat_name, {}).get("value", [])
+            for v in vals:
+                if isinstance(v, dict):
+                    self.metric_keywords.append(v.get("value"))
+                    self.jd_keywords.append(v.get("value") or v.get("name") or "")
+                else:
+                    self.metric_keywords.append(v)
+                    self.jd_keywords.append(str(v))
+            self.category_values[cat_id] = {str(v.get("value") if isinstance(v, dict) else v).lower() for v in vals}
+
+        self.language_names = _extract_names(jd_metrics.get("Languages", {}).get("value", []))
+        self.technology_names = _extract_names(jd_metrics.get("Technologies", {}).get("value", []))
+
+        self._routes: Dict[str, Optional[BaseMetric]] = {}
+        self._audit_keywords: Dict[tuple, List[str]] = {}
+        self._tables: Dict[tuple, "RoutingTable"] = {}
+
+    def metric_for_key(self, key: str) -> Optional[BaseMetric]:
+        """which metric template handles a config key, memoised per key"""
+        if key not in self._routes:
+            self._routes[key] = self._route(key)
+        return self._routes[key]
+
+    def _route(self, key: str) -> Optional[BaseMetric]:
+        # check for a direct match first
+        if key in self.metric_templates:
+            return self.metric_templates[key]
+
+        # requirement keys (e.g. 'req_python', 'req_AWS')
+        if key.startswith("req_"):
+            # Try to find which category this requirement belongs to in the JD
+            clean_name = key.replace("req_", "").replace("_", " ").lower()
+            if clean_name in self.language_names:
+                return self.metric_templates.get("languages")
+
+            if any(clean_name in t or t in clean_name for t in self.technology_names):
+                return self.metric_templates.get("technologies")
+
+            # Default to tech stack if unknown requirement
+            return self.metric_templates.get("technologies")
+
+        return None
+
+    def audit_keywords(self, keys_to_run: List[str]) -> List[str]:
+        """integrity audit keywords: JD languages/technologies plus the active req_* names"""
+        cache_key = tuple(keys_to_run)
+        if cache_key not in self._audit_keywords:
+            target_keywords = list(self.jd_keywords)
+            for key in keys_to_run:
+                if key.startswith("req_"):
+                    target_keywords.append(key.replace("req_", "").replace("_", " "))
+            self._audit_keywords[cache_key] = list(set([k for k in target_keywords if k and str(k).strip()]))
+        return self._audit_keywords[cache_key]
+
+    def routing_table(self, keys_to_run: List[str]) -> "RoutingTable":
+        """the RoutingTable for this JD and a resolved list of config keys, memoised"""
+        cache_key = tuple(keys_to_run)
+        table = self._tables.get(cache_key)
+        if table is None:
+            table = RoutingTable(self, keys_to_run)
+            self._tables[cache_key] = table
+        return table
+
+
+class RoutingTable:
+    """
+    Config key -> (metric template, active items) for one (JD, active_metrics) pair.
+    callers (the ranking route, MeritEngine) can hold on to one and hand it back to
+    the registry, which swaps it for a fresh table if the JD or config has changed.
+    """
+
+    def __init__(self, plan: ScoringPlan, keys_to_run: List[str]):
+        self.plan = plan
+        self.keys = list(keys_to_run)
+        self.routes = []
+        for key in self.keys:
+            metric = plan.metric_for_key(key)
+            if not metric:
+                continue
+            active_items = None
+            if key.startswith("req_"):
+                active_items = [key.replace("req_", "").replace("_", " ")]
+            self.routes.append((key, metric, active_items))
+
+    def matches(self, plan: ScoringPlan, keys_to_run: List[str]) -> bool:
+        return self.plan is plan and self.keys == list(keys_to_run)
@@ -1,23 +1,175 @@
-import torch
-from sentence_transformers import SentenceTransformer, util
+from collections import OrderedDict
+import threading
 import os
 
+# torch and sentence_transformers are imported when the model is first needed,
+# importing them costs seconds and hundreds of MB in processes that never score
+
+# using a lightweight model that offers best 'class separation' for tech terms
+# 'all-MiniLM-L6-v2' is superior at distinguishing between different languages
+MODEL_NAME = 'all-MiniLM-L6-v2'
+
 class SemanticMatcher:
     _instance = None
-    _model = None
+
+    # how many normalised strings we keep embeddings for (MiniLM is 384 floats each)
+    CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", "4096"))
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(SemanticMatcher, cls).__new__(cls)
-            # using a lightweight model that offers best 'class separation' for tech terms
-            # 'all-MiniLM-L6-v2' is superior at distinguishing between different languages
-            model_name = 'all-MiniLM-L6-v2'
-            try:
-                cls._model = SentenceTransformer(model_name)
-            except Exception as e:
-                print(f"CRITICAL [Semantic]: Failed to load model: {str(e)}")
+            cls._instance._cache = OrderedDict()
+            cls._instance._cache_lock = threading.Lock()
+            cls._instance._skill_index = None
+            cls._instance._skill_index_loaded = False
+            cls._instance._loaded_model = None
+            cls._instance._model_loaded = False
+            cls._instance._model_lock = threading.Lock()
         return cls._instance
 
+    @property
+    def _model(self):
+        """the SentenceTransformer, loaded on first use. None if it failed to load"""
+        if not self._model_loaded:
+            with self._model_lock:
+                if not self._model_loaded:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                        self._loaded_model = SentenceTransformer(MODEL_NAME)
+                    except Exception as e:
+                        print(f"CRITICAL [Semantic]: Failed to load model: {str(e)}")
+                    self._model_loaded = True
+        return self._loaded_model
+
+    def warm_up(self):
+        """loads the model and skill index now rather than on the first request"""
+        return self._model is not None and self.skill_index is not None
+
+    def _normalise(self, text: str) -> str:
+        return text.lower().strip()
+
+    @property
+    def skill_index(self):
+        """precomputed skills vocabulary embeddings, None if not built or stale"""
+        if not self._skill_index_loaded:
+            with self._cache_lock:
+                if not self._skill_index_loaded:
+                    from .skill_index import load_skill_index
+                    self._skill_index = load_skill_index(MODEL_NAME)
+                    self._skill_index_loaded = True
+        return self._skill_index
+
+    def encode(self, texts: list) -> "torch.Tensor":
+        """
+        embeddings for already normalised strings, one row each.
+        vocabulary skills come straight from the skill index, anything else
+        not in the LRU cache gets encoded in a single model call.
+        """
+        import torch
+        unique = list(dict.fromkeys(texts))
+        index = self.skill_index
+        with self._cache_lock:
+            found = {}
+            for t in unique:
+                if t in self._cache:
+                    self._cache.move_to_end(t)
+                    found[t] = self._cache[t]
+
+        if index is not None:
+            device = getattr(self._model, "device", "cpu")
+            for t in unique:
+                if t not in found:
+                    row = index.lookup(t)
+                    if row is not None:
+                        found[t] = torch.from_numpy(row.copy()).to(device)
+
+        missing = [t for t in unique if t not in found]
+        if missing:
+            new_embs = self._model.encode(missing, convert_to_tensor=True)
+            with self._cache_lock:
+                for text, emb in zip(missing, new_embs):
+                    self._cache[text] = emb
+                    found[text] = emb
+                while len(self._cache) > self.CACHE_SIZE:
+                    self._cache.popitem(last=False)
+
+        return torch.stack([found[t] for t in texts])
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
+            # picks up a rebuilt index next time round
+            self._skill_index = None
+            self._skill_index_loaded = False
+
+    def nearest_skills(self, target: str, k: int = 5) -> list:
+        """
+        closest vocabulary skills to target as [{"skill", "score"}], best first.
+        one matrix-vector product against the skill index, empty if there's no index.
+        """
+        index = self.skill_index
+        if not self._model or index is None or not target:
+            return []
+        query = self.encode([self._normalise(target)])[0]
+        return index.nearest(query.detach().cpu().numpy(), k)
+
+    def find_best_matches(self, targets: list, candidates: list):
+        """
+        full cosine similarity matrix, rows are targets and columns are candidates.
+        returns None if the model isn't available.
+        """
+        if not self._model or not targets or not candidates:
+            return None
+
+        targets_clean = [self._normalise(t) for t in targets]
+        candidates_clean = [self._normalise(c) for c in candidates]
+
+        from sentence_transformers import util
+        embs = self.encode(targets_clean + candidates_clean)
+        return util.cos_sim(embs[:len(targets_clean)], embs[len(targets_clean):])
+
+    def best_matches(self, targets: list, candidates: list, threshold: float = 0.6) -> list:
+        """find_best_match for several targets against the same candidates, sharing one encode"""
+        no_match = {"match": None, "best_candidate": None, "score": 0.0}
+        if not self._model or not targets or not candidates:
+            return [dict(no_match) for _ in targets]
+
+        candidates_clean = [self._normalise(c) for c in candidates]
+        results = [None] * len(targets)
+        to_score = []
+
+        for t_idx, target in enumerate(targets):
+            if not target:
+                results[t_idx] = dict(no_match)
+                continue
+            # 1. Exact match check (Efficiency)
+            target_clean = self._normalise(target)
+            if target_clean in candidates_clean:
+                idx = candidates_clean.index(target_clean)
+                results[t_idx] = {"match": candidates[idx], "best_candidate": candidates[idx], "score": 1.0}
+            else:
+                to_score.append(t_idx)
+
+        if to_score:
+            # 2. Vector Similarity, all remaining targets at once
+            cosine_scores = self.find_best_matches([targets[i] for i in to_score], candidates)
+            for row, t_idx in enumerate(to_score):
+                best_score = 0.0
+                best_match_idx = 0
+                for i, score in enumerate(cosine_scores[row]):
+                    s = float(score)
+                    if s > best_score:
+                        best_score = s
+                        best_match_idx = i
+
+                best_match = candidates[best_match_idx]
+                results[t_idx] = {
+                    "match": best_match if best_score >= threshold else None,
+                    "best_candidate": best_match,
+                    "score": best_score
+                }
+        return results
+
     def find_best_match(self, target: str, candidates: list, threshold: float = 0.6) -> dict:
         """
         finds the best semantic match in a list of candidates using pure vector similarity.
@@ -26,38 +178,7 @@ class SemanticMatcher:
         if not self._model or not target or not candidates:
             return {"match": None, "best_candidate": None, "score": 0.0}
 
-        # Pure semantic matching: Clean strings but no artificial prefixes
-        target_clean = target.lower().strip()
-        candidates_clean = [c.lower().strip() for c in candidates]
-
-        # 1. Exact match check (Efficiency)
-        if target_clean in candidates_clean:
-            idx = candidates_clean.index(target_clean)
-            return {"match": candidates[idx], "best_candidate": candidates[idx], "score": 1.0}
-
-        # 2. Vector Similarity
-        target_emb = self._model.encode(target_clean, convert_to_tensor=True)
-        cand_embs = self._model.encode(candidates_clean, convert_to_tensor=True)
-
-        # compute all similarities at once
-        cosine_scores = util.cos_sim(target_emb, cand_embs)[0]
-        
-        best_score = 0.0
-        best_match_idx = 0
-        
-        for i, score in enumerate(cosine_scores):
-            s = float(score)
-            if s > best_score:
-                best_score = s
-                best_match_idx = i
-
-        best_match = candidates[best_match_idx] if candidates else None
-
-        return {
-            "match": best_match if best_score >= threshold else None,
-            "best_candidate": best_match,
-            "score": best_score
-        }
+        return self.best_matches([target], candidates, threshold)[0]
 
 # singleton instance for easy access
 semantic_matcher = SemanticMatcher()
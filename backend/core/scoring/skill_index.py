@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# the index lives next to the vocabulary it was built from
+PARSERS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "parsers")
+SKILLS_PATH = os.path.join(PARSERS_DIR, "skills_data.json")
+INDEX_PATH = os.path.join(PARSERS_DIR, "skills_index.npy")
+META_PATH = os.path.join(PARSERS_DIR, "skills_index.meta.json")
+
+
+def skills_version(skills_path: str = SKILLS_PATH) -> str:
+    """content hash of the skills json, changes whenever update_skills() rewrites it"""
+    with open(skills_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_vocabulary(skills_path: str = SKILLS_PATH) -> List[str]:
+    """every skill string in the json, normalised the same way SemanticMatcher does"""
+    with open(skills_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    vocab = set()
+    for category in data.values():
+        if isinstance(category, list):
+            for skill in category:
+                if isinstance(skill, str) and skill.strip():
+                    vocab.add(skill.lower().strip())
+    return sorted(vocab)
+
+
+class SkillIndex:
+    """
+    Precomputed embeddings for the skills vocabulary.
+    rows are L2 normalised float32, memory mapped so worker processes share the pages.
+    """
+
+    def __init__(self, vocabulary: List[str], matrix: np.ndarray, meta: Dict[str, Any]):
+        self.vocabulary = vocabulary
+        self.matrix = matrix
+        self.meta = meta
+        self.positions = {s: i for i, s in enumerate(vocabulary)}
+
+    def __len__(self):
+        return len(self.vocabulary)
+
+    def lookup(self, text: str) -> Optional[np.ndarray]:
+        """embedding row for a normalised string, None if it isn't in the vocabulary"""
+        idx = self.positions.get(text)
+        return None if idx is None else self.matrix[idx]
+
+    def nearest(self, query: np.ndarray, k: int = 5) -> List[Dict[str, Any]]:
+        """top k vocabulary entries by cosine similarity, a single matrix-vector product"""
+        norm = float(np.linalg.norm(query))
+        if norm == 0 or not len(self.vocabulary):
+            return []
+        scores = self.matrix @ (query.astype(np.float32) / norm)
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [{"skill": self.vocabulary[i], "score": float(scores[i])} for i in top]
+
+
+def build_skill_index(model=None, model_name: Optional[str] = None, skills_path: str = SKILLS_PATH,
+                      index_path: str = INDEX_PATH, meta_path: str = META_PATH, batch_size: int = 256) -> Dict[str, Any]:
+    """
+    Offline step: encodes the whole skills vocabulary and writes the matrix + metadata.
+    re-run after update_skills(), a stale index is ignored rather than used.
+    """
+    if model is None:
+        from .semantic_utils import semantic_matcher, MODEL_NAME
+        model, model_name = semantic_matcher._model, MODEL_NAME
+        if model is None:
+            raise RuntimeError("SentenceTransformer model is not available, cannot build the skill index")
+    if model_name is None:
+        from .semantic_utils import MODEL_NAME
+        model_name = MODEL_NAME
+
+    vocab = load_vocabulary(skills_path)
+    embs = model.encode(vocab, batch_size=batch_size, convert_to_numpy=True, show_progress_bar=False)
+    embs = np.asarray(embs, dtype=np.float32)
+    norms = np.linalg.norm(embs, axis=1, keepdims=True)
+    embs = embs / np.where(norms == 0, 1.0, norms)
+
+    meta = {
+        "skills_version": skills_version(skills_path),
+        "model_name": model_name,
+        "dim": int(embs.shape[1]) if len(vocab) else 0,
+        "vocabulary": vocab
+    }
+
+    # write to temp files first so a half written index is never picked up
+    tmp_index = index_path + ".tmp.npy"
+    np.save(tmp_index, embs)
+    os.replace(tmp_index, index_path)
+    with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(meta_path + ".tmp", meta_path)
+
+    print(f"Built skill index: {len(vocab)} skills x {meta['dim']} dims ({model_name})")
+    return meta
+
+
+def load_skill_index(model_name: str, skills_path: str = SKILLS_PATH, index_path: str = INDEX_PATH,
+                     meta_path: str = META_PATH) -> Optional[SkillIndex]:
+    """loads the index zero-copy, or None if it's missing or was built for another json/model"""
+    if not os.path.exists(index_path) or not os.path.exists(meta_path):
+        return None
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("model_name") != model_name or meta.get("skills_version") != skills_version(skills_path):
+            print("WARNING [SkillIndex]: index is stale, rebuild it with `python -m core.scoring.skill_index`")
+            return None
+        matrix = np.load(index_path, mmap_mode="r")
+        vocab = meta.get("vocabulary", [])
+        if matrix.ndim != 2 or matrix.shape[0] != len(vocab):
+            return None
+        return SkillIndex(vocab, matrix, meta)
+    except Exception as e:
+        print(f"WARNING [SkillIndex]: could not load index: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    build_skill_index()
@@ -1,6 +1,7 @@
 import math
 from typing import Dict, Any, List, Optional
 from .base import BaseMetric
+from .text_index import CVTextIndex, get_cv_text_index
 from .constants import SCORING_CONSTANTS
 from core.fusion.bayesian import Evidence
 
@@ -67,14 +68,10 @@ class TechnologyStackMetric(BaseMetric):
         
         return max(0.2, decay_mult), f"Legacy Skill ({int(years_since)}+ years since last activity)"
 
-    def _count_mentions(self, tech: str, cv_text: str) -> int:
-        if not cv_text: return 0
-        import re
-        tech_lower = tech.lower()
-
-        # count occurrences with word boundaries to avoid substrings
-        pattern = rf"\b{re.escape(tech_lower)}\b"
-        return len(re.findall(pattern, cv_text.lower()))
+    def _count_mentions(self, tech: str, text_index: CVTextIndex) -> int:
+        # whole word occurrences, looked up in the shared CV text index
+        if not text_index.lower: return 0
+        return text_index.count(tech)
 
     def calculate(self, candidate_data: Dict[str, Any], job_requirements: Dict[str, Any], active_items: Optional[List[str]] = None, **kwargs) -> Dict[str, Any]:
         breakdown = []
@@ -117,8 +114,8 @@ class TechnologyStackMetric(BaseMetric):
 
             
             # cv signal
-            cv_text = candidate_data.get("raw_cv_text") or candidate_data.get("full_cv_text") or ""
-            mentions = self._count_mentions(tech_val, cv_text)
+            cv_index = get_cv_text_index(candidate_data)
+            mentions = self._count_mentions(tech_val, cv_index)
 
             has_cv = mentions > 0
             
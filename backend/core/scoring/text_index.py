@@ -0,0 +1,78 @@
+import re
+from collections import Counter
+from typing import Any, Dict, List
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class CVTextIndex:
+    """
+    Lowercased CV text plus its \\w+ tokens and term frequencies, built once per
+    candidate so the metrics, the stuffing audits and every Shapley coalition can
+    count keyword mentions without re-scanning the raw text.
+    """
+
+    def __init__(self, text: str):
+        self.text = text or ""
+        self.lower = self.text.lower()
+        self._tokens = None
+        self._tf = None
+        self._counts: Dict[str, int] = {}
+
+    def __reduce__(self):
+        # only ship the text to worker processes, the rest is rebuilt on demand
+        return (CVTextIndex, (self.text,))
+
+    @property
+    def tokens(self) -> List[str]:
+        if self._tokens is None:
+            self._tokens = _WORD_RE.findall(self.lower)
+        return self._tokens
+
+    @property
+    def tf(self) -> Counter:
+        if self._tf is None:
+            self._tf = Counter(self.tokens)
+        return self._tf
+
+    @property
+    def word_count(self) -> int:
+        return len(self.tokens)
+
+    def count(self, term: str) -> int:
+        """
+        whole word mentions of term, same result as
+        len(re.findall(rf"\\b{re.escape(term.lower())}\\b", text.lower()))
+        """
+        term_lower = term.lower()
+        cached = self._counts.get(term_lower)
+        if cached is not None:
+            return cached
+
+        if not self.lower:
+            n = 0
+        elif _WORD_RE.fullmatch(term_lower):
+            # \b on both sides of a pure \w term means it has to be a whole token
+            n = self.tf.get(term_lower, 0)
+        else:
+            # phrases and things like "c++" or "node.js" keep the regex semantics
+            n = len(re.findall(rf"\b{re.escape(term_lower)}\b", self.lower))
+
+        self._counts[term_lower] = n
+        return n
+
+
+def get_cv_text_index(candidate_data: Dict[str, Any]) -> CVTextIndex:
+    """
+    The candidate's CVTextIndex, built and attached on first use.
+    checked against the current CV text so a masked (or edited) candidate never
+    reads counts from text it no longer has.
+    """
+    text = candidate_data.get("raw_cv_text") or candidate_data.get("full_cv_text") or ""
+    index = candidate_data.get("cv_text_index")
+    if isinstance(index, CVTextIndex) and (index.text is text or index.text == text):
+        return index
+
+    index = CVTextIndex(text)
+    candidate_data["cv_text_index"] = index
+    return index
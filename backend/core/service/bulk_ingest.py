@@ -0,0 +1,143 @@
+import os
+import io
+import atexit
+import zipfile
+import hashlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from werkzeug.utils import secure_filename
+
+CV_EXTENSIONS = {"pdf", "docx"}
+# parsing is CPU bound (pdf text + spaCy), so one worker per core
+CV_INGEST_WORKERS = int(os.getenv("CV_INGEST_WORKERS", str(os.cpu_count() or 1)))
+# guards against zip bombs / accidental uploads of a whole drive
+ZIP_MAX_FILES = 2000
+ZIP_MAX_FILE_BYTES = 20 * 1024 * 1024
+# everything unpacked from the zips of one request, counted as it decompresses
+ZIP_MAX_TOTAL_BYTES = int(os.getenv("ZIP_MAX_TOTAL_BYTES", str(512 * 1024 * 1024)))
+# CVs handed to a worker at once, their names go through one nlp.pipe call.
+# small enough that results still stream back steadily
+CV_PARSE_BATCH = int(os.getenv("CV_PARSE_BATCH", "4"))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _init_worker():
+    # the pool is already one process per core, so PDFs are read in-process
+    # rather than each worker spawning its own page pool on top
+    import core.parsers.pdf_extract as pdf_extract
+    pdf_extract.PDF_PAGE_WORKERS = 1
+    # loads spaCy and the skill matcher once per worker
+    from core.parsers.cv import warm_up
+    warm_up()
+
+
+def _parse_cvs(paths: List[str]) -> List[Any]:
+    from core.parsers.cv import parse_cvs
+    return parse_cvs(paths)
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """spawned (not forked) for the same reasons as the scoring pool, kept for the process lifetime"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            ctx = multiprocessing.get_context("spawn")
+            _pool = ProcessPoolExecutor(max_workers=CV_INGEST_WORKERS, mp_context=ctx, initializer=_init_worker)
+        return _pool
+
+
+def _shutdown_pool():
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_shutdown_pool)
+
+
+def _is_cv(filename: str) -> bool:
+    return "." in filename and filename.rsplit(".", 1)[1].lower() in CV_EXTENSIONS
+
+
+def _read_capped(stream, limit: int) -> bytes:
+    """reads at most limit + 1 bytes, getting more than limit back means the entry is over it"""
+    return stream.read(max(0, limit) + 1)
+
+
+def collect_uploads(files) -> Tuple[List[Tuple[str, bytes]], List[str]]:
+    """
+    (filename, content) for every CV in the upload, zips are unpacked.
+    returns the CVs and the names of anything that was skipped.
+    """
+    cvs, skipped = [], []
+    # file_size is only what the zip header claims, the caps go by what actually decompresses
+    unpacked_budget = ZIP_MAX_TOTAL_BYTES
+    for file in files:
+        if not file or not file.filename:
+            continue
+        name = file.filename
+        if name.lower().endswith(".zip"):
+            with zipfile.ZipFile(io.BytesIO(file.read())) as archive:
+                members = [m for m in archive.infolist() if not m.is_dir()]
+                for member in members[:ZIP_MAX_FILES]:
+                    base = os.path.basename(member.filename)
+                    if member.filename.startswith("__MACOSX/") or not _is_cv(base) or member.file_size > ZIP_MAX_FILE_BYTES:
+                        skipped.append(member.filename)
+                        continue
+                    limit = min(ZIP_MAX_FILE_BYTES, unpacked_budget)
+                    with archive.open(member) as f:
+                        content = _read_capped(f, limit)
+                    unpacked_budget -= len(content)
+                    if len(content) > limit:
+                        skipped.append(member.filename)
+                        continue
+                    cvs.append((secure_filename(base), content))
+                skipped.extend(m.filename for m in members[ZIP_MAX_FILES:])
+        elif _is_cv(name):
+            cvs.append((secure_filename(name), file.read()))
+        else:
+            skipped.append(name)
+    return cvs, skipped
+
+
+def dedupe_by_hash(cvs: List[Tuple[str, bytes]]) -> Tuple[Dict[str, Tuple[str, bytes]], List[Tuple[str, str]]]:
+    """cv_hash -> (filename, content), same md5 as /extract-cv. duplicates come back as (filename, hash)"""
+    unique, duplicates = {}, []
+    for filename, content in cvs:
+        cv_hash = hashlib.md5(content).hexdigest()
+        if cv_hash in unique:
+            duplicates.append((filename, cv_hash))
+        else:
+            unique[cv_hash] = (filename, content)
+    return unique, duplicates
+
+
+def parse_many(paths: Dict[str, str], fn: Callable[[List[str]], List[Any]] = _parse_cvs,
+               pool: Optional[ProcessPoolExecutor] = None, batch_size: int = CV_PARSE_BATCH) -> Iterator[Tuple[str, Any]]:
+    """
+    parses key -> path on the pool, batch_size paths per task, and yields
+    (key, result) as each batch finishes. fn returns one result per path,
+    result is the exception if that file failed
+    """
+    pool = pool or get_parse_pool()
+    items = list(paths.items())
+    batches = [items[i:i + max(1, batch_size)] for i in range(0, len(items), max(1, batch_size))]
+    futures = {pool.submit(fn, [path for _, path in batch]): batch for batch in batches}
+    try:
+        for future in as_completed(futures):
+            keys = [key for key, _ in futures[future]]
+            try:
+                results = future.result()
+            except Exception as e:
+                results = [e] * len(keys)
+            for key, result in zip(keys, results):
+                yield key, result
+    finally:
+        # closed early (the client went away), batches not started yet are dropped
+        for future in futures:
+            future.cancel()
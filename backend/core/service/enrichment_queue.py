@@ -0,0 +1,240 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# not under cached/, a full /purge-cache empties that folder and the jobs have to survive it
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
+JOBS_PATH = os.getenv("ENRICHMENT_JOBS_PATH", os.path.join(DATA_DIR, "enrichment_jobs.sqlite3"))
+
+# how many scrapes of each source can run at once, github has its own
+# request scheduler underneath, linkedin runs are slow and billed per run
+SOURCE_CONCURRENCY = {
+    "github": int(os.getenv("ENRICH_GITHUB_CONCURRENCY", "4")),
+    "linkedin": int(os.getenv("ENRICH_LINKEDIN_CONCURRENCY", "2")),
+}
+DEFAULT_CONCURRENCY = 2
+# a task still 'running' this long after it was claimed belongs to a process that
+# died, anything younger may be in flight in another worker process
+TASK_LEASE_SECONDS = int(os.getenv("ENRICH_TASK_LEASE", "3600"))
+
+TASK_STATES = ["pending", "running", "done", "failed"]
+
+
+class EnrichmentQueue:
+    """
+    Server side batch enrichment. a job is one (candidate, source, url) task per
+    link, kept in a small SQLite table so progress survives restarts. one
+    dispatcher thread hands pending tasks to a thread pool per source, never more
+    than that source's concurrency limit at once.
+    """
+
+    def __init__(self, path: str = JOBS_PATH, concurrency: Optional[Dict[str, int]] = None,
+                 lease: int = TASK_LEASE_SECONDS):
+        self.path = path
+        self.lease = lease
+        self.concurrency = dict(SOURCE_CONCURRENCY if concurrency is None else concurrency)
+        self._handler: Optional[Callable[[Dict[str, Any]], Any]] = None
+        self._batch_handlers: Dict[str, Tuple[int, Callable]] = {}
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._in_flight: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @contextmanager
+    def _connect(self):
+        """short lived connection, committed (or rolled back) and closed on exit"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("""CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY, created_at REAL NOT NULL, options TEXT)""")
+            conn.execute("""CREATE TABLE IF NOT EXISTS tasks (
+                job_id TEXT NOT NULL, candidate_id TEXT NOT NULL, source TEXT NOT NULL, url TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT, updated_at REAL, PRIMARY KEY (job_id, candidate_id, source))""")
+            conn.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, source)")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # --- jobs ---
+
+    def create_job(self, tasks: List[Dict[str, Any]], options: Optional[Dict[str, Any]] = None) -> str:
+        """tasks are dicts with candidate_id, source and url"""
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("INSERT INTO jobs (id, created_at, options) VALUES (?, ?, ?)",
+                         (job_id, now, json.dumps(options or {})))
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (job_id, candidate_id, source, url, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(job_id, str(t["candidate_id"]), t["source"], t["url"], now) for t in tasks])
+        self._wake.set()
+        return job_id
+
+    def job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            job = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if not job:
+                return None
+            rows = conn.execute("SELECT source, status, COUNT(*) AS n FROM tasks WHERE job_id = ? GROUP BY source, status",
+                                (job_id,)).fetchall()
+            failures = conn.execute("SELECT candidate_id, source, url, error FROM tasks WHERE job_id = ? AND status = 'failed'",
+                                    (job_id,)).fetchall()
+
+        counts = {s: 0 for s in TASK_STATES}
+        by_source: Dict[str, Dict[str, int]] = {}
+        for r in rows:
+            counts[r["status"]] += r["n"]
+            by_source.setdefault(r["source"], {s: 0 for s in TASK_STATES})[r["status"]] += r["n"]
+        total = sum(counts.values())
+        finished = counts["done"] + counts["failed"]
+
+        return {
+            "job_id": job_id,
+            "status": "completed" if finished == total else "running",
+            "created_at": job["created_at"],
+            "options": json.loads(job["options"] or "{}"),
+            "total": total,
+            "progress": round(finished / total, 3) if total else 1.0,
+            "counts": counts,
+            "sources": by_source,
+            "failures": [dict(f) for f in failures]
+        }
+
+    def list_jobs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            ids = [r["id"] for r in conn.execute("SELECT id FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,))]
+        return [self.job_status(job_id) for job_id in ids]
+
+    def retry_failed(self, job_id: str) -> int:
+        with self._connect() as conn:
+            cur = conn.execute("UPDATE tasks SET status = 'pending', error = NULL, updated_at = ? "
+                               "WHERE job_id = ? AND status = 'failed'", (time.time(), job_id))
+            count = cur.rowcount
+        self._wake.set()
+        return count
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM tasks")
+            conn.execute("DELETE FROM jobs")
+
+    # --- worker ---
+
+    def start(self, handler: Callable[[Dict[str, Any]], Any], batch_handlers: Optional[Dict[str, Tuple[int, Callable]]] = None):
+        """
+        starts the dispatcher (once per process). tasks left 'running' past their
+        lease by a process that died go back to pending and the jobs carry on,
+        younger ones may still be running in another worker process.
+
+        batch_handlers maps a source to (batch size, fn). fn gets up to that many
+        tasks at once and returns one error (or None) per task, a batch takes one
+        of the source's concurrency slots.
+        """
+        with self._lock:
+            self._handler = handler
+            self._batch_handlers = dict(batch_handlers or {})
+            if self._thread is not None and self._thread.is_alive():
+                return
+            with self._connect() as conn:
+                conn.execute("UPDATE tasks SET status = 'pending' WHERE status = 'running' AND updated_at < ?",
+                             (time.time() - self.lease,))
+            self._thread = threading.Thread(target=self._dispatch, name="enrichment-dispatcher", daemon=True)
+            self._thread.start()
+
+    def _limit(self, source: str) -> int:
+        return max(1, self.concurrency.get(source, DEFAULT_CONCURRENCY))
+
+    def _batch_size(self, source: str) -> int:
+        return max(1, self._batch_handlers[source][0]) if source in self._batch_handlers else 1
+
+    def _claim(self) -> List[List[Dict[str, Any]]]:
+        """
+        marks as many pending tasks as running as each source has free slots for,
+        returned in units of work (a single task, or a batch for batched sources)
+        """
+        units = []
+        with self._lock, self._connect() as conn:
+            sources = [r["source"] for r in conn.execute("SELECT DISTINCT source FROM tasks WHERE status = 'pending'")]
+            for source in sources:
+                free = self._limit(source) - self._in_flight.get(source, 0)
+                if free <= 0:
+                    continue
+                size = self._batch_size(source)
+                rows = conn.execute("""SELECT t.job_id, t.candidate_id, t.source, t.url, t.attempts, j.options
+                                       FROM tasks t JOIN jobs j ON j.id = t.job_id
+                                       WHERE t.status = 'pending' AND t.source = ?
+                                       ORDER BY j.created_at, t.rowid LIMIT ?""", (source, free * size)).fetchall()
+                tasks = []
+                for r in rows:
+                    # another process may have claimed it since the select, only keep rows we flipped
+                    cur = conn.execute("UPDATE tasks SET status = 'running', attempts = attempts + 1, updated_at = ? "
+                                       "WHERE job_id = ? AND candidate_id = ? AND source = ? AND status = 'pending'",
+                                       (time.time(), r["job_id"], r["candidate_id"], source))
+                    if cur.rowcount != 1:
+                        continue
+                    task = dict(r)
+                    task["options"] = json.loads(task["options"] or "{}")
+                    tasks.append(task)
+                chunks = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+                units.extend(chunks)
+                self._in_flight[source] = self._in_flight.get(source, 0) + len(chunks)
+        return units
+
+    def _executor(self, source: str) -> ThreadPoolExecutor:
+        if source not in self._executors:
+            self._executors[source] = ThreadPoolExecutor(max_workers=self._limit(source),
+                                                         thread_name_prefix=f"enrich-{source}")
+        return self._executors[source]
+
+    def _dispatch(self):
+        while True:
+            self._wake.clear()
+            try:
+                for unit in self._claim():
+                    self._executor(unit[0]["source"]).submit(self._run, unit)
+            except Exception as e:
+                print(f"WARNING [EnrichmentQueue]: dispatcher error: {e}")
+            # woken by new jobs / finished tasks, the timeout is just a safety net
+            self._wake.wait(timeout=5)
+
+    def _run(self, unit: List[Dict[str, Any]]):
+        source = unit[0]["source"]
+        try:
+            if source in self._batch_handlers:
+                try:
+                    errors = self._batch_handlers[source][1](unit)
+                except Exception as e:
+                    errors = [e] * len(unit)
+            else:
+                errors = []
+                for task in unit:
+                    try:
+                        self._handler(task)
+                        errors.append(None)
+                    except Exception as e:
+                        errors.append(e)
+
+            with self._connect() as conn:
+                conn.executemany("UPDATE tasks SET status = ?, error = ?, updated_at = ? "
+                                 "WHERE job_id = ? AND candidate_id = ? AND source = ?",
+                                 [("failed" if e else "done", (str(e) or e.__class__.__name__) if e else None, time.time(),
+                                   t["job_id"], t["candidate_id"], t["source"]) for t, e in zip(unit, errors)])
+        finally:
+            with self._lock:
+                self._in_flight[source] -= 1
+            self._wake.set()
+
+
+# shared instance used by the enrichment routes
+enrichment_queue = EnrichmentQueue()
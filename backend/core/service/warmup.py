@@ -0,0 +1,33 @@
+import os
+import threading
+import time
+
+# models load lazily on first use, set this in production so the first
+# request doesn't pay for spaCy + the SentenceTransformer. started from run.py's
+# __main__ (or a gunicorn post_fork hook), never from create_app, which every
+# spawned pool worker runs again when it re-imports the main module
+WARM_UP_MODELS = os.getenv("WARM_UP_MODELS", "false").lower() == "true"
+
+
+def warm_up_models() -> float:
+    """loads the CV parser and scoring models now, returns how long it took"""
+    start = time.perf_counter()
+    from core.parsers.cv import warm_up
+    from core.scoring.semantic_utils import semantic_matcher
+
+    for name, load in [("cv parser", warm_up), ("semantic matcher", semantic_matcher.warm_up)]:
+        try:
+            load()
+        except Exception as e:
+            print(f"WARNING [Warmup]: {name} failed to load: {e}")
+
+    seconds = time.perf_counter() - start
+    print(f"[Warmup] models loaded in {seconds:.1f}s")
+    return seconds
+
+
+def start_warm_up() -> threading.Thread:
+    """warm_up_models on a background thread so the server can start accepting requests"""
+    thread = threading.Thread(target=warm_up_models, name="model-warmup", daemon=True)
+    thread.start()
+    return thread
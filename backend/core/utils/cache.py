@@ -1,31 +1,451 @@
 import os
 import json
+import time
+import sqlite3
 import hashlib
-from typing import Any, Optional
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 
 CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "cached")
 
+# how long an entry stays valid per category (seconds), None = until purged.
+# parsed CVs / JDs are keyed by content hash so they never go stale, scraped
+# profiles do
+CATEGORY_TTLS: Dict[str, Optional[int]] = {
+    "cv": None,
+    "job_desc": None,
+    "github": 7 * 24 * 3600,
+    "linkedin": 30 * 24 * 3600,
+}
+DEFAULT_TTL: Optional[int] = None
+
+# size cap per category, least recently used entries are evicted past it
+CATEGORY_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# "sqlite" (one database for every entry) or "file" (one json file per entry)
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "sqlite").lower()
+CACHE_DB_PATH = os.path.join(CACHE_DIR, "cache.sqlite3")
+# stamp the file backend rewrites on every purge, see generation()
+GENERATION_FILE = ".purge_generation"
+
+# in-process tier in front of the backend, bounded by entries and by bytes of json
+MEMORY_CACHE_ENTRIES = int(os.getenv("MEMORY_CACHE_ENTRIES", "512"))
+MEMORY_CACHE_BYTES = int(os.getenv("MEMORY_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+
+def cache_key(identifier: str) -> str:
+    return hashlib.sha256(identifier.encode("utf-8")).hexdigest()
+
+
+class CacheStore(ABC):
+    """shared bits of the cache backends: TTL policy, size cap and counters"""
+
+    def __init__(self, ttls: Optional[Dict[str, Optional[int]]] = None, max_bytes: int = CATEGORY_MAX_BYTES):
+        self.ttls = dict(CATEGORY_TTLS if ttls is None else ttls)
+        self.max_bytes = max_bytes
+        self._counters: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def _count(self, category: str, event: str, n: int = 1):
+        with self._lock:
+            self._counters.setdefault(category, Counter())[event] += n
+
+    def ttl_for(self, category: str) -> Optional[int]:
+        return self.ttls.get(category, DEFAULT_TTL)
+
+    def _expired(self, category: str, stored_at: float) -> bool:
+        ttl = self.ttl_for(category)
+        return ttl is not None and time.time() - stored_at > ttl
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {cat: dict(counts) for cat, counts in self._counters.items()}
+
+    def get(self, category: str, identifier: str) -> Optional[Any]:
+        found = self.lookup(category, identifier)
+        return found[0] if found else None
+
+    @abstractmethod
+    def lookup(self, category: str, identifier: str) -> Optional[Tuple[Any, float]]:
+        """(data, stored_at) for a live entry, or None"""
+        pass
+
+    @abstractmethod
+    def set(self, category: str, identifier: str, data: Any):
+        """stores data under (category, identifier), replacing any old entry"""
+        pass
+
+    @abstractmethod
+    def purge(self, category: Optional[str] = None):
+        """drops every entry, or just one category's"""
+        pass
+
+    def generation(self) -> Any:
+        """changes whenever any process purges the store, None if the backend doesn't track it"""
+        return None
+
+
+class FileCacheStore(CacheStore):
+    """
+    One compact json file per entry, sharded as <category>/<key[:2]>/<key>.json
+    with the key a hash of the identifier. writes go to a temp file and are
+    renamed into place, so a crash never leaves a half written entry behind.
+    a hit bumps the file's mtime, which is what LRU eviction goes by.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, ttls: Optional[Dict[str, Optional[int]]] = None,
+                 max_bytes: int = CATEGORY_MAX_BYTES):
+        super().__init__(ttls, max_bytes)
+        self.directory = directory
+        self._sizes: Dict[str, int] = {}
+
+    def path(self, category: str, identifier: str) -> str:
+        key = cache_key(identifier)
+        return os.path.join(self.directory, category, key[:2], f"{key}.json")
+
+    def lookup(self, category: str, identifier: str) -> Optional[Tuple[Any, float]]:
+        path = self.path(category, identifier)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            # missing, or unreadable, either way a miss
+            self._count(category, "misses")
+            return None
+
+        if self._expired(category, entry.get("stored_at", 0)):
+            self._remove(category, path)
+            self._count(category, "expired")
+            self._count(category, "misses")
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count(category, "hits")
+        return entry.get("data"), entry.get("stored_at", 0)
+
+    def set(self, category: str, identifier: str, data: Any):
+        path = self.path(category, identifier)
+        payload = json.dumps({"stored_at": time.time(), "data": data}, separators=(",", ":"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+        self._count(category, "writes")
+
+        with self._lock:
+            if category not in self._sizes:
+                self._sizes[category] = self._scan_size(category)
+            else:
+                self._sizes[category] += len(payload)
+            over = self._sizes[category] > self.max_bytes
+        if over:
+            self._evict(category)
+
+    def _entries(self, category: str):
+        cat_dir = os.path.join(self.directory, category)
+        if not os.path.isdir(cat_dir):
+            return
+        for shard in os.scandir(cat_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def _scan_size(self, category: str) -> int:
+        return sum(size for _, size, _ in self._entries(category))
+
+    def _evict(self, category: str):
+        """drops least recently used entries until the category is back under 90% of the cap"""
+        entries = sorted(self._entries(category), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            self._remove(category, path)
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._sizes[category] = total
+        self._count(category, "evictions", evicted)
+
+    def _remove(self, category: str, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def purge(self, category: Optional[str] = None):
+        """removes every entry (of one category, or all of them)"""
+        if category:
+            categories = [category]
+        elif os.path.isdir(self.directory):
+            categories = os.listdir(self.directory)
+        else:
+            categories = []
+        for cat in categories:
+            for path, _, _ in list(self._entries(cat)):
+                self._remove(cat, path)
+            with self._lock:
+                self._sizes.pop(cat, None)
+
+        # a fresh token rather than a counter, so a stamp deleted by hand still reads as a change
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = os.path.join(self.directory, GENERATION_FILE)
+        tmp = f"{stamp}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(str(time.time_ns()))
+        os.replace(tmp, stamp)
+
+    def generation(self) -> Optional[str]:
+        try:
+            with open(os.path.join(self.directory, GENERATION_FILE), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+
+class SQLiteCacheStore(CacheStore):
+    """
+    Every entry in one SQLite table keyed by (category, key), so lookups are an
+    index hit and a category purge is one DELETE instead of thousands of files.
+    WAL mode plus a busy timeout lets several gunicorn workers share the file,
+    each thread keeps its own connection.
+    """
+
+    # only write accessed_at back if it's older than this, so hits stay reads
+    TOUCH_INTERVAL = 60
+
+    def __init__(self, db_path: str = CACHE_DB_PATH, ttls: Optional[Dict[str, Optional[int]]] = None,
+                 max_bytes: int = CATEGORY_MAX_BYTES):
+        super().__init__(ttls, max_bytes)
+        self.db_path = db_path
+        self._local = threading.local()
+        # fail now (and fall back to files) rather than on the first request
+        self._conn()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        # connections can't cross a fork, so workers open their own
+        if conn is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""CREATE TABLE IF NOT EXISTS entries (
+                category TEXT NOT NULL, key TEXT NOT NULL, data TEXT NOT NULL, size INTEGER NOT NULL,
+                stored_at REAL NOT NULL, accessed_at REAL NOT NULL,
+                PRIMARY KEY (category, key)) WITHOUT ROWID""")
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (category, accessed_at)")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def path(self, category: str, identifier: str) -> str:
+        return self.db_path
+
+    def lookup(self, category: str, identifier: str) -> Optional[Tuple[Any, float]]:
+        key = cache_key(identifier)
+        conn = self._conn()
+        row = conn.execute("SELECT data, stored_at, accessed_at FROM entries WHERE category = ? AND key = ?",
+                           (category, key)).fetchone()
+        if row is None:
+            self._count(category, "misses")
+            return None
+
+        data, stored_at, accessed_at = row
+        if self._expired(category, stored_at):
+            conn.execute("DELETE FROM entries WHERE category = ? AND key = ?", (category, key))
+            self._count(category, "expired")
+            self._count(category, "misses")
+            return None
+
+        now = time.time()
+        if now - accessed_at > self.TOUCH_INTERVAL:
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE category = ? AND key = ?", (now, category, key))
+        self._count(category, "hits")
+        return json.loads(data), stored_at
+
+    def set(self, category: str, identifier: str, data: Any):
+        payload = json.dumps(data, separators=(",", ":"))
+        now = time.time()
+        conn = self._conn()
+        conn.execute("INSERT OR REPLACE INTO entries (category, key, data, size, stored_at, accessed_at) "
+                     "VALUES (?, ?, ?, ?, ?, ?)", (category, cache_key(identifier), payload, len(payload), now, now))
+        self._count(category, "writes")
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries WHERE category = ?", (category,)).fetchone()[0]
+        if total > self.max_bytes:
+            self._evict(conn, category, total)
+
+    def _evict(self, conn: sqlite3.Connection, category: str, total: int):
+        """drops least recently used entries until the category is back under 90% of the cap"""
+        target = self.max_bytes * 0.9
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM entries WHERE category = ? ORDER BY accessed_at",
+                                      (category,)):
+            if total <= target:
+                break
+            victims.append((category, key))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE category = ? AND key = ?", victims)
+        self._count(category, "evictions", len(victims))
+
+    def purge(self, category: Optional[str] = None):
+        """removes every entry (of one category, or all of them)"""
+        conn = self._conn()
+        if category:
+            conn.execute("DELETE FROM entries WHERE category = ?", (category,))
+        else:
+            conn.execute("DELETE FROM entries")
+        # bumped after the delete, so nobody refills their memory tier from rows about to go
+        conn.execute("INSERT INTO meta (name, value) VALUES ('purge_generation', 1) "
+                     "ON CONFLICT(name) DO UPDATE SET value = value + 1")
+
+    def generation(self) -> int:
+        row = self._conn().execute("SELECT value FROM meta WHERE name = 'purge_generation'").fetchone()
+        return row[0] if row else 0
+
+
+class TieredCacheStore(CacheStore):
+    """
+    Bounded in-memory LRU in front of a persistent store, written through on set.
+    entries are kept as json strings, so every get hands out a fresh copy callers
+    can mutate (the routes set "cached": True on what they get back). the memory
+    tier is per process, purge() clears it along with the backend, and a purge from
+    another process is picked up from the backend's generation() on the next memory hit.
+    """
+
+    def __init__(self, backend: CacheStore, max_entries: int = MEMORY_CACHE_ENTRIES,
+                 max_bytes: int = MEMORY_CACHE_BYTES):
+        super().__init__(backend.ttls, backend.max_bytes)
+        self.backend = backend
+        self.max_entries = max_entries
+        self.memory_max_bytes = max_bytes
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._generation = backend.generation()
+
+    def _purged_elsewhere(self) -> bool:
+        """drops the whole memory tier if the backend was purged since we last looked"""
+        generation = self.backend.generation()
+        with self._lock:
+            changed = generation != self._generation
+            self._generation = generation
+        if changed:
+            self.clear_memory()
+        return changed
+
+    def path(self, category: str, identifier: str) -> str:
+        return self.backend.path(category, identifier)
+
+    def _remember(self, category: str, identifier: str, payload: str, stored_at: float):
+        if len(payload) > self.memory_max_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop((category, identifier), None)
+            if old:
+                self._memory_bytes -= len(old[0])
+            self._memory[(category, identifier)] = (payload, stored_at)
+            self._memory_bytes += len(payload)
+            while len(self._memory) > self.max_entries or self._memory_bytes > self.memory_max_bytes:
+                _, (dropped, _) = self._memory.popitem(last=False)
+                self._memory_bytes -= len(dropped)
+
+    def lookup(self, category: str, identifier: str) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            hit = self._memory.get((category, identifier))
+            if hit:
+                self._memory.move_to_end((category, identifier))
+        if hit and self._purged_elsewhere():
+            hit = None
+        if hit and not self._expired(category, hit[1]):
+            self._count(category, "memory_hits")
+            return json.loads(hit[0]), hit[1]
+        if hit:
+            self.invalidate(category, identifier)
+
+        found = self.backend.lookup(category, identifier)
+        if found:
+            self._remember(category, identifier, json.dumps(found[0], separators=(",", ":")), found[1])
+        return found
+
+    def set(self, category: str, identifier: str, data: Any):
+        self.backend.set(category, identifier, data)
+        self._remember(category, identifier, json.dumps(data, separators=(",", ":")), time.time())
+
+    def invalidate(self, category: str, identifier: str):
+        with self._lock:
+            old = self._memory.pop((category, identifier), None)
+            if old:
+                self._memory_bytes -= len(old[0])
+
+    def clear_memory(self, category: Optional[str] = None):
+        with self._lock:
+            for key in [k for k in self._memory if category is None or k[0] == category]:
+                self._memory_bytes -= len(self._memory.pop(key)[0])
+
+    def purge(self, category: Optional[str] = None):
+        self.clear_memory(category)
+        self.backend.purge(category)
+        with self._lock:
+            self._generation = self.backend.generation()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        merged = self.backend.stats()
+        for cat, counts in super().stats().items():
+            merged.setdefault(cat, {}).update(counts)
+        return merged
+
+
+def _make_store() -> CacheStore:
+    backend = None
+    if CACHE_BACKEND == "sqlite":
+        try:
+            backend = SQLiteCacheStore()
+        except sqlite3.Error as e:
+            print(f"WARNING [Cache]: could not open {CACHE_DB_PATH}, using file cache: {e}")
+    if backend is None:
+        backend = FileCacheStore()
+    if MEMORY_CACHE_ENTRIES <= 0:
+        return backend
+    return TieredCacheStore(backend)
+
+
+cache_store = _make_store()
+
+
 def get_cache_path(category: str, identifier: str) -> str:
-    """Get the full path to a cache file"""
-    cat_dir = os.path.join(CACHE_DIR, category)
-    os.makedirs(cat_dir, exist_ok=True)
-    
-    file_hash = hashlib.md5(identifier.encode('utf-8')).hexdigest()
-    return os.path.join(cat_dir, f"{file_hash}.json")
+    """Get the full path to a cache file (the database file for the sqlite backend)"""
+    return cache_store.path(category, identifier)
 
 
 def get_cached_data(category: str, identifier: str) -> Optional[Any]:
-    cache_path = get_cache_path(category, identifier)
-    if os.path.exists(cache_path):
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            print(f"found cached data in {category}/{os.path.basename(cache_path)}")
-            return json.load(f)
-    return None
+    return cache_store.get(category, identifier)
 
 
 def save_to_cache(category: str, identifier: str, data: Any):
-    cache_path = get_cache_path(category, identifier)
-    with open(cache_path, 'w', encoding='utf-8') as f:
-        print(f"caching data in {category}/{os.path.basename(cache_path)}")
-        json.dump(data, f, indent=4)
+    cache_store.set(category, identifier, data)
+
+
+def purge_cache_data(category: Optional[str] = None):
+    cache_store.purge(category)
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """hit / miss / write / eviction counters per category since the process started"""
+    return cache_store.stats()
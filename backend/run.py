@@ -1,16 +1,28 @@
 from core.parsers.update_skills import update_skills
 from api import create_app
+from core.service.warmup import WARM_UP_MODELS, start_warm_up
 
 
 app = create_app()
 
 from flask import send_from_directory
 import os
+import threading
+
+# refreshing the skills list is a network call, off by default and it never blocks start-up
+UPDATE_SKILLS_ON_START = os.getenv("UPDATE_SKILLS_ON_START", "false").lower() == "true"
 
 @app.route('/uploads/<path:filename>')
 def serve_uploads(filename):
     return send_from_directory('uploads', filename)
 
 if __name__ == "__main__":
-    update_skills()
+    # the reloader's watcher process never serves requests, only warm the child.
+    # not in create_app, spawned pool workers re-import this module and build the app too
+    serving = os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+    if WARM_UP_MODELS and serving:
+        start_warm_up()
+    # once per start rather than again in the reloader's child
+    if UPDATE_SKILLS_ON_START and not serving:
+        threading.Thread(target=update_skills, name="update-skills", daemon=True).start()
     app.run(debug=True)
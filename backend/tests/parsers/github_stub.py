@@ -0,0 +1,179 @@
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# small stand-in for api.github.com, enough for a GitHubDataSource scan
+
+USER = "octo"
+REPOS = [
+    {"name": f"repo{i}", "full_name": f"{USER}/repo{i}", "stargazers_count": i % 3, "forks_count": i % 2,
+     "fork": i == 4, "topics": ["cli"] if i == 1 else [], "html_url": f"https://github.com/{USER}/repo{i}",
+     "description": None, "language": "Python", "created_at": "2021-01-01T00:00:00Z",
+     "updated_at": "2023-06-01T00:00:00Z", "license": None}
+    for i in range(150)
+]
+
+
+def contributors(i):
+    return [
+        {"author": {"login": USER}, "total": 10 + i, "weeks": [{"a": 100 + i}]},
+        {"author": {"login": "someone"}, "total": 5, "weeks": [{"a": 50}]}
+    ]
+
+
+def resource(path):
+    if path == "/graphql":
+        return "graphql"
+    return "search" if path.startswith("/search/") else "core"
+
+
+def graphql(query, variables):
+    """just enough of the two queries in github_graphql.py"""
+    if "mine:" not in query:
+        return {"user": {"id": "U_1", "login": USER, "name": "Octo Cat", "url": f"https://github.com/{USER}",
+                         "email": "", "followers": {"totalCount": 3}, "following": {"totalCount": 1},
+                         "repositories": {"totalCount": len(REPOS)}}}
+    start = int(variables.get("cursor") or 0)
+    end = start + variables["perPage"]
+    nodes = []
+    for i, r in enumerate(REPOS[start:end], start):
+        stats = contributors(i)
+        nodes.append({
+            "name": r["name"], "nameWithOwner": r["full_name"], "description": r["description"],
+            "url": r["html_url"], "isFork": r["fork"], "stargazerCount": r["stargazers_count"],
+            "forkCount": r["forks_count"], "createdAt": r["created_at"], "updatedAt": r["updated_at"],
+            "primaryLanguage": {"name": r["language"]}, "licenseInfo": None,
+            "repositoryTopics": {"nodes": [{"topic": {"name": t}} for t in r["topics"]]},
+            "languages": {"edges": [{"size": 8000 + i, "node": {"name": "Python"}},
+                                    {"size": 800, "node": {"name": "Shell"}}]},
+            "defaultBranchRef": {"target": {"history": {"totalCount": sum(c["total"] for c in stats)},
+                                            "mine": {"totalCount": stats[0]["total"]}}}
+        })
+    return {"user": {"repositories": {"nodes": nodes,
+                                      "pageInfo": {"hasNextPage": end < len(REPOS), "endCursor": str(end)}}}}
+
+
+class GitHubStub:
+    """
+    runs the stub on a random local port, counts the requests it sees (path + query).
+    200s carry an ETag, and a matching If-None-Match gets an empty 304 back.
+
+    limit: per resource budget for each window of `window` seconds, going over it gets a 403
+    pending_stats: how many times each stats endpoint answers 202 before the real data
+    throttle: how many requests get a 429 (with Retry-After) before anything else
+    """
+
+    def __init__(self, limit=None, window=1.0, pending_stats=0, throttle=0):
+        self.hits = Counter()
+        self.not_modified = Counter()
+        self.limit = limit
+        self.window = window
+        self.pending_stats = pending_stats
+        self.throttle = throttle
+        self.over_limit = 0
+        self.used = Counter()
+        self.window_end = time.time() + window
+        self.stats_asked = Counter()
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                with stub.lock:
+                    stub.hits[self.path] += 1
+                    limited, budget_headers = stub.rate_limit(url.path)
+                if limited:
+                    status, body, headers = limited
+                else:
+                    status, body, headers = stub.respond(url.path, parse_qs(url.query), self.headers)
+                headers = {**budget_headers, **headers}
+                payload = json.dumps(body).encode("utf-8") if body is not None else b""
+                if status == 200:
+                    etag = '"%s"' % hashlib.sha1(payload).hexdigest()
+                    headers = {**headers, "ETag": etag}
+                    if self.headers.get("If-None-Match") == etag:
+                        with stub.lock:
+                            stub.not_modified[self.path] += 1
+                        status, payload = 304, b""
+                self._send(status, payload, headers)
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub.lock:
+                    stub.hits[self.path] += 1
+                    limited, budget_headers = stub.rate_limit(self.path)
+                if limited:
+                    status, body, headers = limited
+                elif self.path == "/graphql":
+                    status, body, headers = 200, {"data": graphql(request["query"], request["variables"])}, {}
+                else:
+                    status, body, headers = 404, {"message": "Not Found"}, {}
+                self._send(status, json.dumps(body).encode("utf-8"), {**budget_headers, **headers})
+
+            def _send(self, status, payload, headers):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def rate_limit(self, path):
+        """called under the lock, returns (a 429/403 response or None, the budget headers)"""
+        if self.throttle > 0:
+            self.throttle -= 1
+            return (429, {"message": "slow down"}, {"Retry-After": "0"}), {}
+        if self.limit is None:
+            return None, {}
+        if time.time() >= self.window_end:
+            self.used.clear()
+            self.window_end = time.time() + self.window
+        res = resource(path)
+        headers = {"X-RateLimit-Reset": str(self.window_end), "X-RateLimit-Resource": res}
+        if self.used[res] >= self.limit:
+            self.over_limit += 1
+            return (403, {"message": "API rate limit exceeded"}, {}), {**headers, "X-RateLimit-Remaining": "0"}
+        self.used[res] += 1
+        return None, {**headers, "X-RateLimit-Remaining": str(self.limit - self.used[res])}
+
+    def respond(self, path, query, headers):
+        if path == f"/users/{USER}":
+            return 200, {"login": USER, "name": "Octo Cat", "public_repos": len(REPOS), "html_url": f"https://github.com/{USER}"}, {}
+        if path == f"/users/{USER}/repos":
+            page = int(query.get("page", ["1"])[0])
+            per_page = int(query.get("per_page", ["30"])[0])
+            return 200, REPOS[(page - 1) * per_page: page * per_page], {}
+        if path.startswith("/repos/") and path.endswith("/languages"):
+            i = int(path.split("/")[3][4:])
+            return 200, {"Python": 8000 + i, "Shell": 800}, {}
+        if path.startswith("/repos/") and path.endswith("/stats/contributors"):
+            i = int(path.split("/")[3][4:])
+            with self.lock:
+                self.stats_asked[path] += 1
+                if self.stats_asked[path] <= self.pending_stats:
+                    return 202, {}, {}
+            return 200, contributors(i), {}
+        if path.startswith("/search/"):
+            return 200, {"total_count": 7, "items": [{"repository_url": "https://api.github.com/repos/a/b"}]}, {}
+        return 404, {"message": "Not Found"}, {}
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
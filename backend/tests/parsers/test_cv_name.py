@@ -0,0 +1,46 @@
+import os
+import sys
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.parsers import cv
+from core.parsers.cv import name_from_header, extract_names
+
+
+def test_header_name_confirmed_by_email():
+    text = "JANE DOE\nLondon, UK | jane.doe@example.com\nEXPERIENCE\n"
+    assert name_from_header(text, "jane.doe@example.com") == "Jane Doe"
+    assert name_from_header("Jonathan Smith\nSoftware Engineer", "jsmith99@mail.com") == "Jonathan Smith"
+
+
+def test_header_name_needs_confidence():
+    # no email, or an email that doesn't share a word with any header line
+    assert name_from_header("Jane Doe\nEngineer", None) is None
+    assert name_from_header("Jane Doe\nEngineer", "contact@example.com") is None
+    # lines that don't look like names are never picked
+    assert name_from_header("jane.doe@example.com | +44 7700 900000", "jane.doe@example.com") is None
+
+
+def test_extract_names_only_runs_model_on_leftovers(monkeypatch):
+    piped = []
+
+    class FakeEnt:
+        def __init__(self, text):
+            self.text, self.label_ = text, "PERSON"
+
+    class FakeDoc:
+        def __init__(self, text):
+            self.ents = [FakeEnt("Model Name")]
+
+    class FakeNLP:
+        def pipe(self, texts, batch_size):
+            texts = list(texts)
+            piped.extend(texts)
+            return [FakeDoc(t) for t in texts]
+
+    monkeypatch.setattr(cv, "get_nlp", lambda: FakeNLP())
+    raw = ["Jane Doe\nEngineer", "Curriculum Vitae\nSkills"]
+    names = extract_names([r.replace("\n", " ") for r in raw], raw, ["jane@x.com", "someone@x.com"])
+
+    assert names == ["Jane Doe", "Model Name"]
+    assert piped == ["Curriculum Vitae Skills"]
@@ -0,0 +1,73 @@
+import os
+import sys
+import threading
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+sys.path.append(os.path.dirname(__file__))
+import core.parsers.github as github
+from core.parsers.github_cache import GitHubHTTPCache
+from core.parsers.github_client import GitHubClient
+from github_stub import GitHubStub, USER
+
+
+def _scan(stub, cache):
+    client = GitHubClient(stub.url, github.GITHUB_HEADERS, max_workers=4, cache=cache)
+    github.github_client = client
+    return github.GitHubDataSource().process(f"https://github.com/{USER}")
+
+
+def test_fresh_entries_skip_the_network(monkeypatch, tmp_path):
+    monkeypatch.setattr(github, "github_client", github.github_client)
+    cache = GitHubHTTPCache(str(tmp_path))
+    with GitHubStub() as stub:
+        first = _scan(stub, cache)
+        hits = sum(stub.hits.values())
+        second = _scan(stub, cache)
+
+    assert second == first
+    assert sum(stub.hits.values()) == hits
+
+
+def test_stale_entries_are_revalidated_with_etags(monkeypatch, tmp_path):
+    monkeypatch.setattr(github, "github_client", github.github_client)
+    # everything expires straight away, so the second scan asks again conditionally
+    cache = GitHubHTTPCache(str(tmp_path), ttls=[], default_ttl=0)
+    with GitHubStub() as stub:
+        first = _scan(stub, cache)
+        stub.hits.clear()
+        second = _scan(stub, cache)
+
+    assert second == first
+    assert stub.hits and stub.not_modified == stub.hits
+
+
+def test_ttl_per_endpoint_type(tmp_path):
+    cache = GitHubHTTPCache(str(tmp_path))
+    assert cache.ttl_for(f"/users/{USER}") == 6 * 3600
+    assert cache.ttl_for(f"/repos/{USER}/repo1/languages") == 24 * 3600
+    assert cache.ttl_for("/search/commits") == 3600
+
+
+def test_store_from_many_threads_and_failed_writes(tmp_path):
+    cache = GitHubHTTPCache(str(tmp_path))
+    errors = []
+
+    def write(i):
+        try:
+            for _ in range(20):
+                cache.store("same-key", {"stored_at": i, "body": [i] * 50})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert cache.load("same-key")["body"][0] in range(8)
+
+    # unwritable entries are skipped, not raised
+    cache.store("other-key", {"body": object()})
+    assert cache.load("other-key") is None
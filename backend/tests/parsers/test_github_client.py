@@ -0,0 +1,22 @@
+import os
+import sys
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+sys.path.append(os.path.dirname(__file__))
+import core.parsers.github as github
+from core.parsers.github_client import GitHubClient
+from github_stub import GitHubStub, REPOS, USER
+
+def test_scan_fetches_each_endpoint_once(monkeypatch):
+    with GitHubStub() as stub:
+        monkeypatch.setattr(github, "github_client", GitHubClient(stub.url, github.GITHUB_HEADERS, max_workers=4))
+        data = github.GitHubDataSource().process(f"https://github.com/{USER}")
+
+    assert max(stub.hits.values()) == 1
+    # languages for the first 50 repos, contributor stats for all of them
+    assert sum(1 for p in stub.hits if p.endswith("/languages")) == github.REPO_LIMIT
+    assert sum(1 for p in stub.hits if p.endswith("/stats/contributors")) == len(REPOS)
+    assert data["repo_count"] == len(REPOS) - 1
+    assert [p["name"] for p in data["featured_projects"]] == ["repo2", "repo5", "repo8"]
+    assert data["featured_projects"][0]["commits"] == 12
@@ -0,0 +1,32 @@
+import os
+import sys
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+sys.path.append(os.path.dirname(__file__))
+import core.parsers.github as github
+from core.parsers.github_client import GitHubClient
+from core.parsers.github_graphql import GitHubGraphQLDataSource
+from github_stub import GitHubStub, REPOS, USER
+
+
+def test_graphql_backend_matches_rest_shape(monkeypatch):
+    with GitHubStub() as stub:
+        monkeypatch.setattr(github, "github_client", GitHubClient(stub.url, github.GITHUB_HEADERS, max_workers=4))
+        rest = github.GitHubDataSource().process(f"https://github.com/{USER}")
+        stub.hits.clear()
+        data = GitHubGraphQLDataSource().process(f"https://github.com/{USER}")
+
+    # profile + 3 repo pages + the 3 activity searches
+    assert sum(stub.hits.values()) == 7
+    assert not any(p.startswith("/repos/") for p in stub.hits)
+
+    assert data.keys() == rest.keys()
+    # lines follow the contribution ratio, which graphql estimates from commits instead of additions
+    strip = lambda repos: [{k: v for k, v in r.items() if k != "lines"} for r in repos]
+    assert strip(data["repositories"]) == strip(rest["repositories"])
+    assert data["repo_count"] == len(REPOS) - 1
+    assert [p.keys() for p in data["featured_projects"]] == [p.keys() for p in rest["featured_projects"]]
+    assert [p["commits"] for p in data["featured_projects"]] == [p["commits"] for p in rest["featured_projects"]]
+    assert [l["label"] for l in data["languages"]] == [l["label"] for l in rest["languages"]]
+    assert data["email"] is None
@@ -0,0 +1,110 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+sys.path.append(os.path.dirname(__file__))
+import core.parsers.github as github
+from core.parsers.github_client import GitHubClient
+from core.parsers.github_scheduler import GitHubScheduler
+from github_stub import GitHubStub, USER
+
+
+def _client(stub, **kwargs):
+    scheduler = GitHubScheduler(max_workers=4, backoff_base=0.01, **kwargs)
+    return GitHubClient(stub.url, github.GITHUB_HEADERS, max_workers=4, scheduler=scheduler)
+
+
+def test_pending_stats_are_retried(monkeypatch):
+    with GitHubStub(pending_stats=2) as stub:
+        monkeypatch.setattr(github, "github_client", _client(stub))
+        data = github.GitHubDataSource().process(f"https://github.com/{USER}")
+
+    # real commit counts, not the 0 a 202 used to turn into
+    assert data["featured_projects"][0]["commits"] == 12
+    assert set(stub.stats_asked.values()) == {3}
+
+
+def test_throttled_requests_back_off_and_retry(monkeypatch):
+    with GitHubStub(throttle=3) as stub:
+        monkeypatch.setattr(github, "github_client", _client(stub))
+        data = github.GitHubDataSource().process(f"https://github.com/{USER}")
+
+    assert data["username"] == USER
+    assert data["featured_projects"][0]["commits"] == 12
+
+
+def test_scans_stay_inside_the_rate_limit(monkeypatch):
+    # two scans need ~400 requests against 150 per window
+    with GitHubStub(limit=150, window=0.5) as stub:
+        monkeypatch.setattr(github, "github_client", _client(stub, low_budget=20))
+        results = [github.GitHubDataSource().process(f"https://github.com/{USER}") for _ in range(2)]
+
+    assert stub.over_limit == 0
+    assert results[0] == results[1]
+
+
+class FakeResponse:
+    def __init__(self, remaining, reset_at):
+        self.status_code = 200
+        self.text = ""
+        self.headers = {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset_at)}
+
+
+def test_profile_calls_go_first_when_budget_is_low():
+    scheduler = GitHubScheduler(max_workers=1, low_budget=10)
+    reset_at = time.time() + 0.5
+    order = []
+    gate = threading.Event()
+
+    def send(name, remaining):
+        def _send():
+            gate.wait()
+            order.append(name)
+            return FakeResponse(remaining, reset_at)
+        return _send
+
+    # first response leaves only 5 requests in the window
+    first = scheduler.submit(f"/users/{USER}", send("first", 5), lambda r: r)
+    repo = scheduler.submit(f"/repos/{USER}/repo1/languages", send("repo", 4), lambda r: r)
+    profile = scheduler.submit(f"/users/other", send("profile", 4), lambda r: r)
+    gate.set()
+    for f in (first, repo, profile):
+        f.result(timeout=5)
+
+    # the per-repo call waited for the window to reset
+    assert order == ["first", "profile", "repo"]
+
+
+def test_unauthenticated_limit_still_lets_repo_calls_through():
+    # 60 an hour without a token, the reserve shrinks to a tenth of that
+    scheduler = GitHubScheduler(max_workers=1, low_budget=100)
+    reset_at = time.time() + 3600
+
+    def send(remaining):
+        def _send():
+            response = FakeResponse(remaining, reset_at)
+            response.headers["X-RateLimit-Limit"] = "60"
+            return response
+        return _send
+
+    scheduler.submit(f"/users/{USER}", send(59), lambda r: r).result(timeout=5)
+    start = time.time()
+    scheduler.submit(f"/repos/{USER}/repo1/languages", send(58), lambda r: r).result(timeout=5)
+    assert time.time() - start < 1
+
+
+def test_repo_calls_held_back_too_long_are_skipped():
+    scheduler = GitHubScheduler(max_workers=1, low_budget=10, low_max_wait=0.3)
+    reset_at = time.time() + 3600
+    scheduler.submit(f"/users/{USER}", lambda: FakeResponse(5, reset_at), lambda r: r).result(timeout=5)
+
+    held = scheduler.submit(f"/repos/{USER}/repo1/languages", lambda: FakeResponse(4, reset_at), lambda r: r)
+    with pytest.raises(TimeoutError):
+        held.result(timeout=5)
+    # high priority calls still go through
+    assert scheduler.submit("/users/other", lambda: FakeResponse(4, reset_at), lambda r: r).result(timeout=5)
@@ -0,0 +1,144 @@
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+import core.parsers.linkedin as linkedin
+from core.parsers.linkedin import LinkedInDataSource
+
+
+class FakeApify:
+    """
+    stand-in for the actor's endpoints, records the urls of every run. single urls go
+    through run-sync-get-dataset-items, batches start a run that has written its first
+    item and finishes on the first status poll (or never, if stuck)
+    """
+
+    def __init__(self, skip_in_batch=(), broken=(), stuck=False):
+        self.runs, self.aborted = [], []
+        self.datasets, self.pending = {}, {}
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body):
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                path = urlparse(self.path).path
+                if path.endswith("/abort"):
+                    fake.aborted.append(path.split("/")[-2])
+                    return self._send(json.dumps({"data": {"status": "ABORTED"}}))
+
+                urls = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["urls"]
+                fake.runs.append(urls)
+                # like the real actor, some profiles just don't come back from a big run
+                items = [{"publicIdentifier": linkedin.extract_linkedin_id(u).lower(), "firstName": linkedin.extract_linkedin_id(u),
+                          "lastName": "Test", "headline": "Engineer"}
+                         for u in urls
+                         if u not in broken and not (len(urls) > 1 and u in skip_in_batch)]
+                if "run-sync" in path:
+                    return self._send(json.dumps(items))
+
+                run_id = str(len(fake.runs))
+                fake.datasets[run_id], fake.pending[run_id] = items[:1], items
+                self._send(json.dumps({"data": {"id": run_id, "defaultDatasetId": run_id, "status": "RUNNING"}}))
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                parts = url.path.split("/")
+                if parts[-2] == "actor-runs":
+                    if stuck:
+                        time.sleep(0.05)
+                        return self._send(json.dumps({"data": {"status": "RUNNING"}}))
+                    fake.datasets[parts[-1]] = fake.pending[parts[-1]]
+                    return self._send(json.dumps({"data": {"status": "SUCCEEDED"}}))
+                offset = int(parse_qs(url.query)["offset"][0])
+                self._send("\n".join(json.dumps(i) for i in fake.datasets[parts[-2]][offset:]))
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def test_batch_shares_runs_and_falls_back_per_url(monkeypatch):
+    urls = [f"https://www.linkedin.com/in/person{i}/" for i in range(7)]
+    with FakeApify(skip_in_batch={urls[2]}, broken={urls[5]}) as apify:
+        monkeypatch.setattr(linkedin, "APIFY_API_BASE", apify.url)
+        monkeypatch.setattr(linkedin, "LINKEDIN_BATCH_SIZE", 4)
+        streamed = []
+        results = LinkedInDataSource().process_batch(urls, lambda url, r: streamed.append(url))
+
+    # two batch runs, then one run each for the two profiles they didn't return
+    assert [len(r) for r in apify.runs[:2]] == [4, 3]
+    assert sorted(apify.runs[2:]) == [[urls[2]], [urls[5]]]
+
+    assert sorted(streamed) == sorted(urls)
+    assert results[urls[2]]["full_name"] == "person2 Test"
+    assert results[urls[0]]["source"] == "linkedin"
+    assert isinstance(results[urls[5]], ValueError)
+    assert apify.aborted == []
+
+
+def test_run_that_outlives_the_timeout_is_aborted(monkeypatch):
+    urls = [f"https://www.linkedin.com/in/person{i}/" for i in range(3)]
+    with FakeApify(stuck=True) as apify:
+        monkeypatch.setattr(linkedin, "APIFY_API_BASE", apify.url)
+        monkeypatch.setattr(linkedin, "LINKEDIN_BATCH_TIMEOUT", 0.2)
+        results = LinkedInDataSource().process_batch(urls)
+
+    # the first profile was already in the dataset, the run is stopped and the rest go single
+    assert apify.aborted == ["1"]
+    assert sorted(apify.runs[1:]) == [[urls[1]], [urls[2]]]
+    assert results[urls[0]]["full_name"] == "person0 Test"
+    assert results[urls[2]]["full_name"] == "person2 Test"
+
+
+def test_failed_stream_keeps_profiles_already_returned(monkeypatch):
+    urls = [f"https://www.linkedin.com/in/person{i}/" for i in range(3)]
+    single_runs = []
+
+    def broken_batch(chunk, on_result):
+        on_result(chunk[0], {"firstName": "person0", "lastName": "Test"})
+        on_result(chunk[1], None)  # doesn't parse
+        raise ConnectionError("stream dropped")
+
+    def single(url):
+        single_runs.append(url)
+        return {"firstName": "single", "lastName": "Run"}
+
+    def parse(data):
+        if data is None:
+            raise ValueError("bad profile")
+        return {"full_name": data["firstName"]}
+
+    monkeypatch.setattr(linkedin, "linkedin_batch_scrape", broken_batch)
+    monkeypatch.setattr(linkedin, "linkedin_person_scrape", single)
+    monkeypatch.setattr(linkedin, "parse_linkedin_profile", parse)
+    streamed = []
+    results = LinkedInDataSource().process_batch(urls, lambda url, r: streamed.append(url))
+
+    # only the url the stream never got to is run again, every url is reported once
+    assert single_runs == [urls[2]]
+    assert sorted(streamed) == sorted(urls)
+    assert results[urls[0]]["full_name"] == "person0"
+    assert isinstance(results[urls[1]], ValueError)
+    assert results[urls[2]]["full_name"] == "single"
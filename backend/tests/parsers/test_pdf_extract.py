@@ -0,0 +1,50 @@
+import os
+import sys
+
+import pdfplumber
+import pypdfium2 as pdfium
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.parsers.pdf_extract import extract_pdf
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "data", "job descriptions", "software", "Python_Trading.pdf")
+
+
+def _long_pdf(tmp_path, copies=6):
+    src = pdfium.PdfDocument(SAMPLE)
+    doc = pdfium.PdfDocument.new()
+    for _ in range(copies):
+        doc.import_pages(src)
+    path = str(tmp_path / "long.pdf")
+    doc.save(path)
+    doc.close()
+    src.close()
+    return path
+
+
+def _plumber_text(path):
+    with pdfplumber.open(path) as pdf:
+        return "\n".join(t for t in (p.extract_text() for p in pdf.pages) if t)
+
+
+def test_parallel_pages_match_serial_extraction(tmp_path):
+    path = _long_pdf(tmp_path)
+    serial = extract_pdf(path, workers=1)
+    parallel = extract_pdf(path, workers=3)
+
+    assert serial["text"] == _plumber_text(path)
+    assert parallel["text"] == serial["text"]
+    assert parallel["links"] == serial["links"]
+    assert [t["page"] for t in parallel["page_timings"]] == list(range(1, serial["total_pages"] + 1))
+
+
+def test_page_cap_and_pdfium_engine(tmp_path):
+    path = _long_pdf(tmp_path)
+    capped = extract_pdf(path, max_pages=2, workers=1)
+    assert capped["truncated"] and len(capped["page_timings"]) == 2
+
+    fast = extract_pdf(path, engine="pdfium", workers=1)
+    assert fast["engine"] == "pdfium"
+    # different engine, same words
+    assert set(fast["text"].split()) == set(_plumber_text(path).split())
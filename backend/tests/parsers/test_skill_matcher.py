@@ -0,0 +1,22 @@
+import os
+import sys
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.parsers.skill_matcher import SkillMatcher
+
+def test_word_boundaries_only_on_alphanumeric_ends():
+    m = SkillMatcher(["java", "javascript", "c++", "c", ".net", "node.js", "node"], boundary="word")
+    found = m.find("javascript, c++ and asp.net on node.js")
+    # "java" is inside "javascript" and ".net" is allowed to follow "asp"
+    assert found == {"javascript", "c++", "c", ".net", "node.js", "node"}
+
+def test_token_boundaries_treat_hyphens_as_word_chars():
+    m = SkillMatcher(["go", "react", "c#", "end"], boundary="token")
+    assert m.find("front-end in react-native, go and c#") == {"go", "c#"}
+    assert m.find("golang") == set()
+
+def test_overlapping_terms_are_all_found():
+    m = SkillMatcher(["he", "she", "his", "hers"], boundary="word")
+    assert m.find("ushers") == set()
+    assert SkillMatcher(["he", "she", "hers"], boundary="token").find("she hers") == {"she", "hers"}
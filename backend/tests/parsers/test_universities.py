@@ -0,0 +1,56 @@
+import os
+import sys
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.parsers.universities import UniversityMatcher, INSTITUTION_KEYWORDS
+
+DATA = {
+    "tiers": {
+        "tier_1": ["University of Oxford", "Imperial College London"],
+        "tier_2": ["University of Warwick"],
+        "tier_3": ["University of Leeds", "Imperial College London"],
+    },
+    "uk_universities": ["University of Oxford", "University College London", "UCL"],
+}
+
+
+def _old_tier(school):
+    # the per call loop the matcher replaces
+    for tier, schools in DATA["tiers"].items():
+        if any(s.lower() in school.lower() for s in schools):
+            return tier
+    return None
+
+
+def _old_is_institution(line):
+    line = line.lower()
+    return any(u.lower() in line for u in DATA["uk_universities"]) or any(k in line for k in INSTITUTION_KEYWORDS)
+
+
+def test_matches_substring_checks():
+    matcher = UniversityMatcher(DATA)
+    lines = [
+        "Imperial College London", "MEng Computing, IMPERIAL COLLEGE LONDON", "University of Leeds | BSc",
+        "Warwick", "University of Warwick and University of Oxford", "Sixth Form", "Key modules: algorithms",
+        "London Academy of Excellence", "UCL, 2019 - 2022", "",
+    ]
+    for line in lines:
+        assert matcher.tier_for(line) == _old_tier(line), line
+        assert matcher.is_institution(line) == _old_is_institution(line), line
+
+    assert matcher.find("BSc, University College London") == {"university college london"}
+
+
+def test_empty_data():
+    matcher = UniversityMatcher({})
+    assert matcher.tier_for("University of Oxford") is None
+    assert matcher.is_institution("Some College")
+    assert matcher.find("University of Oxford") == set()
+
+
+def test_cv_education_header_with_separator():
+    from core.parsers.cv import extract_structured_section
+    text = "EDUCATION\nImperial College London | MEng Computing, 2019 - 2023\n- Key modules: algorithms"
+    [item] = extract_structured_section(text, "education")
+    assert (item["name"], item["subtitle"], item["end_date"]) == ("Imperial College London", "MEng Computing", "2023")
@@ -0,0 +1,49 @@
+import os
+import sys
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.scoring import parallel
+from core.scoring.batch_engine import BatchScoringEngine
+
+JD = {"metrics": {
+    "Languages": {"value": ["Python", "Go"]},
+    "Technologies": {"value": ["Docker", "AWS"]}
+}}
+ACTIVE = ["experience", "languages", "technologies"]
+WEIGHTS = {"experience": 1.0, "languages": 1.0, "technologies": 1.0}
+
+
+def _candidates():
+    return [
+        {"id": 1, "name": "Jane Doe", "email": "jane@example.com", "skills": ["Python", "Docker"],
+         "full_cv_text": "Software engineer, 4 years of Python and Docker on AWS"},
+        {"id": 2, "name": "John Roe", "email": "john@example.com", "skills": ["Go"],
+         "full_cv_text": "Backend developer writing Go services"},
+        {"id": 3, "name": "Sam Poe", "email": "sam@example.com", "skills": [],
+         "full_cv_text": "Graduate, final year project in Java"},
+    ]
+
+
+def _comparable(entries):
+    # the cached CVTextIndex compares by identity, everything else is plain data
+    return [({k: v for k, v in e["candidate"].items() if k != "cv_text_index"}, e["scored_data"], e["shapley"])
+            for e in entries]
+
+
+def test_parallel_batch_matches_serial(monkeypatch):
+    monkeypatch.setattr(parallel, "SCORING_MAX_WORKERS", 2)
+    try:
+        serial = BatchScoringEngine().score_batch(_candidates(), JD, ACTIVE, WEIGHTS, workers=1)
+        sharded = BatchScoringEngine().score_batch(_candidates(), JD, ACTIVE, WEIGHTS, workers=2)
+    finally:
+        parallel.shutdown_pools()
+    assert _comparable(sharded) == _comparable(serial)
+
+
+def test_workers_are_clamped(monkeypatch):
+    monkeypatch.setattr(parallel, "SCORING_MAX_WORKERS", 4)
+    assert parallel.clamp_workers(10_000) == 4
+    assert parallel.clamp_workers(0) == 1
+    assert parallel.clamp_workers(None) == 1
+    assert parallel.clamp_workers(3) == 3
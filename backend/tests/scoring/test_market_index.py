@@ -0,0 +1,61 @@
+import math
+import os
+import sys
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.scoring.market_index import MarketIndex
+from core.scoring.dynamic_weighting import WeightingEngine
+
+class OfflineIndex(MarketIndex):
+    """MarketIndex with a fake Supabase table behind it"""
+    def __init__(self, path, rows):
+        super().__init__(path)
+        self.rows = rows
+
+    def _remote_rows(self):
+        return self.rows
+
+    def _remote_count(self):
+        return len(self.rows)
+
+ROWS = [
+    {"id": 1, "description": "Python and SQL, some Go"},
+    {"id": 2, "description": "React, TypeScript and Node.js"},
+    {"id": 3, "description": None},
+    {"id": 4, "description": "Python backend with Docker"},
+]
+
+def test_df_matches_corpus_scan_and_tracks_edits(tmp_path):
+    index = OfflineIndex(str(tmp_path / "market.sqlite3"), ROWS)
+    index.ensure_synced()
+    assert index.corpus_size() == 3
+    assert index.document_frequencies(["Python", "go", "Rust"]) == {"python": 2, "go": 1, "rust": 0}
+
+    # saving, editing and deleting JDs moves the indexed counts
+    index.add_document(5, "Rust and Python")
+    index.update_document(1, "Java only")
+    index.remove_document(4)
+    assert index.document_frequencies(["python", "go", "rust", "java"]) == {"python": 1, "go": 0, "rust": 1, "java": 1}
+    assert index.corpus_size() == 3
+
+def test_weights_use_index_dfs(tmp_path):
+    index = OfflineIndex(str(tmp_path / "market.sqlite3"), ROWS)
+    engine = WeightingEngine(index)
+    res = engine.calculate_weights("We want Python, Python and Kubernetes", ["Python", "Kubernetes"])
+    # python: 2 market docs + this JD, kubernetes: only this JD
+    assert res["Python"]["math"]["df"] == 3 and res["Kubernetes"]["math"]["df"] == 1
+    assert res["Python"]["math"]["num_docs"] == 4
+    assert res["Kubernetes"]["math"]["idf"] == round(math.log(4 / 2) + 1, 4)
+
+
+def test_index_rows_from_the_jd_routes(tmp_path, monkeypatch):
+    import core.scoring.market_index as mi
+    index = OfflineIndex(str(tmp_path / "market.sqlite3"), [])
+    monkeypatch.setattr(mi, "market_index", index)
+
+    mi.index_rows([{"id": 1, "description": "Python and Docker"}, {"description": "no id yet"}])
+    mi.index_rows(None)
+
+    assert index.document_count() == 1
+    assert index.document_frequencies(["python"]) == {"python": 1}
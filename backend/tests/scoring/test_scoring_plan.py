@@ -0,0 +1,47 @@
+import os
+import sys
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.scoring.registry import ScoringRegistry
+
+JD = {"metrics": {
+    "Languages": {"value": [{"value": "Python"}, "Go"]},
+    "Technologies": {"value": [{"name": "Docker"}, "AWS"]}
+}}
+
+def test_plan_is_shared_per_jd_content():
+    registry = ScoringRegistry()
+    plan = registry.plan_for(JD)
+    # same content in a different object hits the cache, an edited JD doesn't
+    assert registry.plan_for({"metrics": dict(JD["metrics"])}) is plan
+    edited = {"metrics": dict(JD["metrics"], Languages={"value": ["Rust"]})}
+    assert registry.plan_for(edited) is not plan
+
+def test_plan_routing_and_keywords():
+    registry = ScoringRegistry()
+    plan = registry.plan_for(JD)
+    assert plan.metric_for_key("req_python").id == "languages"
+    assert plan.metric_for_key("req_docker").id == "technologies"
+    assert plan.metric_for_key("req_unknown_thing").id == "technologies"
+    assert plan.metric_for_key("experience").id == "experience"
+    assert plan.metric_for_key("nope") is None
+    assert plan.metric_keywords == ["Python", "Go", None, "AWS"]
+    assert sorted(plan.audit_keywords(["req_python", "req_kotlin", "experience"])) == ["AWS", "Docker", "Go", "Python", "kotlin", "python"]
+
+def test_routing_table_is_reused_until_jd_or_config_changes():
+    registry = ScoringRegistry()
+    active = {"req_python": True, "req_docker": True, "experience": True, "education": False}
+    table = registry.routing_table(JD, active)
+    assert [(k, m.id, items) for k, m, items in table.routes] == [
+        ("req_python", "languages", ["python"]),
+        ("req_docker", "technologies", ["docker"]),
+        ("experience", "experience", None)
+    ]
+    assert registry.routing_table(JD, dict(active), table) is table
+
+    # toggling a metric or editing the JD gives a fresh table
+    assert registry.routing_table(JD, dict(active, education=True), table) is not table
+    edited = {"metrics": dict(JD["metrics"], Languages={"value": ["Rust"]})}
+    fresh = registry.routing_table(edited, active, table)
+    assert fresh is not table and fresh.routes[0][1].id == "technologies"
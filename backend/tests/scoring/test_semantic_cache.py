@@ -0,0 +1,58 @@
+import os
+import sys
+import pytest
+import torch
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.scoring.semantic_utils import SemanticMatcher, semantic_matcher
+
+class CountingModel:
+    """stand-in for the SentenceTransformer that records every encode call"""
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, convert_to_tensor=True):
+        self.calls.append(list(texts))
+        return torch.tensor([[float(len(t)), float(t.count("a")) + 1.0, float(t.count("s")) + 1.0] for t in texts])
+
+@pytest.fixture
+def matcher(monkeypatch):
+    model = CountingModel()
+    monkeypatch.setattr(SemanticMatcher, "_model", model)
+    semantic_matcher.clear_cache()
+    # keep any locally built skill index out of the call counts
+    monkeypatch.setattr(semantic_matcher, "_skill_index_loaded", True)
+    yield semantic_matcher, model
+    semantic_matcher.clear_cache()
+
+def test_matrix_encodes_unseen_strings_once(matcher):
+    m, model = matcher
+    sims = m.find_best_matches(["Java", "Scala"], ["javascript", "scala ", "Kotlin"])
+    assert tuple(sims.shape) == (2, 3)
+    # "scala" appears as a target and (normalised) as a candidate, so only 4 unique strings
+    assert len(model.calls) == 1
+    assert sorted(model.calls[0]) == ["java", "javascript", "kotlin", "scala"]
+
+    m.find_best_matches(["java"], ["kotlin"])
+    assert len(model.calls) == 1
+
+def test_cache_is_bounded_lru(matcher, monkeypatch):
+    m, model = matcher
+    monkeypatch.setattr(SemanticMatcher, "CACHE_SIZE", 2)
+    m.encode(["a"])
+    m.encode(["b"])
+    m.encode(["a"])  # refresh a so b is the oldest
+    m.encode(["c"])
+    assert list(m._cache.keys()) == ["a", "c"]
+    m.encode(["b"])
+    assert model.calls[-1] == ["b"]
+
+def test_batched_matches_agree_with_single(matcher):
+    m, _ = matcher
+    targets = ["Python", "rust", "", "Go"]
+    candidates = ["python", "Rustlang", "golang", "sass"]
+    batched = m.best_matches(targets, candidates, threshold=0.5)
+    single = [m.find_best_match(t, candidates, threshold=0.5) for t in targets]
+    assert batched == single
+    assert batched[0] == {"match": "python", "best_candidate": "python", "score": 1.0}
@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+import numpy as np
+import pytest
+import torch
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.scoring.semantic_utils import SemanticMatcher, semantic_matcher
+from core.scoring import skill_index as si
+
+class LetterModel:
+    """stand-in for the SentenceTransformer, embeds strings by letter counts"""
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, convert_to_tensor=False, convert_to_numpy=False, **kwargs):
+        self.calls.append(list(texts))
+        embs = [[float(t.count(c)) + 0.1 for c in "aeiouyst"] for t in texts]
+        return torch.tensor(embs) if convert_to_tensor else np.array(embs, dtype=np.float32)
+
+@pytest.fixture
+def paths(tmp_path):
+    skills = tmp_path / "skills_data.json"
+    skills.write_text(json.dumps({"languages": ["Python", "Rust", "python"], "frameworks": ["Django", "Next.js"]}))
+    return str(skills), str(tmp_path / "index.npy"), str(tmp_path / "index.meta.json")
+
+def test_build_and_load_roundtrip(paths):
+    skills, index_path, meta_path = paths
+    meta = si.build_skill_index(LetterModel(), "letters", skills, index_path, meta_path)
+    assert meta["vocabulary"] == ["django", "next.js", "python", "rust"]
+
+    index = si.load_skill_index("letters", skills, index_path, meta_path)
+    assert isinstance(index.matrix, np.memmap)
+    assert np.allclose(np.linalg.norm(index.matrix, axis=1), 1.0)
+    assert index.nearest(index.lookup("rust"), k=1)[0]["skill"] == "rust"
+
+    # another model or an edited json means the index is stale
+    assert si.load_skill_index("other-model", skills, index_path, meta_path) is None
+    with open(skills, "w") as f:
+        json.dump({"languages": ["Go"]}, f)
+    assert si.load_skill_index("letters", skills, index_path, meta_path) is None
+
+def test_matcher_reads_vocabulary_from_index(paths, monkeypatch):
+    skills, index_path, meta_path = paths
+    si.build_skill_index(LetterModel(), "letters", skills, index_path, meta_path)
+    index = si.load_skill_index("letters", skills, index_path, meta_path)
+
+    model = LetterModel()
+    monkeypatch.setattr(SemanticMatcher, "_model", model)
+    semantic_matcher.clear_cache()
+    monkeypatch.setattr(semantic_matcher, "_skill_index", index)
+    monkeypatch.setattr(semantic_matcher, "_skill_index_loaded", True)
+    try:
+        sims = semantic_matcher.find_best_matches(["Pythonic"], ["Python", "Rust", "Django"])
+        assert tuple(sims.shape) == (1, 3)
+        # only the out of vocabulary target needed the model
+        assert model.calls == [["pythonic"]]
+        assert semantic_matcher.nearest_skills("Rust", k=2)[0]["skill"] == "rust"
+    finally:
+        semantic_matcher.clear_cache()
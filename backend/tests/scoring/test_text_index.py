@@ -0,0 +1,27 @@
+import os
+import re
+import sys
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.scoring.text_index import CVTextIndex, get_cv_text_index
+
+CV = "Python developer. Wrote python_tools in Python, C++ and C#; some JavaScript, Java-ish Node.js and machine  learning / Machine Learning."
+
+def test_counts_match_word_boundary_regex():
+    index = CVTextIndex(CV)
+    for term in ["python", "Java", "javascript", "C++", "c#", "node.js", "machine learning", "learning", "python_tools", "go"]:
+        expected = len(re.findall(rf"\b{re.escape(term.lower())}\b", CV.lower()))
+        assert index.count(term) == expected, term
+    assert index.word_count == len(re.findall(r"\w+", CV.lower()))
+
+def test_index_is_attached_and_invalidated_with_the_text():
+    cand = {"raw_cv_text": CV}
+    index = get_cv_text_index(cand)
+    assert cand["cv_text_index"] is index
+    assert get_cv_text_index(cand) is index
+
+    # a masked copy without the CV text must not reuse the old counts
+    masked = dict(cand, raw_cv_text=None)
+    assert get_cv_text_index(masked).count("python") == 0
+    assert get_cv_text_index(cand) is index
@@ -0,0 +1,95 @@
+import io
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.datastructures import FileStorage
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.service import bulk_ingest
+from core.service.bulk_ingest import collect_uploads, dedupe_by_hash, parse_many
+
+
+def _upload(name, content):
+    return FileStorage(stream=io.BytesIO(content), filename=name)
+
+
+def test_zips_are_unpacked_and_duplicates_dropped():
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as archive:
+        archive.writestr("batch/alice.pdf", b"alice")
+        archive.writestr("batch/notes.txt", b"ignore me")
+        archive.writestr("__MACOSX/batch/._alice.pdf", b"junk")
+        archive.writestr("batch/copy of bob.docx", b"bob")
+
+    files = [_upload("cvs.zip", buf.getvalue()), _upload("bob.docx", b"bob"), _upload("photo.png", b"png")]
+    cvs, skipped = collect_uploads(files)
+
+    assert [name for name, _ in cvs] == ["alice.pdf", "copy_of_bob.docx", "bob.docx"]
+    assert set(skipped) == {"batch/notes.txt", "__MACOSX/batch/._alice.pdf", "photo.png"}
+
+    unique, duplicates = dedupe_by_hash(cvs)
+    assert len(unique) == 2
+    assert [name for name, _ in duplicates] == ["bob.docx"]
+
+
+def test_unpacked_bytes_are_capped_per_request(monkeypatch):
+    monkeypatch.setattr(bulk_ingest, "ZIP_MAX_TOTAL_BYTES", 25)
+    archives = []
+    for names in (["a.pdf", "b.pdf"], ["c.pdf", "d.pdf"]):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name in names:
+                archive.writestr(name, name[0].encode() * 10)
+        archives.append(_upload(f"{names[0]}.zip", buf.getvalue()))
+
+    cvs, skipped = collect_uploads(archives)
+
+    # the cap spans every zip in the request
+    assert [name for name, _ in cvs] == ["a.pdf", "b.pdf"]
+    assert skipped == ["c.pdf", "d.pdf"]
+
+
+def test_parse_many_yields_results_and_errors(tmp_path):
+    paths = {}
+    for key, content in [("a", b"12"), ("b", b"1234")]:
+        path = tmp_path / key
+        path.write_bytes(content)
+        paths[key] = str(path)
+    paths["missing"] = str(tmp_path / "missing")
+
+    def sizes(batch):
+        out = []
+        for path in batch:
+            try:
+                out.append(os.path.getsize(path))
+            except OSError as e:
+                out.append(e)
+        return out
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = dict(parse_many(paths, fn=sizes, pool=pool, batch_size=2))
+
+    assert results["a"] == 2 and results["b"] == 4
+    assert isinstance(results["missing"], FileNotFoundError)
+
+
+def test_closing_parse_many_cancels_queued_batches(tmp_path):
+    started = []
+
+    def slow(batch):
+        started.extend(batch)
+        time.sleep(0.05)
+        return [len(p) for p in batch]
+
+    paths = {str(i): str(tmp_path / str(i)) for i in range(6)}
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        parsed = parse_many(paths, fn=slow, pool=pool, batch_size=1)
+        next(parsed)
+        # what a client disconnect does to the route's generator
+        parsed.close()
+
+    assert len(started) <= 2
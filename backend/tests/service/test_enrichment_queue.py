@@ -0,0 +1,143 @@
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.service.enrichment_queue import EnrichmentQueue
+
+
+def _wait(queue, job_id, timeout=10):
+    end = time.time() + timeout
+    while time.time() < end:
+        status = queue.job_status(job_id)
+        if status["status"] == "completed":
+            return status
+        time.sleep(0.02)
+    raise AssertionError("job did not finish")
+
+
+def test_job_runs_within_source_limits(tmp_path):
+    queue = EnrichmentQueue(str(tmp_path / "jobs.sqlite3"), concurrency={"github": 3, "linkedin": 1})
+    running, peak = {"github": 0, "linkedin": 0}, {"github": 0, "linkedin": 0}
+    lock = threading.Lock()
+
+    def handler(task):
+        with lock:
+            running[task["source"]] += 1
+            peak[task["source"]] = max(peak[task["source"]], running[task["source"]])
+        time.sleep(0.01)
+        with lock:
+            running[task["source"]] -= 1
+        if task["candidate_id"] == "7" and task["source"] == "linkedin":
+            raise ValueError("profile is private")
+
+    tasks = [{"candidate_id": i, "source": s, "url": f"https://{s}.com/u{i}"}
+             for i in range(10) for s in ("github", "linkedin")]
+    job_id = queue.create_job(tasks, {"cache_data": True})
+    queue.start(handler)
+    status = _wait(queue, job_id)
+
+    assert status["total"] == 20
+    assert status["counts"]["done"] == 19
+    assert status["failures"] == [{"candidate_id": "7", "source": "linkedin", "url": "https://linkedin.com/u7",
+                                   "error": "profile is private"}]
+    assert peak == {"github": 3, "linkedin": 1}
+
+    # failed tasks can be queued again
+    assert queue.retry_failed(job_id) == 1
+    queue.start(lambda task: None)
+    assert _wait(queue, job_id)["counts"]["done"] == 20
+
+
+def test_interrupted_tasks_resume(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    first = EnrichmentQueue(path)
+    job_id = first.create_job([{"candidate_id": 1, "source": "github", "url": "https://github.com/a"}])
+    # simulate a process that claimed the task and then died
+    first._claim()
+    assert first.job_status(job_id)["counts"]["running"] == 1
+
+    # another worker starting up leaves a task that is still inside its lease alone
+    done = []
+    other = EnrichmentQueue(path)
+    other.start(lambda task: done.append(task["url"]))
+    time.sleep(0.1)
+    assert other.job_status(job_id)["counts"]["running"] == 1
+
+    # once the lease has run out it is picked up again, by exactly one of them
+    second = EnrichmentQueue(path, lease=0)
+    second.start(lambda task: done.append(task["url"]))
+    assert _wait(second, job_id)["counts"]["done"] == 1
+    assert done == ["https://github.com/a"]
+
+
+def test_claim_is_atomic_across_processes(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    first, second = EnrichmentQueue(path), EnrichmentQueue(path)
+    first.create_job([{"candidate_id": 1, "source": "github", "url": "https://github.com/a"}])
+
+    # another process claims the task between second's select and its update
+    original = second._connect
+
+    class Racing:
+        def __init__(self, conn):
+            self.conn = conn
+
+        def execute(self, sql, *args):
+            if sql.startswith("UPDATE tasks SET status = 'running'"):
+                first._claim()
+            return self.conn.execute(sql, *args)
+
+    @contextmanager
+    def racing_connect():
+        with original() as conn:
+            yield Racing(conn)
+
+    second._connect = racing_connect
+    assert second._claim() == []
+    status = first.job_status(first.list_jobs()[0]["job_id"])
+    assert status["counts"]["running"] == 1
+
+
+def test_batched_source_gets_tasks_in_batches(tmp_path):
+    queue = EnrichmentQueue(str(tmp_path / "jobs.sqlite3"), concurrency={"linkedin": 1})
+    batches = []
+
+    def batch(tasks):
+        batches.append(len(tasks))
+        return [ValueError("gone") if t["candidate_id"] == "3" else None for t in tasks]
+
+    tasks = [{"candidate_id": i, "source": "linkedin", "url": f"https://linkedin.com/in/u{i}"} for i in range(10)]
+    job_id = queue.create_job(tasks)
+    queue.start(lambda task: None, {"linkedin": (4, batch)})
+    status = _wait(queue, job_id)
+
+    assert batches == [4, 4, 2]
+    assert status["counts"]["done"] == 9
+    assert status["failures"][0]["error"] == "gone"
+
+
+def test_jobs_survive_a_full_cache_purge(tmp_path, monkeypatch):
+    from api import create_app
+    import api.system.routes as system_routes
+    from core.service import enrichment_queue as eq
+    from core.utils.cache import CACHE_DIR
+
+    # the default job db lives outside the folder purge-cache empties
+    assert not os.path.abspath(eq.JOBS_PATH).startswith(os.path.abspath(CACHE_DIR) + os.sep)
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("cached")
+    open(os.path.join("cached", "entry.json"), "w").close()
+    queue = EnrichmentQueue(str(tmp_path / "data" / "enrichment_jobs.sqlite3"))
+    job_id = queue.create_job([{"candidate_id": 1, "source": "github", "url": "https://github.com/a"}])
+
+    monkeypatch.setattr(system_routes, "purge_cache_data", lambda category=None: None)
+    response = create_app().test_client().post("/api/purge-cache")
+
+    assert response.status_code == 200
+    assert os.listdir("cached") == []
+    assert queue.job_status(job_id)["total"] == 1
@@ -0,0 +1,32 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# generous, a cold import of spaCy or torch alone blows well past this
+IMPORT_BUDGET_SECONDS = 5.0
+HEAVY_MODULES = ("torch", "sentence_transformers", "spacy")
+
+SCRIPT = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+print(json.dumps({{"seconds": time.perf_counter() - start,
+                  "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+@pytest.mark.parametrize("module", ["core.parsers.cv", "core.scoring.registry", "api"])
+def test_import_is_cheap(module):
+    out = subprocess.run([sys.executable, "-c", SCRIPT.format(module=module, heavy=HEAVY_MODULES)],
+                         cwd=BACKEND_DIR, capture_output=True, text=True, timeout=120)
+    assert out.returncode == 0, out.stderr
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+
+    # the models load on first use (or via the warm-up hook), never at import
+    assert result["heavy"] == []
+    assert result["seconds"] < IMPORT_BUDGET_SECONDS
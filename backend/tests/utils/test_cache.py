@@ -0,0 +1,111 @@
+import os
+import sys
+import time
+
+# add backend to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from core.utils.cache import FileCacheStore, SQLiteCacheStore, TieredCacheStore
+
+
+def test_entries_are_sharded_compact_and_counted(tmp_path):
+    store = FileCacheStore(str(tmp_path))
+    store.set("cv", "abc123", {"name": "Ada", "skills": ["python"]})
+
+    path = store.path("cv", "abc123")
+    assert os.path.dirname(os.path.dirname(path)) == str(tmp_path / "cv")
+    assert os.listdir(os.path.dirname(path)) == [os.path.basename(path)]
+    assert "\n" not in open(path).read()
+
+    assert store.get("cv", "abc123") == {"name": "Ada", "skills": ["python"]}
+    assert store.get("cv", "other") is None
+    assert store.stats()["cv"] == {"writes": 1, "hits": 1, "misses": 1}
+
+
+def test_ttl_per_category(tmp_path):
+    store = FileCacheStore(str(tmp_path), ttls={"github": 0, "cv": None})
+    store.set("github", "https://github.com/octo", {"username": "octo"})
+    store.set("cv", "abc", {"name": "Ada"})
+    time.sleep(0.01)
+
+    assert store.get("github", "https://github.com/octo") is None
+    assert not os.path.exists(store.path("github", "https://github.com/octo"))
+    assert store.get("cv", "abc") == {"name": "Ada"}
+
+
+def test_lru_eviction_past_the_size_cap(tmp_path):
+    store = FileCacheStore(str(tmp_path), max_bytes=1100)
+    for i in range(5):
+        store.set("cv", f"cv{i}", {"text": "x" * 150})
+        os.utime(store.path("cv", f"cv{i}"), (i, i))
+    # reading cv0 makes it the most recently used
+    assert store.get("cv", "cv0")
+
+    for i in range(5, 8):
+        store.set("cv", f"cv{i}", {"text": "x" * 150})
+
+    kept = [i for i in range(8) if os.path.exists(store.path("cv", f"cv{i}"))]
+    assert 0 in kept and 1 not in kept
+    assert store.stats()["cv"]["evictions"] >= 1
+    assert sum(os.path.getsize(store.path("cv", f"cv{i}")) for i in kept) <= 1100
+
+
+def test_sqlite_store_matches_file_store(tmp_path):
+    store = SQLiteCacheStore(str(tmp_path / "cache.sqlite3"), ttls={"github": 0}, max_bytes=1100)
+    store.set("cv", "abc123", {"name": "Ada", "skills": ["python"]})
+    store.set("github", "https://github.com/octo", {"username": "octo"})
+    time.sleep(0.01)
+
+    assert store.get("cv", "abc123") == {"name": "Ada", "skills": ["python"]}
+    assert store.get("cv", "missing") is None
+    assert store.get("github", "https://github.com/octo") is None
+
+    for i in range(10):
+        store.set("job_desc", f"jd{i}", {"text": "x" * 150})
+    assert store.get("job_desc", "jd0") is None
+    assert store.get("job_desc", "jd9") is not None
+    assert store.stats()["job_desc"]["evictions"] >= 1
+
+    # purging one category leaves the others alone
+    store.purge("job_desc")
+    assert store.get("job_desc", "jd9") is None
+    assert store.get("cv", "abc123") is not None
+
+
+def test_memory_tier_serves_repeat_lookups(tmp_path):
+    backend = SQLiteCacheStore(str(tmp_path / "cache.sqlite3"))
+    store = TieredCacheStore(backend, max_entries=2)
+    store.set("cv", "a", {"name": "Ada"})
+
+    first = store.get("cv", "a")
+    first["cached"] = True
+    # copies come out of the memory tier, so the mutation above doesn't stick
+    assert store.get("cv", "a") == {"name": "Ada"}
+    assert store.stats()["cv"].get("hits", 0) == 0
+    assert store.stats()["cv"]["memory_hits"] == 2
+
+    # bounded by entries: "a" falls out and comes back from the backend
+    store.set("cv", "b", {"name": "Bob"})
+    store.set("cv", "c", {"name": "Cy"})
+    assert store.get("cv", "a") == {"name": "Ada"}
+    assert store.stats()["cv"]["hits"] == 1
+
+    store.purge()
+    assert store.get("cv", "a") is None
+    assert store.get("cv", "c") is None
+
+
+def test_purge_in_another_process_drops_the_memory_tier(tmp_path):
+    # two tiers over separate backend objects on the same storage, one per "process"
+    for make in (lambda: SQLiteCacheStore(str(tmp_path / "cache.sqlite3")),
+                 lambda: FileCacheStore(str(tmp_path / "files"))):
+        serving, purging = TieredCacheStore(make()), TieredCacheStore(make())
+        serving.set("cv", "a", {"name": "Ada"})
+        assert serving.get("cv", "a") == {"name": "Ada"}
+
+        purging.purge()
+        assert serving.get("cv", "a") is None
+
+        # and it keeps serving from memory once it has caught up
+        serving.set("cv", "a", {"name": "Ada"})
+        assert serving.get("cv", "a") == {"name": "Ada"}
+        assert serving.stats()["cv"]["memory_hits"] == 2
@@ -83,8 +83,55 @@ def benchmark_runtime():
     
     print(f"\nResults saved to {output_path}")
 
+def benchmark_worker_scaling(count: int = 200, worker_counts=(1, 2, 4, 8)):
+    """how MERIT scales when the batch is sharded across a process pool"""
+    jd = load_job_description(current_dir)
+    candidates = load_candidates(current_dir, limit=count)
+    merit_full = MeritEngine(jd, cv_only=False)
+    merit_exp = MeritEngine(jd, cv_only=False, explainable=True)
+
+    max_workers = os.cpu_count() or 1
+    worker_counts = sorted({w for w in worker_counts if w <= max_workers} | {1})
+
+    results = []
+    for workers in worker_counts:
+        print(f"\nBenchmarking {count} candidates with {workers} worker(s)...")
+        # warm the pool first so process start up and model loading isn't timed
+        merit_full.score_candidates(candidates[:workers * 2], workers=workers)
+
+        start = time.time()
+        merit_full.score_candidates(candidates, workers=workers)
+        full_time = time.time() - start
+
+        start = time.time()
+        merit_exp.score_candidates(candidates, workers=workers)
+        exp_time = time.time() - start
+
+        results.append({
+            "Workers": workers,
+            "Candidates": count,
+            "MERIT Full (s)": round(full_time, 4),
+            "MERIT Explainable (s)": round(exp_time, 4)
+        })
+
+    base_full = results[0]["MERIT Full (s)"]
+    base_exp = results[0]["MERIT Explainable (s)"]
+    for r in results:
+        r["Full Speedup"] = round(base_full / r["MERIT Full (s)"], 2) if r["MERIT Full (s)"] > 0 else 0.0
+        r["Explainable Speedup"] = round(base_exp / r["MERIT Explainable (s)"], 2) if r["MERIT Explainable (s)"] > 0 else 0.0
+
+    df = pd.DataFrame(results)
+    output_path = os.path.join(current_dir, "output/runtime_worker_scaling.csv")
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    df.to_csv(output_path, index=False)
+
+    print("\n--- Worker Scaling Complete ---")
+    print(df.to_string(index=False))
+    print(f"\nResults saved to {output_path}")
+
 if __name__ == "__main__":
     benchmark_runtime()
+    benchmark_worker_scaling()
     
     # Generate Visualisations (only when run as a standalone script)
     try:
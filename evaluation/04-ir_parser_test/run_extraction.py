@@ -1,6 +1,10 @@
 import os
 import sys
 import json
+import time
+import statistics
+
+import pandas as pd
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(os.path.abspath(os.path.join(current_dir, '../../backend')))
@@ -33,10 +37,13 @@ def run_extraction():
 
     print(f"Extracting data from {len(paths)} resumes...")
     
+    timings = []
     for path in paths:
         filename = os.path.basename(path)
         try:
+            start = time.perf_counter()
             parsed_data = parse_cv(path)
+            timings.append({"file": filename, "seconds": round(time.perf_counter() - start, 4)})
             report_data = parsed_data.copy()
             
             output_name = filename.replace(".pdf", ".json")
@@ -46,5 +53,13 @@ def run_extraction():
         except Exception as e:
             print(f"  [ERROR] {filename}: {e}")
 
+    # per CV parse latency, the first parse also pays for loading the models
+    if timings:
+        pd.DataFrame(timings).to_csv(os.path.join(output_dir, "parse_timings.csv"), index=False)
+        seconds = [t["seconds"] for t in timings]
+        warm = seconds[1:] or seconds
+        print(f"Parse time: first {seconds[0]:.3f}s, then mean {statistics.mean(warm):.3f}s, "
+              f"median {statistics.median(warm):.3f}s, max {max(warm):.3f}s over {len(warm)} CVs")
+
 if __name__ == "__main__":
     run_extraction()
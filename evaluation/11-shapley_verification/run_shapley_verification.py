@@ -7,6 +7,9 @@ Tests the four axioms of Shapley values from cooperative game theory:
 2. [Omitted] Symmetry: Homogeneous sources are required for symmetry... omitted due to data heterogeneity.
 3. Null Player:  if v(S u {i}) == v(S) for all S, then phi(i) == 0
 4. Determinism:  identical inputs produce identical outputs across repeated runs
+
+Also checks that the incremental attribution mode (per-metric reuse across
+coalitions) matches the exact mode (full re-run per coalition).
 """
 
 import os
@@ -253,6 +256,53 @@ def test_per_metric_efficiency(results):
     return rows, all_pass
 
 
+def test_mode_consistency(candidates, jd):
+    """
+    Attribution Mode Consistency:
+    The incremental mode reuses metric results across coalitions, so it must give
+    the same Shapley values as re-running the whole pipeline for every coalition.
+    """
+    print("\n" + "="*60)
+    print("EXTENDED: ATTRIBUTION MODE CONSISTENCY")
+    print("  phi_incremental(source) == phi_exact(source), per source and per metric")
+    print("="*60)
+
+    exact_engine = MeritEngine(jd, cv_only=False, explainable=True, shapley_mode="exact")
+    fast_engine = MeritEngine(jd, cv_only=False, explainable=True, shapley_mode="incremental")
+
+    rows = []
+    all_pass = True
+
+    for cand in candidates:
+        exact = exact_engine.score_candidate(cand).get("shapley", {})
+        fast = fast_engine.score_candidate(cand).get("shapley", {})
+
+        max_delta = abs(exact.get("full_match_score", 0.0) - fast.get("full_match_score", 0.0))
+        for source in ["CV", "GitHub", "LinkedIn"]:
+            max_delta = max(max_delta, abs(exact["overall"].get(source, 0.0) - fast["overall"].get(source, 0.0)))
+        for metric_key, source_phis in exact.get("metrics", {}).items():
+            fast_phis = fast.get("metrics", {}).get(metric_key, {})
+            for source, phi in source_phis.items():
+                max_delta = max(max_delta, abs(phi - fast_phis.get(source, 0.0)))
+
+        passed = max_delta < TOLERANCE
+        status = "PASS" if passed else "FAIL"
+        if not passed:
+            all_pass = False
+
+        name = cand["name"]
+        print(f"  {name:20s} | max |exact - incremental| = {max_delta:.2e} | {status}")
+
+        rows.append({
+            "candidate": name,
+            "max_delta": round(max_delta, 10),
+            "status": status
+        })
+
+    print(f"\n  OVERALL: {'ALL PASSED [OK]' if all_pass else 'FAILURES DETECTED [X]'}")
+    return rows, all_pass
+
+
 def run_shapley_verification():
     print("="*60)
     print("STUDY 11: SHAPLEY VALUE MATHEMATICAL VERIFICATION")
@@ -296,12 +346,17 @@ def run_shapley_verification():
     metric_rows, metric_pass = test_per_metric_efficiency(results)
     export_to_csv(metric_rows, os.path.join(output_dir, "extended_per_metric_efficiency.csv"))
 
+    # incremental vs exact attribution
+    mode_rows, mode_pass = test_mode_consistency(candidates, jd)
+    export_to_csv(mode_rows, os.path.join(output_dir, "extended_mode_consistency.csv"))
+
     # summary
     summary = {
         "Axiom 1 (Efficiency)": "PASS" if eff_pass else "FAIL",
         "Axiom 3 (Null Player)": "PASS" if null_pass else "FAIL (or N/A)",
         "Axiom 4 (Determinism)": "PASS" if det_pass else "FAIL",
-        "Extended (Per-Metric)": "PASS" if metric_pass else "FAIL"
+        "Extended (Per-Metric)": "PASS" if metric_pass else "FAIL",
+        "Extended (Mode Consistency)": "PASS" if mode_pass else "FAIL"
     }
 
     print("\n" + "="*60)
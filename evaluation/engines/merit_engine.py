@@ -11,13 +11,17 @@ class MeritEngine:
     can be toggled between cv-only (ablation) and multi-source (full) modes
     """
     
-    def __init__(self, job_description: Dict[str, Any], cv_only: bool = False, explainable: bool = False):
+    def __init__(self, job_description: Dict[str, Any], cv_only: bool = False, explainable: bool = False,
+                 shapley_mode: str = "incremental"):
         self.jd = job_description
         self.cv_only = cv_only
         self.explainable = explainable
+        self.shapley_mode = shapley_mode
         self.active_metrics = {}
         self.weights = {}
         self._prepare_metrics()
+        # key -> metric routing for this JD, refreshed automatically if the JD/config changes
+        self.routing = scoring_registry.routing_table(self.jd, self.active_metrics)
 
     def _prepare_metrics(self):
         jd_metrics = self.jd.get("metrics", {})
@@ -62,11 +66,13 @@ class MeritEngine:
                 cand["full_cv_text"] = f"{cand.get('summary', '')} {exp_text} {skills_text}"
 
         # run merit scoring
+        self.routing = scoring_registry.routing_table(self.jd, self.active_metrics, self.routing)
         scored_data = scoring_registry.run_all(
             cand,
             self.jd, 
             self.active_metrics, 
-            self.weights
+            self.weights,
+            routing=self.routing
         )
         
         res = {
@@ -80,6 +86,24 @@ class MeritEngine:
             if self.explainable:
                 from core.scoring.explainability import ShapleyExplainer
                 explainer = ShapleyExplainer(scoring_registry)
-                res["shapley"] = explainer.calculate_contributions(cand, self.jd, self.active_metrics, self.weights)
+                res["shapley"] = explainer.calculate_contributions(cand, self.jd, self.active_metrics, self.weights, mode=self.shapley_mode, routing=self.routing)
         
         return res
+
+    def score_candidates(self, candidates: List[Dict[str, Any]], include_audit: bool = False, workers: int = 1) -> List[Dict[str, Any]]:
+        """
+        scores a list of candidates, same output as calling score_candidate on each.
+        with workers > 1 the candidates are sharded across a process pool
+        """
+        if workers <= 1 or len(candidates) < 2:
+            return [self.score_candidate(c, include_audit) for c in candidates]
+
+        from core.scoring.parallel import chunk, parallel_map
+        engine_args = (self.jd, self.cv_only, self.explainable, self.shapley_mode)
+        return parallel_map(_score_chunk, chunk(candidates, workers), workers, engine_args, include_audit)
+
+
+def _score_chunk(candidates, engine_args, include_audit):
+    # runs inside a pool worker, the models are already loaded there
+    engine = MeritEngine(*engine_args)
+    return [engine.score_candidate(c, include_audit) for c in candidates]
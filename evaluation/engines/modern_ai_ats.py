@@ -40,8 +40,9 @@ class SemanticATSModel:
         semantic_hits = {}
         total_semantic_score = 0.0
         
-        for skill in self.target_skills:
-            match_result = semantic_matcher.find_best_match(skill, cv_chunks, threshold=0.55)
+        # one batched encode for every target skill against the CV chunks
+        match_results = semantic_matcher.best_matches(self.target_skills, cv_chunks, threshold=0.55)
+        for skill, match_result in zip(self.target_skills, match_results):
             if match_result["match"]:
                 score = match_result["score"]
                 semantic_hits[skill] = round(score, 2)